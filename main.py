@@ -23,6 +23,7 @@ list_of_python_modules = [
     "labelarr",
     "nohl",
     "poster_cleanarr",
+    "poster_pipeline",
     "poster_renamerr",
     "renameinatorr",
     "sync_gdrive",
@@ -561,7 +561,12 @@ def process_files(
         or switch["start_since_last_run"]
         or switch["end_since_last_run"]
     ):
-        assets_dict, _ = get_assets_files(source_dirs, logger)
+        assets_dict, _ = get_assets_files(
+            source_dirs,
+            logger,
+            use_catalog=getattr(merged, "asset_catalog", False),
+            scan_workers=getattr(merged, "scan_workers", 1),
+        )
         assets_dict = group_assets(assets_dict)
     elif renamed_assets and incremental_run:
         assets_dict = group_assets(renamed_assets)
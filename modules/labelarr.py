@@ -253,7 +253,12 @@ def main(config: SimpleNamespace) -> None:
                     )
                     continue
 
-                app = create_arr_client(app_config["url"], app_config["api"], logger)
+                app = create_arr_client(
+                    app_config["url"],
+                    app_config["api"],
+                    logger,
+                    http_cache=getattr(config, "http_cache", False),
+                )
                 if not app or not app.connect_status:
                     logger.error(
                         f"Failed to connect to {app_type} instance {app_instance}"
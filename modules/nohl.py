@@ -1,9 +1,15 @@
 import os
 import re
 import sys
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from util.arrpy import create_arr_client
+from util.arrpy import (
+    CommandTracker,
+    create_arr_client,
+    default_arr_concurrency,
+    fetch_parsed_media,
+)
 from util.constants import (
     episode_regex,
     season_regex,
@@ -179,6 +185,9 @@ def handle_searches(
 ) -> List[Dict[str, Any]]:
     """
     Perform search and deletion actions for Radarr or Sonarr items.
+
+    Files are deleted and refreshes started for every item up front; each
+    search is sent as soon as its refresh command finishes.
     Args:
         app: ARR API client.
         search_list: List of media dicts to search.
@@ -192,6 +201,34 @@ def handle_searches(
     print("Searching for files... this may take a while.")
     searched_for: List[Dict[str, Any]] = []
     searches = 0
+    tracker = CommandTracker(app)
+
+    def search_movie(item: Dict[str, Any], ready: bool) -> None:
+        nonlocal searches
+        if ready:
+            logger.debug(f"Performing a Search for {item['media_id']} ({item['year']})")
+            app.search_media(item["media_id"])
+            searched_for.append(item)
+            searches += 1
+
+    def search_season(
+        item: Dict[str, Any], season: Dict[str, Any], ready: bool
+    ) -> None:
+        if ready:
+            logger.debug(
+                f"Performing a season search for {item['media_id']} ({item['year']}) Season Number: {season['season_number']}"
+            )
+            app.search_season(item["media_id"], season["season_number"])
+
+    def search_episodes(
+        item: Dict[str, Any], episode_ids: List[int], ready: bool
+    ) -> None:
+        if ready:
+            logger.debug(
+                f"Performing an episode search for {item['title']} ({item['year']}), Episodes IDs: {episode_ids}"
+            )
+            app.search_episodes(episode_ids)
+
     for item in progress(
         search_list,
         desc="Searching...",
@@ -210,14 +247,7 @@ def handle_searches(
             else:
                 app.delete_movie_file(item["file_ids"])
                 results = app.refresh_items(item["media_id"])
-                ready = app.wait_for_command(results["id"])
-                if ready:
-                    logger.debug(
-                        f"Performing a Search for {item['media_id']} ({item['year']})"
-                    )
-                    app.search_media(item["media_id"])
-                    searched_for.append(item)
-                    searches += 1
+                tracker.track(results["id"], partial(search_movie, item))
             logger.debug(f"Searched: {item['title']} ({item['year']})")
         elif instance_type == "sonarr":
             # Sonarr: for each season, trigger episode or season pack search
@@ -244,14 +274,9 @@ def handle_searches(
                         else:
                             app.delete_episode_files(file_ids)
                             results = app.refresh_items(item["media_id"])
-                            ready = app.wait_for_command(results["id"])
-                            if ready:
-                                logger.debug(
-                                    f"Performing a season search for {item['media_id']} ({item['year']}) Season Number: {season['season_number']}"
-                                )
-                                app.search_season(
-                                    item["media_id"], season["season_number"]
-                                )
+                            tracker.track(
+                                results["id"], partial(search_season, item, season)
+                            )
                     else:
                         if config.dry_run:
                             episode_numbers = [
@@ -263,14 +288,13 @@ def handle_searches(
                         else:
                             app.delete_episode_files(file_ids)
                             results = app.refresh_items(item["media_id"])
-                            ready = app.wait_for_command(results["id"])
-                            if ready:
-                                logger.debug(
-                                    f"Performing an episode search for {item['title']} ({item['year']}), Episodes IDs: {episode_ids}"
-                                )
-                                app.search_episodes(episode_ids)
+                            tracker.track(
+                                results["id"],
+                                partial(search_episodes, item, episode_ids),
+                            )
                 searched_for.append(item)
             logger.debug(f"Searched: {item['title']} ({item['year']})")
+    tracker.wait()
     print(f"Searches performed: {searches}")
     return searched_for
 
@@ -701,6 +725,7 @@ def main(config) -> None:
         media_dict: Any = {}
         nohl_data: Any = {}
         # ARR resolution: for each instance, filter and trigger searches
+        arr_instances = []
         for instance_type, instance_data in config.instances_config.items():
             for instance in config.instances:
                 if isinstance(instance, dict):
@@ -708,62 +733,81 @@ def main(config) -> None:
                 else:
                     instance_name = instance
                 if instance_name in instance_data:
-                    data_list = {"search_media": [], "filtered_media": []}
-                    instance_settings = instance_data.get(instance, None)
-                    app = create_arr_client(
-                        instance_settings["url"], instance_settings["api"], logger
+                    instance_settings = instance_data[instance_name]
+                    nohl_data = (
+                        nohl_list["movies"]
+                        if instance_type == "radarr"
+                        else (
+                            nohl_list["series"]
+                            if instance_type == "sonarr"
+                            else None
+                        )
                     )
-                    if app and app.connect_status:
-                        server_name = app.get_instance_name()
-                        table = [[f"{server_name}"]]
-                        logger.info(create_table(table))
-                        if (instance_type == "radarr" and not nohl_list["movies"]) or (
-                            instance_type == "sonarr" and not nohl_list["series"]
-                        ):
-                            logger.info(
-                                f"No non-hardlinked files found for server: {server_name}"
-                            )
-                        nohl_data = (
-                            nohl_list["movies"]
-                            if instance_type == "radarr"
-                            else (
-                                nohl_list["series"]
-                                if instance_type == "sonarr"
-                                else None
-                            )
+                    arr_instances.append(
+                        (instance, instance_type, instance_settings, nohl_data)
+                    )
+        # Pull all media concurrently from the instances that have files to resolve
+        fetched = iter(
+            fetch_parsed_media(
+                [
+                    (settings["url"], settings["api"])
+                    for _, _, settings, nohl_data in arr_instances
+                    if nohl_data
+                ],
+                logger,
+                include_episode=True,
+                max_concurrency=getattr(
+                    config, "arr_concurrency", default_arr_concurrency
+                ),
+                http_cache=getattr(config, "http_cache", False),
+            )
+        )
+        for instance, instance_type, instance_settings, nohl_data in arr_instances:
+            data_list = {"search_media": [], "filtered_media": []}
+            if nohl_data:
+                app, media_dict = next(fetched)
+            else:
+                app = create_arr_client(
+                    instance_settings["url"],
+                    instance_settings["api"],
+                    logger,
+                    http_cache=getattr(config, "http_cache", False),
+                )
+            if app and app.connect_status:
+                server_name = app.get_instance_name()
+                table = [[f"{server_name}"]]
+                logger.info(create_table(table))
+                if not nohl_data:
+                    logger.info(
+                        f"No non-hardlinked files found for server: {server_name}"
+                    )
+                else:
+                    if media_dict:
+                        data_list = filter_media(
+                            app,
+                            media_dict,
+                            nohl_data,
+                            instance_type,
+                            config,
+                            logger,
                         )
-                        if nohl_data:
-                            # Pull all media from ARR and filter for resolution
-                            if instance_type == "sonarr":
-                                media_dict = app.get_parsed_media(include_episode=True)
-                            else:
-                                media_dict = app.get_parsed_media()
-                            if media_dict:
-                                data_list = filter_media(
-                                    app,
-                                    media_dict,
-                                    nohl_data,
-                                    instance_type,
-                                    config,
-                                    logger,
-                                )
-                            else:
-                                logger.info(f"No media found for server: {server_name}")
-                            search_list = data_list.get("search_media", [])
-                            if search_list:
-                                # Conduct searches, with dry run support
-                                search_list = handle_searches(
-                                    app, search_list, instance_type, logger, config
-                                )
-                                data_list["search_media"] = search_list
-                        output_dict[instance] = {
-                            "server_name": server_name,
-                            "instance_type": instance_type,
-                            "data": data_list,
-                        }
-                        logger.debug(
-                            f"{server_name} processing complete. Search media: {len(data_list['search_media'])}, Filtered: {len(data_list['filtered_media'])}"
+                    else:
+                        logger.info(f"No media found for server: {server_name}")
+                    search_list = data_list.get("search_media", [])
+                    if search_list:
+                        # Conduct searches, with dry run support
+                        search_list = handle_searches(
+                            app, search_list, instance_type, logger, config
                         )
+                        data_list["search_media"] = search_list
+                output_dict[instance] = {
+                    "server_name": server_name,
+                    "instance_type": instance_type,
+                    "data": data_list,
+                }
+                logger.debug(
+                    f"{server_name} processing complete. Search media: {len(data_list['search_media'])}, Filtered: {len(data_list['filtered_media'])}"
+                )
         # Dump debug JSON payloads if needed
         if config.log_level == "debug":
             print_json(data_list, logger, config.module_name, "data_list")
@@ -4,25 +4,18 @@ import sys
 from types import SimpleNamespace
 from typing import Dict, List, Optional, Union
 
-from util.arrpy import create_arr_client
 from util.assets import get_assets_files
-from util.index import create_new_empty_index
+from util.index import AssetIndex
 from util.logger import Logger
 from util.match import match_assets_to_media
+from util.match_stats import MatchStats
 from util.utility import (
     create_table,
-    get_plex_data,
+    get_media_dict,
     print_json,
     print_settings,
 )
 
-try:
-    from plexapi.server import PlexServer
-except ImportError as e:
-    print(f"ImportError: {e}")
-    print("Please install the required modules with 'pip install -r requirements.txt'")
-    exit(1)
-
 
 def remove_assets(
     unmatched_dict: List[Dict[str, Union[str, int, List[str], None]]],
@@ -148,6 +141,61 @@ def print_output(
     logger.info(f"\nTotal number of assets removed: {count}")
 
 
+def clean_unmatched_assets(
+    config: SimpleNamespace,
+    logger: Logger,
+    assets_dict: List[Dict],
+    prefix_index: AssetIndex,
+    media_dict: Dict[str, List[Dict]],
+    unmatched_dict: Optional[Dict[str, List[Dict]]] = None,
+) -> List[Dict[str, Union[str, int, List[str]]]]:
+    """
+    Strictly match assets to media and remove the assets nothing matched.
+
+    Args:
+        config: poster_cleanarr configuration.
+        logger: Logger instance.
+        assets_dict: Merged assets from the source directories.
+        prefix_index: Search index over assets_dict.
+        media_dict: Media keyed by type.
+        unmatched_dict: Unmatched assets from a match pass already run over
+            assets_dict, which are then removed instead of matching again.
+
+    Returns:
+        List of dictionaries summarizing removed assets and messages.
+    """
+    remove_data = []
+    if unmatched_dict is None:
+        logger.info("Matching assets to media, please wait...")
+        match_stats = MatchStats()
+        unmatched_dict = match_assets_to_media(
+            media_dict,
+            prefix_index,
+            logger,
+            return_unmatched_assets=True,
+            config=config,
+            strict_folder_match=True,
+            stats=match_stats,
+        )
+        match_stats.write(config.module_name, logger)
+
+    if any(unmatched_dict.values()):
+        remove_data = remove_assets(unmatched_dict, config, logger)
+        if remove_data:
+            print_output(remove_data, logger)
+    else:
+        logger.info("✅ No assets needed to be removed. Everything is in sync!")
+
+    # Only dump debug JSON if we're in debug mode
+    if config.log_level.lower() == "debug":
+        logger.debug("Dumping debug data for assets/media/unmatched/remove_data.")
+        print_json(assets_dict, logger, config.module_name, "assets_dict")
+        print_json(media_dict, logger, config.module_name, "media_dict")
+        print_json(unmatched_dict, logger, config.module_name, "unmatched_dict")
+        print_json(remove_data, logger, config.module_name, "remove_data")
+    return remove_data
+
+
 def main(config: SimpleNamespace) -> None:
     """
     Main function to load media, match assets, and remove unmatched assets.
@@ -156,7 +204,6 @@ def main(config: SimpleNamespace) -> None:
         config: Configuration namespace.
     """
     logger = Logger(config.log_level, config.module_name)
-    remove_data = []
 
     try:
         if config.log_level.lower() == "debug":
@@ -166,117 +213,30 @@ def main(config: SimpleNamespace) -> None:
             table = [["Dry Run"], ["NO CHANGES WILL BE MADE"]]
             logger.info(create_table(table))
         # Load assets from source directories
-        prefix_index = create_new_empty_index()
-        assets_dict, prefix_index = get_assets_files(config.source_dirs, logger)
+        assets_dict, prefix_index = get_assets_files(
+            config.source_dirs,
+            logger,
+            use_catalog=getattr(config, "asset_catalog", False),
+            scan_workers=getattr(config, "scan_workers", 1),
+        )
         if not assets_dict:
             logger.error(
                 f"No assets found in the source directories: {config.source_dirs}"
             )
             return
 
-        media_dict = {"movies": [], "series": [], "collections": []}
-
         if not config.instances:
             logger.error("No instances found. Exiting script.")
             return
-
-        for instance in config.instances:
-            if isinstance(instance, dict):
-                instance_name, instance_settings = next(iter(instance.items()))
-            else:
-                instance_name = instance
-                instance_settings = {}
-
-            found = False
-            instance_type = None
-            instance_data = None
-
-            for itype, idata in config.instances_config.items():
-                if instance_name in idata:
-                    found = True
-                    instance_type = itype
-                    instance_data = idata
-                    break
-
-            if not found or instance_type is None or instance_data is None:
-                logger.warning(
-                    f"Instance '{instance_name}' not found in config.instances_config. Skipping."
-                )
-                continue
-
-            if instance_type == "plex":
-                url = instance_data[instance_name]["url"]
-                api = instance_data[instance_name]["api"]
-                try:
-                    app = PlexServer(url, api)
-                except Exception as e:
-                    logger.error(f"Error connecting to Plex: {e}")
-                    app = None
-
-                if app:
-                    library_names = instance_settings.get("library_names", [])
-                    if library_names:
-                        logger.info("Fetching Plex collections...")
-                        results = get_plex_data(
-                            app,
-                            library_names,
-                            logger,
-                            include_smart=True,
-                            collections_only=True,
-                        )
-                        media_dict["collections"].extend(results)
-                    else:
-                        logger.warning(
-                            f"No library names specified for Plex instance '{instance_name}'. Skipping."
-                        )
-            else:
-                url = instance_data[instance_name]["url"]
-                api = instance_data[instance_name]["api"]
-                app = create_arr_client(url, api, logger)
-
-                if app and app.connect_status:
-                    logger.info(f"Fetching {app.instance_name} data...")
-                    results = app.get_parsed_media(include_episode=False)
-                    if results:
-                        if instance_type == "radarr":
-                            media_dict["movies"].extend(results)
-                        elif instance_type == "sonarr":
-                            media_dict["series"].extend(results)
-                    else:
-                        logger.warning(
-                            f"No {instance_type.capitalize()} data found for instance '{instance_name}'."
-                        )
+        media_dict = get_media_dict(config, logger)
 
         if not any(media_dict.values()):
             logger.error(
                 "No media found. Check 'instances' setting in your config. Exiting."
             )
             return
-        if media_dict and prefix_index:
-            logger.info("Matching assets to media, please wait...")
-            unmatched_dict = match_assets_to_media(
-                media_dict,
-                prefix_index,
-                logger,
-                return_unmatched_assets=True,
-                config=config,
-                strict_folder_match=True,
-            )
 
-        if any(unmatched_dict.values()):
-            remove_data = remove_assets(unmatched_dict, config, logger)
-            if remove_data:
-                print_output(remove_data, logger)
-        else:
-            logger.info("✅ No assets needed to be removed. Everything is in sync!")
-
-        # Only dump debug JSON if we're in debug mode
-        if config.log_level.lower() == "debug":
-            logger.debug("Dumping debug data for assets/media/unmatched/remove_data.")
-            print_json(assets_dict, logger, config.module_name, "assets_dict")
-            print_json(media_dict, logger, config.module_name, "media_dict")
-            print_json(unmatched_dict, logger, config.module_name, "unmatched_dict")
-            print_json(remove_data, logger, config.module_name, "remove_data")
+        clean_unmatched_assets(config, logger, assets_dict, prefix_index, media_dict)
 
     except KeyboardInterrupt:
         print("Keyboard Interrupt detected. Exiting...")
@@ -0,0 +1,171 @@
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from modules.poster_cleanarr import clean_unmatched_assets
+from modules.poster_renamerr import prepare_renamerr, rename_matched_assets
+from modules.unmatched_assets import report_unmatched_media
+from util.assets import get_assets_files
+from util.config import Config
+from util.logger import Logger
+from util.match import collect_unmatched_assets, match_assets_to_media
+from util.match_stats import MatchStats
+from util.utility import create_table, get_media_dict, print_settings
+
+# Stages in the order they run. The unmatched report only reads the matches, so
+# it goes first; renamerr copies posters out of the source directories before
+# cleanarr may delete them.
+stages: List[str] = ["unmatched_assets", "poster_renamerr", "poster_cleanarr"]
+
+# Stage whose matching options (fuzzy_match_threshold, hash_join_matching,
+# match_workers, match_cache) drive the shared match pass, first enabled wins
+match_config_stages: List[str] = ["poster_renamerr", "poster_cleanarr"]
+
+
+def load_stage_config(stage: str, config: SimpleNamespace) -> SimpleNamespace:
+    """Load a stage module's configuration with the pipeline's shared inputs.
+
+    Stage-specific settings (destination_dir, dry_run, ignore lists, matching
+    options, ...) come from the stage's own section; source_dirs and instances
+    come from the pipeline so every stage sees the same scan and media.
+
+    Args:
+        stage (str): Stage module name.
+        config (SimpleNamespace): poster_pipeline configuration.
+
+    Returns:
+        SimpleNamespace: Configuration of the stage module.
+    """
+    stage_config = Config(stage).module_config
+    stage_config.source_dirs = config.source_dirs
+    stage_config.instances = config.instances
+    stage_config.instances_config = config.instances_config
+    return stage_config
+
+
+def drop_missing_files(unused_assets: List[Dict[str, Any]]) -> None:
+    """Forget files that an earlier stage moved away from the source directories.
+
+    Args:
+        unused_assets (List[Dict[str, Any]]): Assets, updated in place.
+    """
+    for asset in unused_assets:
+        asset["files"] = [f for f in asset["files"] if os.path.lexists(f)]
+
+
+def main(config: SimpleNamespace) -> None:
+    """
+    Run unmatched_assets, poster_renamerr and poster_cleanarr on one shared
+    fetch of the media, one scan of the source directories and one match pass.
+
+    The match pass is match_assets_to_media over the merged assets. renamerr
+    renames its matches, the unmatched report lists the media it left
+    unmatched or missing season posters, and cleanarr removes the assets it
+    left unmatched. Unlike standalone poster_cleanarr, that pass does not use
+    strict folder matching, so cleanarr never removes a poster renamerr used.
+
+    Args:
+        config: poster_pipeline configuration.
+    """
+    logger = Logger(config.log_level, config.module_name)
+    try:
+        if config.log_level.lower() == "debug":
+            print_settings(logger, config)
+
+        enabled = [stage for stage in stages if getattr(config, f"run_{stage}", False)]
+        if not enabled:
+            logger.error("No stages enabled. Exiting module...")
+            return
+        if not config.instances:
+            logger.error("No instances found. Exiting module...")
+            return
+        stage_configs = {stage: load_stage_config(stage, config) for stage in enabled}
+        if "poster_renamerr" in stage_configs:
+            prepare_renamerr(stage_configs["poster_renamerr"], logger)
+
+        logger.info("Gathering all the posters, please wait...")
+        assets_dict, prefix_index = get_assets_files(
+            config.source_dirs,
+            logger,
+            use_catalog=getattr(config, "asset_catalog", False),
+            scan_workers=getattr(config, "scan_workers", 1),
+        )
+        if not assets_dict:
+            logger.error("No assets found in the source directories. Exiting module...")
+            return
+
+        media_dict = get_media_dict(config, logger)
+        if not any(media_dict.values()):
+            logger.error(
+                "No media found, Check instances setting in your config. Exiting."
+            )
+            return
+
+        match_config = next(
+            (stage_configs[s] for s in match_config_stages if s in stage_configs),
+            config,
+        )
+        logger.info("Matching assets to media, please wait...")
+        media_matches: Dict[int, Tuple[Dict[str, Any], str]] = {}
+        match_stats = MatchStats()
+        matched_assets = match_assets_to_media(
+            media_dict,
+            prefix_index,
+            logger,
+            config=match_config,
+            stats=match_stats,
+            media_matches=media_matches,
+        )
+        match_stats.write(config.module_name, logger)
+
+        for stage in enabled:
+            logger.info(create_table([[f"Stage: {stage}"]]))
+            stage_config = stage_configs[stage]
+            if stage == "unmatched_assets":
+                report_unmatched_media(
+                    stage_config,
+                    logger,
+                    assets_dict,
+                    prefix_index,
+                    media_dict,
+                    media_matches=media_matches,
+                )
+            elif stage == "poster_renamerr":
+                rename_matched_assets(
+                    stage_config,
+                    logger,
+                    assets_dict,
+                    prefix_index,
+                    media_dict,
+                    matched_assets=matched_assets,
+                )
+            elif stage == "poster_cleanarr":
+                if stage_config.dry_run:
+                    table = [["Dry Run"], ["NO CHANGES WILL BE MADE"]]
+                    logger.info(create_table(table))
+                unmatched_dict = collect_unmatched_assets(
+                    prefix_index,
+                    {prefix_index.asset_id(asset) for asset, _ in media_matches.values()},
+                    logger,
+                    stage_config,
+                )
+                if "poster_renamerr" in stage_configs:
+                    for unused_assets in unmatched_dict.values():
+                        drop_missing_files(unused_assets)
+                clean_unmatched_assets(
+                    stage_config,
+                    logger,
+                    assets_dict,
+                    prefix_index,
+                    media_dict,
+                    unmatched_dict=unmatched_dict,
+                )
+    except KeyboardInterrupt:
+        print("Keyboard Interrupt detected. Exiting...")
+        sys.exit()
+    except Exception:
+        logger.error("\n\nAn error occurred:\n", exc_info=True)
+        logger.error("\n\n")
+    finally:
+        logger.log_outro()
@@ -5,25 +5,24 @@ import re
 import shutil
 import sys
 from types import SimpleNamespace
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from util.arrpy import create_arr_client
 from util.assets import get_assets_files
 from util.constants import year_regex
-from util.index import create_new_empty_index
+from util.index import AssetIndex
 from util.logger import Logger
 from util.match import match_assets_to_media
+from util.match_stats import MatchStats
 from util.notification import send_notification
 from util.utility import (
     create_table,
-    get_plex_data,
+    get_media_dict,
     print_json,
     print_settings,
 )
 
 try:
     from pathvalidate import is_valid_filename, sanitize_filename
-    from plexapi.server import PlexServer
 
     from util.utility import progress
 except ImportError as e:
@@ -257,6 +256,144 @@ def handle_output(
             logger.info(f"No {asset_type} to rename")
 
 
+def prepare_renamerr(config: SimpleNamespace, logger: Any) -> None:
+    """
+    Create the destination directory and, if enabled, sync posters from Google Drive.
+    Runs before the source directories are scanned.
+    Args:
+        config: poster_renamerr configuration.
+        logger: Logger instance.
+    Returns:
+        None
+    """
+    if not os.path.exists(config.destination_dir):
+        logger.info(f"Creating destination directory: {config.destination_dir}")
+        os.makedirs(config.destination_dir)
+    else:
+        logger.debug(f"Destination directory already exists: {config.destination_dir}")
+    if config.dry_run:
+        table = [["Dry Run"], ["NO CHANGES WILL BE MADE"]]
+        logger.info(create_table(table))
+    if config.sync_posters:
+        logger.info("Running sync_gdrive")
+        from modules.sync_gdrive import main as gdrive_main
+        from util.config import Config
+
+        gdrive_config = Config("sync_gdrive").module_config
+        gdrive_main(gdrive_config)
+        logger.info("Finished running sync_gdrive")
+    else:
+        logger.debug("Sync posters is disabled. Skipping...")
+
+
+def rename_matched_assets(
+    config: SimpleNamespace,
+    logger: Any,
+    assets_dict: List[Dict[str, Any]],
+    prefix_index: AssetIndex,
+    media_dict: Dict[str, List[Dict[str, Any]]],
+    matched_assets: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Match assets to media, rename the matches into the destination directory,
+    send the notification and run border replacerr if enabled.
+    Args:
+        config: poster_renamerr configuration.
+        logger: Logger instance.
+        assets_dict: Merged assets from the source directories.
+        prefix_index: Search index over assets_dict.
+        media_dict: Media keyed by type.
+        matched_assets: Result of a match_assets_to_media pass already run
+            over assets_dict, which is then used instead of matching again.
+    Returns:
+        Matched assets keyed by type.
+    """
+    renamed_assets = None
+    renamed_files: List[str] = []
+    if matched_assets is None:
+        logger.info("Matching assets to media, please wait...")
+        match_stats = MatchStats()
+        matched_assets = match_assets_to_media(
+            media_dict,
+            prefix_index,
+            logger,
+            return_unmatched_assets=False,
+            config=config,
+            stats=match_stats,
+        )
+        match_stats.write(config.module_name, logger)
+    if matched_assets and any(matched_assets.values()):
+        # Optionally deep copy to strip heavy keys for debug (example for 'seasons')
+        matched_assets_copy = copy.deepcopy(matched_assets)
+        for media_type, media_list in matched_assets_copy.items():
+            for media in media_list:
+                if "seasons" in media:
+                    del media["seasons"]
+        if config.log_level == "debug":
+            print_json(assets_dict, logger, config.module_name, "assets_dict")
+            print_json(media_dict, logger, config.module_name, "media_dict")
+            print_json(prefix_index.to_dict(), logger, config.module_name, "prefix_index")
+            print_json(
+                matched_assets_copy, logger, config.module_name, "matched_assets"
+            )
+        output, renamed_files = rename_files(matched_assets, config, logger)
+        if any(output.values()):
+            handle_output(output, config, logger)
+            send_notification(
+                logger=logger,
+                module_name=config.module_name,
+                config=config,
+                output=output,
+            )
+        else:
+            logger.info("No new posters to rename.")
+    else:
+        logger.info("No assets matched to media.")
+    if config.run_border_replacerr:
+        tmp_dir = os.path.join(config.destination_dir, "tmp")
+        from modules.border_replacerr import process_files
+        from util.config import Config
+        from util.scanner import process_selected_files
+
+        replacerr_config = Config("border_replacerr").module_config
+        # Simplified conditional logic for incremental/full run
+        if config.incremental_border_replacerr:
+            if renamed_files:
+                renamed_assets = process_selected_files(
+                    renamed_files, logger, asset_folders=config.asset_folders
+                )
+                logger.info(
+                    "\nDoing an incremental run on only assets that were provided\nStarting Border Replacerr...\n"
+                )
+                process_files(
+                    tmp_dir,
+                    config=replacerr_config,
+                    logger=None,
+                    renamerr_config=config,
+                    renamed_assets=renamed_assets,
+                    incremental_run=True,
+                )
+                logger.info("Finished running border_replacerr")
+            else:
+                logger.info(
+                    "\nNo new assets to incrementally perform with border_replacerr.\nSkipping Border Replacerr.."
+                )
+        else:
+            logger.info(
+                "\nDoing a full run with Border Replacerr\nStarting Border Replacerr...\n"
+            )
+            process_files(
+                tmp_dir,
+                config=replacerr_config,
+                logger=None,
+                renamerr_config=config,
+                renamed_assets=renamed_assets,
+                incremental_run=False,
+            )
+            logger.info("Finished running border_replacerr.py")
+    return matched_assets
+
+
 def main(config: SimpleNamespace) -> None:
     """
     Entrypoint for poster_renamerr.py.
@@ -271,180 +408,27 @@ def main(config: SimpleNamespace) -> None:
     try:
         if config.log_level.lower() == "debug":
             print_settings(logger, config)
-        if not os.path.exists(config.destination_dir):
-            logger.info(f"Creating destination directory: {config.destination_dir}")
-            os.makedirs(config.destination_dir)
-        else:
-            logger.debug(
-                f"Destination directory already exists: {config.destination_dir}"
-            )
-        if config.dry_run:
-            table = [["Dry Run"], ["NO CHANGES WILL BE MADE"]]
-            logger.info(create_table(table))
-        if config.sync_posters:
-            logger.info("Running sync_gdrive")
-            from modules.sync_gdrive import main as gdrive_main
-            from util.config import Config
-
-            gdrive_config = Config("sync_gdrive").module_config
-            gdrive_main(gdrive_config)
-            logger.info("Finished running sync_gdrive")
-        else:
-            logger.debug("Sync posters is disabled. Skipping...")
-        prefix_index = create_new_empty_index()
+        prepare_renamerr(config, logger)
         logger.info("Gathering all the posters, please wait...")
-        assets_dict, prefix_index = get_assets_files(config.source_dirs, logger)
+        assets_dict, prefix_index = get_assets_files(
+            config.source_dirs,
+            logger,
+            use_catalog=getattr(config, "asset_catalog", False),
+            scan_workers=getattr(config, "scan_workers", 1),
+        )
         if not assets_dict:
             logger.error("No assets found in the source directories. Exiting module...")
             return
-        media_dict: Dict[str, List[Dict[str, Any]]] = {
-            "movies": [],
-            "series": [],
-            "collections": [],
-        }
-
-        if config.instances:
-            for instance in config.instances:
-                if isinstance(instance, dict):
-                    instance_name, instance_settings = next(iter(instance.items()))
-                else:
-                    instance_name = instance
-                    instance_settings = {}
-                found = False
-                for instance_type, instance_data in config.instances_config.items():
-                    if instance_name in instance_data:
-                        found = True
-                        break
-                if not found:
-                    logger.warning(
-                        f"Instance '{instance_name}' not found in config.instances_config. Skipping."
-                    )
-                    continue
-                if instance_type == "plex":
-                    url = instance_data[instance_name]["url"]
-                    api = instance_data[instance_name]["api"]
-                    try:
-                        app = PlexServer(url, api)
-                    except Exception as e:
-                        logger.error(f"Error connecting to Plex: {e}")
-                        app = None
-                    if app:
-                        library_names = instance_settings.get("library_names", [])
-                        if library_names:
-                            logger.info("Fetching Plex collections...")
-                            results = get_plex_data(
-                                app,
-                                library_names,
-                                logger,
-                                include_smart=True,
-                                collections_only=True,
-                            )
-                            media_dict["collections"].extend(results)
-                        else:
-                            logger.warning(
-                                "No library names specified for Plex instance. Skipping Plex."
-                            )
-                else:
-                    url = instance_data[instance_name]["url"]
-                    api = instance_data[instance_name]["api"]
-                    app = create_arr_client(url, api, logger)
-                    if app and app.connect_status:
-                        logger.info(f"Fetching {app.instance_name} data...")
-                        results = app.get_parsed_media(include_episode=False)
-                        if results:
-                            if instance_type == "radarr":
-                                media_dict["movies"].extend(results)
-                            elif instance_type == "sonarr":
-                                media_dict["series"].extend(results)
-                        else:
-                            logger.error(f"No {instance_type.capitalize()} data found.")
-        else:
+        if not config.instances:
             logger.error("No instances found. Exiting module...")
             return
+        media_dict = get_media_dict(config, logger)
         if not any(media_dict.values()):
             logger.error(
                 "No media found, Check instances setting in your config. Exiting."
             )
             return
-        renamed_assets = None
-        if media_dict and prefix_index:
-            logger.info("Matching assets to media, please wait...")
-            matched_assets = match_assets_to_media(
-                media_dict,
-                prefix_index,
-                logger,
-                return_unmatched_assets=False,
-                config=config,
-            )
-        if matched_assets and any(matched_assets.values()):
-            # Optionally deep copy to strip heavy keys for debug (example for 'seasons')
-            matched_assets_copy = copy.deepcopy(matched_assets)
-            for media_type, media_list in matched_assets_copy.items():
-                for media in media_list:
-                    if "seasons" in media:
-                        del media["seasons"]
-            if config.log_level == "debug":
-                print_json(assets_dict, logger, config.module_name, "assets_dict")
-                print_json(media_dict, logger, config.module_name, "media_dict")
-                print_json(prefix_index, logger, config.module_name, "prefix_index")
-                print_json(
-                    matched_assets_copy, logger, config.module_name, "matched_assets"
-                )
-            output, renamed_files = rename_files(matched_assets, config, logger)
-            if any(output.values()):
-                handle_output(output, config, logger)
-                send_notification(
-                    logger=logger,
-                    module_name=config.module_name,
-                    config=config,
-                    output=output,
-                )
-            else:
-                logger.info("No new posters to rename.")
-        else:
-            logger.info("No assets matched to media.")
-        if config.run_border_replacerr:
-            tmp_dir = os.path.join(config.destination_dir, "tmp")
-            from modules.border_replacerr import process_files
-            from util.config import Config
-            from util.scanner import process_selected_files
-
-            replacerr_config = Config("border_replacerr").module_config
-            # Simplified conditional logic for incremental/full run
-            if config.incremental_border_replacerr:
-                if renamed_files:
-                    renamed_assets = process_selected_files(
-                        renamed_files, logger, asset_folders=config.asset_folders
-                    )
-                    logger.info(
-                        "\nDoing an incremental run on only assets that were provided\nStarting Border Replacerr...\n"
-                    )
-                    process_files(
-                        tmp_dir,
-                        config=replacerr_config,
-                        logger=None,
-                        renamerr_config=config,
-                        renamed_assets=renamed_assets,
-                        incremental_run=True,
-                    )
-                    logger.info("Finished running border_replacerr")
-                else:
-                    logger.info(
-                        "\nNo new assets to incrementally perform with border_replacerr.\nSkipping Border Replacerr.."
-                    )
-            else:
-                logger.info(
-                    "\nDoing a full run with Border Replacerr\nStarting Border Replacerr...\n"
-                )
-                process_files(
-                    tmp_dir,
-                    config=replacerr_config,
-                    logger=None,
-                    renamerr_config=config,
-                    renamed_assets=renamed_assets,
-                    incremental_run=False,
-                )
-                logger.info("Finished running border_replacerr.py")
+        rename_matched_assets(config, logger, assets_dict, prefix_index, media_dict)
     except KeyboardInterrupt:
         print("Keyboard Interrupt detected. Exiting...")
         sys.exit()
@@ -335,6 +335,7 @@ def main(config: SimpleNamespace) -> None:
                         instance_data[instance]["url"],
                         instance_data[instance]["api"],
                         logger,
+                        http_cache=getattr(config, "http_cache", False),
                     )
                     if app and app.connect_status:
                         data = process_instance(app, instance_type, config, logger)
@@ -1,22 +1,15 @@
 import copy
 import sys
 from types import SimpleNamespace
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from util.arrpy import create_arr_client
 from util.assets import get_assets_files
-from util.index import create_new_empty_index
+from util.index import AssetIndex
 from util.logger import Logger
 from util.match import match_media_to_assets
+from util.match_stats import MatchStats
 from util.notification import send_notification
-from util.utility import create_table, get_plex_data, print_json, print_settings
-
-try:
-    from plexapi.server import PlexServer
-except ImportError as e:
-    print(f"ImportError: {e}")
-    print("Please install the required modules with 'pip install -r requirements.txt'")
-    exit(1)
+from util.utility import create_table, get_media_dict, print_json, print_settings
 
 
 def print_output(
@@ -186,6 +179,76 @@ def print_output(
     return output
 
 
+def report_unmatched_media(
+    config: SimpleNamespace,
+    logger: Logger,
+    assets_dict: List[Dict],
+    prefix_index: AssetIndex,
+    media_dict: Dict[str, List[Dict]],
+    media_matches: Optional[Dict[int, Tuple[Dict, str]]] = None,
+) -> Dict[str, List[Dict]]:
+    """Match media to unmerged assets, then log and notify the unmatched report.
+
+    Args:
+        config (SimpleNamespace): unmatched_assets configuration.
+        logger (Logger): Logger instance.
+        assets_dict (List[Dict]): Unmerged assets from the source directories.
+        prefix_index (AssetIndex): Search index over assets_dict.
+        media_dict (Dict[str, List[Dict]]): Media keyed by type.
+        media_matches (Optional[Dict[int, Tuple[Dict, str]]]): Matches of a
+            match_assets_to_media pass already run over assets_dict, which are
+            reported instead of matching again.
+
+    Returns:
+        Dict[str, List[Dict]]: Unmatched media keyed by type.
+    """
+    # Remove heavy keys for logging clarity
+    media_dict_copy = copy.deepcopy(media_dict)
+    for media_type, media_list in media_dict_copy.items():
+        for media in media_list:
+            if "seasons" in media:
+                del media["seasons"]
+
+    if media_matches is None:
+        logger.info("Matching assets to media, please wait...")
+        match_stats = MatchStats()
+        unmatched_dict = match_media_to_assets(
+            media_dict,
+            prefix_index,
+            config.ignore_root_folders,
+            logger,
+            stats=match_stats,
+        )
+        match_stats.write(config.module_name, logger)
+    else:
+        unmatched_dict = match_media_to_assets(
+            media_dict,
+            prefix_index,
+            config.ignore_root_folders,
+            logger,
+            media_matches=media_matches,
+        )
+    output = print_output(unmatched_dict, media_dict, logger)
+    if any(unmatched_dict.values()):
+        if config.notifications and output:
+            logger.info("Sending notification...")
+            send_notification(
+                logger=logger,
+                module_name=config.module_name,
+                config=config,
+                output=output,
+            )
+    else:
+        logger.info("All assets matched.")
+
+    if config.log_level == "debug":
+        print_json(assets_dict, logger, config.module_name, "assets_dict")
+        print_json(media_dict_copy, logger, config.module_name, "media_dict")
+        print_json(prefix_index.to_dict(), logger, config.module_name, "prefix_index")
+        print_json(unmatched_dict, logger, config.module_name, "unmatched_dict")
+    return unmatched_dict
+
+
 def main(config: SimpleNamespace) -> None:
     """Load media and assets, identify unmatched assets, and log summary statistics."""
     logger = Logger(config.log_level, config.module_name)
@@ -194,82 +257,21 @@ def main(config: SimpleNamespace) -> None:
         if config.log_level.lower() == "debug":
             print_settings(logger, config)
 
-        prefix_index = create_new_empty_index()
         print("Gathering all the posters, please wait...")
         assets_dict, prefix_index = get_assets_files(
-            config.source_dirs, logger, merge=False
+            config.source_dirs,
+            logger,
+            merge=False,
+            use_catalog=getattr(config, "asset_catalog", False),
+            scan_workers=getattr(config, "scan_workers", 1),
         )
         if not assets_dict:
             return
 
-        media_dict = {"movies": [], "series": [], "collections": []}
-
-        if config.instances:
-            for instance in config.instances:
-                # Determine instance name and settings
-                if isinstance(instance, dict):
-                    instance_name, instance_settings = next(iter(instance.items()))
-                else:
-                    instance_name = instance
-                    instance_settings = {}
-
-                # Determine instance type and data
-                found = False
-                for instance_type, instance_data in config.instances_config.items():
-                    if instance_name in instance_data:
-                        found = True
-                        break
-                if not found:
-                    logger.warning(
-                        f"Instance '{instance_name}' not found in config.instances_config. Skipping."
-                    )
-                    continue
-
-                if instance_type == "plex":
-                    url = instance_data[instance_name]["url"]
-                    api = instance_data[instance_name]["api"]
-                    try:
-                        app = PlexServer(url, api)
-                    except Exception as e:
-                        logger.error(f"Error connecting to Plex: {e}")
-                        app = None
-                    if app:
-                        library_names = instance_settings.get("library_names", [])
-                        if library_names:
-                            logger.info("Fetching Plex collections...")
-                            results = get_plex_data(
-                                app,
-                                library_names,
-                                logger,
-                                include_smart=True,
-                                collections_only=True,
-                            )
-                            media_dict["collections"].extend(results)
-                        else:
-                            logger.warning(
-                                "No library names specified for Plex instance. Skipping Plex."
-                            )
-                else:
-                    # For other instance types (e.g., radarr, sonarr), create client and get media
-                    url = instance_data[instance_name]["url"]
-                    api = instance_data[instance_name]["api"]
-                    app = create_arr_client(url, api, logger)
-                    if not app:
-                        logger.error(f"Failed to connect to {instance_name}, skipping.")
-                        continue
-                    if app.connect_status:
-                        logger.info(f"Fetching {app.instance_name} data...")
-                        results = app.get_parsed_media(include_episode=False)
-                        if results:
-                            if instance_type == "radarr":
-                                media_dict["movies"].extend(results)
-                            elif instance_type == "sonarr":
-                                media_dict["series"].extend(results)
-                        else:
-                            logger.error(f"No {instance_type.capitalize()} data found.")
-        else:
+        if not config.instances:
             logger.error("No instances found. Exiting script...")
             return
+        media_dict = get_media_dict(config, logger)
 
         if not any(media_dict.values()):
             logger.error(
@@ -277,37 +279,7 @@ def main(config: SimpleNamespace) -> None:
             )
             return
 
-        # Remove heavy keys for logging clarity
-        media_dict_copy = copy.deepcopy(media_dict)
-        for media_type, media_list in media_dict_copy.items():
-            for media in media_list:
-                if "seasons" in media:
-                    del media["seasons"]
-
-        # Match assets and print output
-        if media_dict and prefix_index:
-            logger.info("Matching assets to media, please wait...")
-            unmatched_dict = match_media_to_assets(
-                media_dict, prefix_index, config.ignore_root_folders, logger
-            )
-        output = print_output(unmatched_dict, media_dict, logger)
-        if any(unmatched_dict.values()):
-            if config.notifications and output:
-                logger.info("Sending notification...")
-                send_notification(
-                    logger=logger,
-                    module_name=config.module_name,
-                    config=config,
-                    output=output,
-                )
-        else:
-            logger.info("All assets matched.")
-
-        if config.log_level == "debug":
-            print_json(assets_dict, logger, config.module_name, "assets_dict")
-            print_json(media_dict_copy, logger, config.module_name, "media_dict")
-            print_json(prefix_index, logger, config.module_name, "prefix_index")
-            print_json(unmatched_dict, logger, config.module_name, "unmatched_dict")
+        report_unmatched_media(config, logger, assets_dict, prefix_index, media_dict)
 
     except KeyboardInterrupt:
         print("Exiting due to keyboard interrupt.")
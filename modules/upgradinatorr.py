@@ -2,7 +2,7 @@ import sys
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
-from util.arrpy import BaseARRClient, create_arr_client
+from util.arrpy import BaseARRClient, CommandTracker, create_arr_client
 from util.logger import Logger
 from util.notification import send_notification
 from util.utility import create_table, print_settings
@@ -99,33 +99,35 @@ def filter_media(
 def process_search_response(
     search_response: Optional[Dict[str, Any]],
     media_id: int,
-    app: BaseARRClient,
+    tracker: CommandTracker,
     logger: Logger,
 ) -> None:
     """
-    Wait for search command to complete and log the result.
+    Track a search command and log its result once it finishes.
 
     Args:
         search_response: API response from initiating a search.
         media_id: ID of the media being searched.
-        app: ARR client instance.
+        tracker: Command tracker of the instance.
         logger: Logger instance.
     Returns:
         None
     """
     if search_response:
-        logger.debug(
-            f"    [CMD] Waiting for command to complete for search response ID: {search_response['id']}"
-        )
-        ready = app.wait_for_command(search_response["id"])
-        if ready:
-            logger.debug(
-                f"    [CMD] Command completed successfully for search response ID: {search_response['id']}"
-            )
-        else:
-            logger.debug(
-                f"    [CMD] Command did not complete successfully for search response ID: {search_response['id']}"
-            )
+        command_id = search_response["id"]
+        logger.debug(f"    [CMD] Tracking command for search response ID: {command_id}")
+
+        def log_result(ready: bool) -> None:
+            if ready:
+                logger.debug(
+                    f"    [CMD] Command completed successfully for search response ID: {command_id}"
+                )
+            else:
+                logger.debug(
+                    f"    [CMD] Command did not complete successfully for search response ID: {command_id}"
+                )
+
+        tracker.track(command_id, log_result)
     else:
         logger.warning(f"No search response for media ID: {media_id}")
 
@@ -269,6 +271,7 @@ def process_instance(
     if not config.dry_run:
         search_count: int = 0
         media_ids: List[int] = [item["media_id"] for item in filtered_media_dict]
+        tracker = CommandTracker(app)
         # Search logic: trigger searches and tag after search
         for item in filtered_media_dict:
             logger.info(
@@ -291,7 +294,9 @@ def process_instance(
                     f"Searching media without seasons for media ID: {item['media_id']}"
                 )
                 search_response = app.search_media(item["media_id"])
-                process_search_response(search_response, item["media_id"], app, logger)
+                process_search_response(
+                    search_response, item["media_id"], tracker, logger
+                )
                 search_count += 1
                 if search_count >= count:
                     logger.debug(
@@ -310,7 +315,7 @@ def process_instance(
                             item["media_id"], season["season_number"]
                         )
                         process_search_response(
-                            search_response, item["media_id"], app, logger
+                            search_response, item["media_id"], tracker, logger
                         )
                         searched = True
 
@@ -331,6 +336,8 @@ def process_instance(
             )
             logger.info(f"Finished processing: {item['title']} ({item['year']})")
 
+        logger.info(f"Waiting for searches to finish on {app.instance_name}...")
+        tracker.wait()
         logger.info(
             f"Completed upgrade operations for {app.instance_name}. Now retrieving download queue..."
         )
@@ -432,7 +439,12 @@ def main(config: SimpleNamespace) -> None:
                 if instance_name in instance_data:
                     url = instance_data[instance_name]["url"]
                     api = instance_data[instance_name]["api"]
-                    app = create_arr_client(url, api, logger)
+                    app = create_arr_client(
+                        url,
+                        api,
+                        logger,
+                        http_cache=getattr(config, "http_cache", False),
+                    )
                     if app and app.connect_status:
                         output = process_instance(
                             instance_type, instance_entry, app, logger, config
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import util.arrpy as arrpy
+from util.arrpy import AsyncARRClient, CommandTracker, SonarrClient, fetch_parsed_media
+
+logger = logging.getLogger("test_arrpy")
+
+
+class FakeClient:
+    connect_status = True
+
+    def __init__(self, url):
+        self.instance_name = url
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_parsed_media(self, include_episode=False):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return [{"title": self.instance_name, "episodes": include_episode}]
+
+
+def test_async_client_runs_calls_on_threads():
+    client = FakeClient("radarr")
+    app = AsyncARRClient(client)
+
+    async def run():
+        return await asyncio.gather(*(app.get_parsed_media() for _ in range(2)))
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    assert client.peak == 2
+    assert app.instance_name == "radarr"
+
+
+def test_fetch_parsed_media_keeps_instance_order(monkeypatch):
+    cached = []
+
+    def create_arr_client(url, api, log, http_cache=False, max_concurrency=None):
+        cached.append((http_cache, max_concurrency))
+        return None if url == "down" else FakeClient(url)
+
+    monkeypatch.setattr(arrpy, "create_arr_client", create_arr_client)
+    fetched = fetch_parsed_media(
+        [("a", "key"), ("down", "key"), ("b", "key")],
+        logger,
+        include_episode=True,
+        max_concurrency=2,
+        http_cache=True,
+    )
+    assert cached == [(True, 2)] * 3
+    assert [media for _, media in fetched] == [
+        [{"title": "a", "episodes": True}],
+        None,
+        [{"title": "b", "episodes": True}],
+    ]
+    assert fetched[1][0] is None
+
+
+def test_episodes_fetched_once_per_series_and_grouped_by_season():
+    client = SonarrClient.__new__(SonarrClient)
+    client.max_concurrency = 2
+    requested = []
+    active = [0, 0]
+    lock = threading.Lock()
+
+    def get_season_data(media_id):
+        with lock:
+            requested.append(media_id)
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if media_id == 3:
+            return None
+        return [
+            {"seasonNumber": 1, "episodeNumber": 1},
+            {"seasonNumber": 2, "episodeNumber": 1},
+            {"seasonNumber": 1, "episodeNumber": 2},
+        ]
+
+    client.get_season_data = get_season_data
+    episodes = client.get_episodes_by_season([1, 2, 3])
+    assert sorted(requested) == [1, 2, 3]
+    assert [e["episodeNumber"] for e in episodes[1][1]] == [1, 2]
+    assert list(episodes[2]) == [1, 2]
+    assert episodes[3] == {}
+    assert active[1] == 2
+
+
+class FakeCommandClient:
+    logger = logger
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.polls = 0
+        self.single = []
+
+    def get_commands(self):
+        self.polls += 1
+        return [
+            {"id": command_id, "status": states[min(self.polls, len(states)) - 1]}
+            for command_id, states in self.timeline.items()
+            if command_id != 3
+        ]
+
+    def get_command(self, command_id):
+        self.single.append(command_id)
+        return {"id": command_id, "status": "completed"}
+
+
+def test_command_tracker_polls_all_commands_together(monkeypatch):
+    monkeypatch.setattr(arrpy.time, "sleep", lambda s: None)
+    client = FakeCommandClient(
+        {
+            1: ["started", "completed"],
+            2: ["queued", "started", "started", "failed"],
+            3: [],
+        }
+    )
+    tracker = CommandTracker(client)
+    finished = []
+    first = tracker.track(1, lambda ok: finished.append((1, ok)))
+    second = tracker.track(2, lambda ok: finished.append((2, ok)))
+    third = tracker.track(3)
+    tracker.wait()
+    assert (first.result(), second.result(), third.result()) == (True, False, True)
+    assert finished == [(1, True), (2, False)]
+    assert client.polls == 4
+    assert client.single == [3]
+
+
+def test_command_tracker_keeps_polling_through_failed_requests(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(arrpy.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(arrpy.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    client = FakeCommandClient({})
+    answers = [None, None, {"id": 1, "status": "completed"}]
+    client.get_command = lambda command_id: answers.pop(0) if answers else None
+    client.logger = logger
+
+    tracker = CommandTracker(client, timeout=60)
+    done = tracker.track(1)
+    tracker.wait()
+    assert done.result() is True and answers == []
+
+    started = clock[0]
+    stuck = tracker.track(2)
+    tracker.wait()
+    assert stuck.result() is False
+    assert clock[0] - started >= 60
+
+
+class StreamResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return (self.data[i : i + 5] for i in range(0, len(self.data), 5))
+
+
+def test_parsed_media_streams_and_keeps_only_used_fields():
+    movie = {
+        "id": 7,
+        "title": "Heat",
+        "year": 1995,
+        "tmdbId": 949,
+        "monitored": True,
+        "status": "released",
+        "rootFolderPath": "/movies",
+        "qualityProfileId": 1,
+        "path": "/movies/Heat (1995)",
+        "hasFile": True,
+        "tags": [],
+        "alternateTitles": [{"title": "Heat", "sourceType": "tmdb", "movieMetadataId": 1}],
+        "movieFile": {"id": 3, "mediaInfo": {"videoCodec": "x265"}},
+        "images": [{"coverType": "poster", "url": "/poster.jpg"}],
+    }
+    client = arrpy.RadarrClient.__new__(arrpy.RadarrClient)
+    client.url = "http://radarr"
+    client.max_retries = 1
+    client.timeout = 1
+    client.http_cache = None
+    client.logger = logger
+    client.session = type(
+        "Session", (), {"request": lambda self, *a, **k: StreamResponse(json.dumps([movie]).encode())}
+    )()
+    slim = client.get_slim_media("http://radarr/api/v3/movie", arrpy.radarr_media_fields)
+    assert "images" not in slim[0]
+    assert slim[0]["movieFile"] == {"id": 3}
+    assert slim[0]["alternateTitles"] == [{"title": "Heat"}]
+    parsed = client.get_parsed_media()
+    assert (parsed[0]["title"], parsed[0]["tmdb_id"], parsed[0]["file_id"]) == ("Heat", 949, 3)
+
+
+def test_clients_share_session_and_status_check(monkeypatch):
+    calls = []
+
+    def get_system_status(self):
+        calls.append(self.url)
+        return {"appName": "Sonarr", "version": "4", "instanceName": "Sonarr"}
+
+    monkeypatch.setattr(arrpy.BaseARRClient, "get_system_status", get_system_status)
+    monkeypatch.setattr(arrpy, "_client_registry", {})
+    first = arrpy.create_arr_client("http://sonarr:8989/", "key", logger, max_concurrency=2)
+    assert first.max_concurrency == 2
+    second = arrpy.create_arr_client("http://sonarr:8989", "key", logger)
+    assert isinstance(first, SonarrClient) and first.connect_status
+    assert first.session is second.session
+    assert first.session.get_adapter("http://sonarr:8989")._pool_maxsize == arrpy.session_pool_size
+    assert len(calls) == 1
+
+    monkeypatch.setattr(arrpy, "client_status_ttl", 0)
+    arrpy.create_arr_client("http://sonarr:8989", "key", logger)
+    assert len(calls) == 2
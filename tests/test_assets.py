@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 import sys
 
@@ -9,7 +10,7 @@ import os
 
 import pytest
 
-from util.assets import get_assets_files
+from util.assets import get_asset_sets, get_assets_files
 
 
 def _write_empty(path):
@@ -79,3 +80,35 @@ def test_assets(tmp_path):
     # ── Check the results of the merger ─────────────────────
     assert assets_dict is not None
     assert prefix_index is not None
+
+
+def test_asset_sets_share_one_scan(tmp_path):
+    source = tmp_path / "assets"
+    source.mkdir()
+    for fname in ["Willow (2022) {tvdb-393192}.jpg", "Willow (2022) {tvdb-393192} - Season 1.jpg"]:
+        _write_empty(source / fname)
+
+    logger = logging.getLogger("test_assets")
+    sets = get_asset_sets(str(source), logger, [True, True, False])
+    merged, second, unmerged = [assets for assets, _ in sets]
+    assert merged == second
+    assert merged[0] is not second[0]
+    assert sets[1][1].assets[0] is second[0]
+    assert [a["title"] for a in unmerged] == ["Willow"]
+    assert get_assets_files(str(source), logger)[0] == merged
+
+
+def test_merge_looks_up_candidates_by_title_only(tmp_path):
+    dir_a = tmp_path / "DirA"
+    dir_b = tmp_path / "DirB"
+    dir_a.mkdir()
+    dir_b.mkdir()
+    _write_empty(dir_a / "Das Boot (1981) {tmdb-387}.jpg")
+    _write_empty(dir_b / "The Boat (1981) {tmdb-387}.jpg")
+
+    # Sharing an ID does not make assets with unrelated titles merge candidates
+    assets, _ = get_assets_files([str(dir_a), str(dir_b)], logging.getLogger("test_assets"))
+    assert sorted((a["title"], len(a["files"])) for a in assets) == [
+        ("Das Boot", 1),
+        ("The Boat", 1),
+    ]
@@ -0,0 +1,95 @@
+import logging
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from util.catalog import AssetCatalog
+from util.scanner import process_files
+
+logger = logging.getLogger("test_catalog")
+
+
+def test_catalog_reuses_unchanged_folders(tmp_path):
+    source = tmp_path / "assets"
+    for name in ["Alien (1979) {tmdb-348}", "Heat (1995) {tmdb-949}"]:
+        (source / name).mkdir(parents=True)
+        (source / name / "poster.jpg").write_bytes(b"")
+    db = str(tmp_path / "catalog.db")
+
+    catalog = AssetCatalog(db)
+    first = process_files(str(source), logger, catalog)
+    assert (catalog.hits, catalog.misses) == (0, 2)
+    catalog.close([str(source)])
+
+    (source / "Heat (1995) {tmdb-949}" / "Season01.jpg").write_bytes(b"")
+    catalog = AssetCatalog(db)
+    second = process_files(str(source), logger, catalog)
+    assert (catalog.hits, catalog.misses) == (1, 1)
+    catalog.close([str(source)])
+
+    assert [a["title"] for a in second] == [a["title"] for a in first]
+    heat = next(a for a in second if a["title"].startswith("Heat"))
+    assert len(heat["files"]) == 2
+
+
+def test_catalog_merge_result_invalidated_by_change(tmp_path):
+    source = tmp_path / "flat"
+    source.mkdir()
+    (source / "Alien (1979).jpg").write_bytes(b"")
+    db = str(tmp_path / "catalog.db")
+
+    catalog = AssetCatalog(db)
+    process_files(str(source), logger, catalog)
+    catalog.put_merged([str(source)], True, [{"title": "Alien"}])
+    catalog.close([str(source)])
+
+    catalog = AssetCatalog(db)
+    process_files(str(source), logger, catalog)
+    assert catalog.get_merged([str(source)], True) == [{"title": "Alien"}]
+    assert catalog.get_merged([str(source)], False) is None
+    catalog.close([str(source)])
+
+    os.utime(source, ns=(0, 0))
+    catalog = AssetCatalog(db)
+    process_files(str(source), logger, catalog)
+    assert catalog.get_merged([str(source)], True) is None
+    catalog.close([str(source)])
+
+
+def test_catalog_reuses_unchanged_groups_in_changed_flat_folder(tmp_path):
+    source = tmp_path / "flat"
+    source.mkdir()
+    (source / "Alien (1979).jpg").write_bytes(b"")
+    (source / "Heat (1995).jpg").write_bytes(b"")
+    db = str(tmp_path / "catalog.db")
+
+    catalog = AssetCatalog(db)
+    first = process_files(str(source), logger, catalog)
+    catalog.close([str(source)])
+
+    (source / "Heat (1995).jpg").write_bytes(b"new poster")
+    (source / "Ronin (1998).jpg").write_bytes(b"")
+    catalog = AssetCatalog(db)
+    second = process_files(str(source), logger, catalog)
+    assert (catalog.hits, catalog.misses, catalog.reused_groups) == (0, 1, 1)
+    catalog.close([str(source)])
+
+    assert [a["title"] for a in second] == ["Alien", "Heat", "Ronin"]
+    assert second[0] == first[0]
+
+
+def test_catalog_writes_do_not_block_other_connections(tmp_path):
+    source = tmp_path / "flat"
+    source.mkdir()
+    (source / "Alien (1979).jpg").write_bytes(b"")
+    db = str(tmp_path / "catalog.db")
+
+    catalog = AssetCatalog(db)
+    process_files(str(source), logger, catalog)
+    other = sqlite3.connect(db, timeout=0)
+    assert other.execute("SELECT COUNT(*) FROM folders").fetchone()[0] == 1
+    with other:
+        other.execute("DELETE FROM merged")
+    other.close()
+    catalog.close([str(source)])
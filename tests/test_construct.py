@@ -10,6 +10,9 @@ from util.construct import (
     create_movie,
     create_series,
     generate_title_variants,
+    get_season_mask,
+    mask_seasons,
+    season_files,
 )
 
 
@@ -21,4 +24,13 @@ def test_create_collection():
 def test_generate_title_variants_logic():
     v = generate_title_variants("The Matrix Collection")
     assert v["no_prefix"] == "Matrix Collection"
-    assert v["no_suffix"] == "The Matrix"
\ No newline at end of file
+    assert v["no_suffix"] == "The Matrix"
+
+def test_create_series_season_mask():
+    files = ["/a/Show (2000) - Season 2.jpg", "/a/Show (2000) - Specials.jpg", "/a/Show (2000).jpg"]
+    result = create_series("Show", 2000, None, None, "show", files)
+    assert result["season_numbers"] == [0, 2]
+    assert result["season_mask"] == 0b101
+    assert mask_seasons(result["season_mask"]) == [0, 2]
+    assert get_season_mask({"seasons": [{"season_number": 3}]}) == 0b1000
+    assert season_files(files) == {2: [files[0]], 0: [files[1]]}
@@ -0,0 +1,87 @@
+import json
+import logging
+import os
+import sys
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import util.http_cache as http_cache
+from util.arrpy import BaseARRClient
+from util.http_cache import HttpCache
+
+logger = logging.getLogger("test_http_cache")
+
+URL = "http://radarr:7878"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.text = json.dumps(body) if body is not None else ""
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def request(self, method, endpoint, headers=None, json=None, timeout=None, stream=False):
+        self.requests.append((method, endpoint, dict(headers or {})))
+        if method != "GET":
+            return FakeResponse(200, {})
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, self.body, {"ETag": '"v1"'})
+
+
+def make_client(tmp_path, body):
+    client = BaseARRClient.__new__(BaseARRClient)
+    client.logger = logger
+    client.max_retries = 1
+    client.timeout = 1
+    client.url = URL
+    client.session = FakeSession(body)
+    client.http_cache = HttpCache(str(tmp_path / "http_cache.db"), logger=logger)
+    return client
+
+
+def test_fresh_hit_skips_request_and_stale_entry_revalidates(tmp_path, monkeypatch):
+    client = make_client(tmp_path, [{"id": 1}])
+    endpoint = f"{URL}/api/v3/movie"
+    assert client.make_get_request(endpoint) == [{"id": 1}]
+    assert client.make_get_request(endpoint) == [{"id": 1}]
+    assert len(client.session.requests) == 1
+
+    monkeypatch.setitem(http_cache.endpoint_ttls, "/api/v3/movie", 0)
+    assert client.make_get_request(endpoint) == [{"id": 1}]
+    assert client.session.requests[-1][2]["If-None-Match"] == '"v1"'
+    assert client.http_cache.revalidated == 1
+
+
+def test_uncached_endpoints_and_writes_invalidate(tmp_path):
+    client = make_client(tmp_path, {"status": "completed"})
+    client.make_get_request(f"{URL}/api/v3/command/1")
+    client.make_get_request(f"{URL}/api/v3/command/1")
+    assert len(client.session.requests) == 2
+
+    client.make_get_request(f"{URL}/api/v3/tag")
+    client.make_post_request(f"{URL}/api/v3/tag", json={"label": "x"})
+    client.make_get_request(f"{URL}/api/v3/tag")
+    assert [r[0] for r in client.session.requests[2:]] == ["GET", "POST", "GET"]
+
+
+def test_eviction_keeps_total_size_under_limit(tmp_path):
+    body = json.dumps([{"id": i, "title": os.urandom(8).hex()} for i in range(10)])
+    size = len(zlib.compress(body.encode()))
+    cache = HttpCache(str(tmp_path / "http_cache.db"), max_bytes=size * 3 // 2)
+    cache.put(f"{URL}/api/v3/movie", URL, body)
+    cache.put(f"{URL}/api/v3/tag", URL, body)
+    assert cache.get(f"{URL}/api/v3/movie") is None
+    assert cache.get(f"{URL}/api/v3/tag")["body"] == body
@@ -29,13 +29,79 @@ def create_mock_asset(title, asset_type="collections"):
 def test_prefix_index_lookup(asset_title, media_title, should_match):
     index = create_new_empty_index()
     asset = create_mock_asset(asset_title)
-    build_search_index(index, asset["title"], asset, asset["type"], logger=None)
+    build_search_index(index, asset["title"], asset, logger=None)
 
-    results = search_matches(index, media_title, asset["type"], logger=None)
+    results = search_matches(index, media_title, logger=None)
     match_titles = [r["title"] for r in results]
-    print(f"Prefix_index: {json.dumps(index, indent=2)}")
+    print(f"Prefix_index: {json.dumps(index.to_dict(), indent=2)}")
     print(f"Results: {json.dumps(results, indent=2)}")
     if should_match:
         assert asset["title"] in match_titles, f"Expected '{asset['title']}' to match '{media_title}'"
     else:
-        assert asset["title"] not in match_titles, f"Did not expect '{asset['title']}' to match '{media_title}'"
\ No newline at end of file
+        assert asset["title"] not in match_titles, f"Did not expect '{asset['title']}' to match '{media_title}'"
+
+
+def test_search_matches_uses_all_tokens():
+    index = create_new_empty_index()
+    titles = ["Star Wars", "Star Trek", "Stargate", "Star Trek Into Darkness"]
+    for title in titles:
+        asset = create_mock_asset(title, asset_type="movies")
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    results = search_matches(index, "Star Trek", logger=None)
+    match_titles = [r["title"] for r in results]
+    assert match_titles[0] == "Star Trek"
+    assert "Star Trek Into Darkness" in match_titles
+    assert "Stargate" not in match_titles
+
+
+def test_search_matches_keeps_best_token_tier():
+    index = create_new_empty_index()
+    titles = ["Star Trek", "Star Trek Into Darkness", "Star Wars", "Trek Nation", "The Office"]
+    for title in titles:
+        asset = create_mock_asset(title, asset_type="movies")
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    def search(title):
+        return [r["title"] for r in search_matches(index, title, logger=None)]
+
+    assert search("Star Trek") == ["Star Trek", "Star Trek Into Darkness"]
+    assert search("Trek Star Beyond") == ["Star Trek", "Star Trek Into Darkness"]
+    assert search("Star Wars") == ["Star Wars"]
+    assert search("Office") == search("The Office") == ["The Office"]
+
+
+def test_search_matches_caps_candidates():
+    index = create_new_empty_index()
+    for i in range(50):
+        asset = create_mock_asset(f"Batman Chapter {i}", asset_type="movies")
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    results = search_matches(index, "Batman", logger=None, limit=10)
+    assert len(results) == 10
+
+
+def test_search_matches_by_id():
+    index = create_new_empty_index()
+    first = dict(create_mock_asset("Alien", asset_type="movies"), tmdb_id=348, imdb_id="tt0078748")
+    second = dict(create_mock_asset("Alien Director's Cut", asset_type="movies"), tmdb_id="348")
+    other = dict(create_mock_asset("Aliens", asset_type="movies"), tmdb_id=679)
+    for asset in (first, second, other):
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    assert [r["title"] for r in search_matches(index, "", logger=None, tmdb_id=348)] == ["Alien", "Alien Director's Cut"]
+    assert [r["title"] for r in search_matches(index, "", logger=None, imdb_id="tt0078748")] == ["Alien"]
+    assert search_matches(index, "Alien", logger=None, tvdb_id=1) == []
+
+
+def test_asset_registry_ids_are_stable():
+    index = create_new_empty_index()
+    heat = create_mock_asset("Heat", "movies")
+    ronin = create_mock_asset("Ronin", "movies")
+    build_search_index(index, heat["title"], heat, logger=None)
+    build_search_index(index, ronin["title"], ronin, logger=None)
+
+    assert index.register(heat) == 0
+    assert index.asset_id(ronin) == 1
+    assert index.assets == [heat, ronin]
+    assert index.register(dict(heat)) == 2
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from util.json_stream import iter_json_array
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_items_decoded_across_any_chunk_boundary():
+    items = [
+        {"title": "Amélie", "year": 2001, "tags": [1, 2]},
+        12345,
+        "a, ] string",
+        [],
+        None,
+        {"nested": {"list": [{"x": 1.5}]}},
+    ]
+    data = json.dumps(items, ensure_ascii=False, indent=1).encode()
+    for size in (1, 2, 3, 7, 64, len(data)):
+        assert list(iter_json_array(chunked(data, size))) == items
+
+
+def test_empty_and_malformed_arrays():
+    assert list(iter_json_array([b"  [ ]  "])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b":']))
+
+
+def test_long_item_is_not_redecoded_per_chunk(monkeypatch):
+    import util.json_stream as json_stream
+
+    calls = []
+    decoder = json.JSONDecoder()
+
+    class CountingDecoder:
+        def raw_decode(self, s, idx=0):
+            calls.append(idx)
+            return decoder.raw_decode(s, idx)
+
+    monkeypatch.setattr(json_stream, "_decoder", CountingDecoder())
+    items = [{"overview": "x" * 20000}, 1]
+    data = json.dumps(items).encode()
+    assert list(iter_json_array(chunked(data, 10))) == items
+    assert len(calls) < 40
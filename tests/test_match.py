@@ -1,10 +1,27 @@
+import json
+import logging
 import os
 import sys
+from types import SimpleNamespace
 
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from util.match import compare_strings, is_match
+from util.construct import prepare_media
+from util.index import build_join_index, build_search_index, build_trigram_index, create_new_empty_index
+from util.match import (
+    collect_unmatched_assets,
+    compare_strings,
+    handle_series_match,
+    is_match,
+    join_matches,
+    match_assets_to_media,
+    match_media_to_assets,
+)
+import util.match_cache as match_cache
+from util.match_stats import MatchStats
+from util.normalization import normalize_titles
+from util.records import AssetRecord, MediaRecord
 
 
 def test_compare_strings_loose_match():
@@ -26,4 +43,267 @@ def test_matching():
         "year": None
     }
     
-    assert is_match(asset, media, logger=None, log=None)
\ No newline at end of file
+    assert is_match(asset, media, logger=None, log=None)
+
+def _movie_asset(title, year):
+    return {
+        "title": title,
+        "year": year,
+        "normalized_title": normalize_titles(title),
+        "files": [f"/posters/{title} ({year}).jpg"],
+        "type": "movies",
+    }
+
+
+def test_trigram_index_scores_near_misses():
+    assets = [
+        _movie_asset("The Shawshank Redemption", 1994),
+        _movie_asset("Heat", 1995),
+    ]
+    trigram_index = build_trigram_index(assets)
+    results = trigram_index.search(normalize_titles("The Shawshank Redemtion"), 0.7)
+    assert [asset["title"] for _, asset in results] == ["The Shawshank Redemption"]
+    assert trigram_index.search(normalize_titles("The Shawshank Redemtion"), 0.9) == []
+
+
+def test_fuzzy_match_only_when_enabled():
+    index = create_new_empty_index()
+    for asset in [_movie_asset("The Shawshank Redemption", 1994), _movie_asset("Shawshank Redemption", 2020)]:
+        build_search_index(index, asset["title"], asset, logger=None)
+    media = {
+        "title": "The Shawshank Redemtion",
+        "year": 1994,
+        "normalized_title": normalize_titles("The Shawshank Redemtion"),
+        "alternate_titles": [],
+        "normalized_alternate_titles": [],
+        "tmdb_id": 278,
+    }
+    logger = logging.getLogger("test_match")
+
+    matched = match_assets_to_media({"movies": [dict(media)]}, index, logger)
+    assert matched["movies"] == []
+
+    config = SimpleNamespace(fuzzy_match_threshold=70)
+    matched = match_assets_to_media({"movies": [dict(media)]}, index, logger, config=config)
+    assert [m["asset_ref"]["year"] for m in matched["movies"]] == [1994]
+
+
+def test_prepare_media_supplies_folder_year():
+    media = prepare_media({
+        "title": "Alien",
+        "year": 1980,
+        "normalized_title": normalize_titles("Alien"),
+        "folder": "Alien Directors Cut (1979)",
+        "alternate_titles": [],
+        "normalized_alternate_titles": [],
+    })
+    assert media["folder_year"] == 1979
+    assert media["normalized_folder_title"] == normalize_titles("Alien Directors Cut")
+    assert is_match(_movie_asset("Alien", 1979), media)[0]
+    assert not is_match(_movie_asset("Alien", 1986), media)[0]
+
+
+def test_is_match_leaves_unprepared_entries_untouched():
+    asset = AssetRecord(_movie_asset("Alien", 1979), folder="/posters/Alien (1979)")
+    other = _movie_asset("Alien", 1979)
+    before = dict(asset)
+    assert is_match(other, asset)[0]
+    assert dict(asset) == before
+
+
+def test_hash_join_matches_pairwise_results():
+    assets = [
+        _movie_asset("Heat", 1995),
+        _movie_asset("Heat", 1986),
+        _movie_asset("Ronin", 1998),
+        dict(_movie_asset("Alien", 1979), tmdb_id=348),
+    ]
+    index = create_new_empty_index()
+    for asset in assets:
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    def media(title, year, **ids):
+        return dict(
+            title=title,
+            year=year,
+            normalized_title=normalize_titles(title),
+            folder=f"{title} ({year})",
+            alternate_titles=[],
+            normalized_alternate_titles=[],
+            **ids,
+        )
+
+    movies = [media("Heat", 1986), media("Ronin", 2000), media("Alien", 1979, tmdb_id=999)]
+    join_index = build_join_index(index.assets)
+    for movie in movies:
+        accepted = join_matches(join_index, movie)
+        assert set(accepted) == {id(a) for a in assets if is_match(a, movie)[0]}
+
+    logger = logging.getLogger("test_match")
+    results = []
+    for config in [None, SimpleNamespace(hash_join_matching=True)]:
+        matched = match_assets_to_media(
+            {"movies": [dict(m) for m in movies]}, index, logger, config=config
+        )
+        results.append([(m["title"], m["asset_ref"]["year"]) for m in matched["movies"]])
+    assert results[0] == results[1] == [("Heat", 1986)]
+
+
+def test_parallel_matching_matches_single_process():
+    index = create_new_empty_index()
+    titles = ["Heat", "Ronin", "Alien", "Aliens", "Collateral", "Thief"]
+    for year, title in enumerate(titles, start=1980):
+        asset = _movie_asset(title, year)
+        build_search_index(index, asset["title"], asset, logger=None)
+    movies = [
+        dict(
+            title=title,
+            year=year,
+            normalized_title=normalize_titles(title),
+            alternate_titles=[],
+            normalized_alternate_titles=[],
+        )
+        for year, title in enumerate(titles + ["Manhunter"], start=1980)
+    ]
+    logger = logging.getLogger("test_match")
+    results = []
+    for workers in [1, 3]:
+        config = SimpleNamespace(match_workers=workers)
+        matched = match_assets_to_media(
+            {"movies": [dict(m) for m in movies]}, index, logger, config=config
+        )
+        results.append(
+            [(m["title"], any(m["asset_ref"] is a for a in index.assets)) for m in matched["movies"]]
+        )
+    assert results[0] == results[1]
+    assert results[1] == [(title, True) for title in titles]
+
+
+def test_match_stats_count_reasons_and_candidates(tmp_path, monkeypatch):
+    index = create_new_empty_index()
+    for asset in [_movie_asset("Heat", 1995), _movie_asset("Ronin", 1998)]:
+        build_search_index(index, asset["title"], asset, logger=None)
+    movies = [
+        dict(title=title, year=year, normalized_title=normalize_titles(title),
+             alternate_titles=[], normalized_alternate_titles=[])
+        for title, year in [("Heat", 1995), ("Ronin", 2000), ("Thief", 1981)]
+    ]
+    stats = MatchStats()
+    match_assets_to_media({"movies": movies}, index, logging.getLogger("test_match"), stats=stats)
+
+    report = stats.to_dict()
+    assert report["totals"]["items"] == 3
+    assert report["totals"]["matches"] == 1
+    assert report["reasons"] == {"Asset title equals media title": 1}
+    assert report["media_types"]["movies"]["candidate_sizes"] == {"0": 1, "1": 2}
+
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    path = stats.write("poster_renamerr")
+    assert path == str(tmp_path / "poster_renamerr" / "match_stats.json")
+    assert json.load(open(path))["totals"]["non_matches"] == 2
+
+
+def test_handle_series_match_prunes_missing_seasons():
+    files = ["/a/Show (2000) - Season 1.jpg", "/a/Show (2000) - Season 3.jpg", "/a/Show (2000).jpg"]
+    season_numbers = [1, 3]
+    asset = {"files": list(files), "season_numbers": season_numbers, "season_mask": 0b1010}
+    handle_series_match(asset, 0b10)
+    assert asset["files"] == [files[0], files[2]]
+    assert asset["season_numbers"] is season_numbers and season_numbers == [1]
+    assert asset["season_mask"] == 0b10
+
+
+def test_media_records_match_through_alternate_titles():
+    index = create_new_empty_index()
+    asset = _movie_asset("Das Boot", 1981)
+    build_search_index(index, asset["title"], asset, logger=None)
+
+    def media():
+        # Alternate titles given as a tuple, which the matcher must not concatenate to a list
+        return MediaRecord(
+            title="The Boat",
+            year=1981,
+            status="released",
+            root_folder="/movies",
+            normalized_title=normalize_titles("The Boat"),
+            alternate_titles=("Das Boot",),
+            normalized_alternate_titles=(normalize_titles("Das Boot"),),
+        )
+
+    logger = logging.getLogger("test_match")
+    for config in [None, SimpleNamespace(hash_join_matching=True, fuzzy_match_threshold=70)]:
+        matched = match_assets_to_media({"movies": [media()]}, index, logger, config=config)
+        assert [m["asset_ref"] is asset for m in matched["movies"]] == [True]
+
+    unmatched = match_media_to_assets({"movies": [media()]}, index, [], logger)
+    assert unmatched["movies"] == []
+
+
+def test_match_cache_revalidates_title_candidates(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        match_cache, "default_match_cache_path", lambda: str(tmp_path / "match_cache.db")
+    )
+    logger = logging.getLogger("test_match")
+
+    def run(titles, config):
+        index = create_new_empty_index()
+        for title in titles:
+            asset = _movie_asset(title, 1981)
+            build_search_index(index, asset["title"], asset, logger=None)
+        media = dict(
+            title="The Boat",
+            year=1981,
+            normalized_title=normalize_titles("The Boat"),
+            alternate_titles=["Das Boot"],
+            normalized_alternate_titles=[normalize_titles("Das Boot")],
+        )
+        matched = match_assets_to_media({"movies": [media]}, index, logger, config=config)
+        return [m["asset_ref"]["title"] for m in matched["movies"]]
+
+    cached = SimpleNamespace(match_cache=True)
+    assert run(["Das Boot"], cached) == ["Das Boot"]
+    assert run(["Das Boot", "The Boat"], None) == ["The Boat"]
+    assert run(["Das Boot", "The Boat"], cached) == ["The Boat"]
+
+
+def test_shared_match_pass_feeds_unmatched_report_and_cleanup():
+    index = create_new_empty_index()
+    show = dict(
+        _movie_asset("Show", 2000),
+        type="series",
+        files=["/posters/Show (2000) - Season 1.jpg"],
+        season_numbers=[1],
+    )
+    for asset in [_movie_asset("Heat", 1995), _movie_asset("Ronin", 1998), show]:
+        build_search_index(index, asset["title"], asset, logger=None)
+
+    def media(title, year, **extra):
+        return dict(
+            title=title,
+            year=year,
+            status="released",
+            root_folder="/media",
+            normalized_title=normalize_titles(title),
+            alternate_titles=[],
+            normalized_alternate_titles=[],
+            **extra,
+        )
+
+    seasons = [{"season_number": n, "season_has_episodes": True} for n in (1, 2)]
+    media_dict = {
+        "movies": [media("Heat", 1995), media("Thief", 1981)],
+        "series": [media("Show", 2000, seasons=seasons)],
+    }
+    logger = logging.getLogger("test_match")
+    standalone = match_media_to_assets(media_dict, index, [], logger)
+
+    media_matches = {}
+    matched = match_assets_to_media(media_dict, index, logger, media_matches=media_matches)
+    assert [m["title"] for m in matched["movies"]] == ["Heat"]
+    shared = match_media_to_assets(media_dict, index, [], logger, media_matches=media_matches)
+    assert shared == standalone
+    assert shared["series"][0]["missing_seasons"] == [2]
+
+    matched_ids = {index.asset_id(asset) for asset, _ in media_matches.values()}
+    unmatched = collect_unmatched_assets(index, matched_ids, logger)
+    assert [a["title"] for a in unmatched["movies"]] == ["Ronin"]
@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import util.match_cache as match_cache
+from util.match_cache import MatchCache
+
+
+def _asset(title, year, files):
+    return {"type": "movies", "title": title, "year": year, "files": files}
+
+
+def test_match_cache_hits_until_either_side_changes(tmp_path):
+    db = str(tmp_path / "match_cache.db")
+    heat = _asset("Heat", 1995, ["/posters/Heat (1995).jpg"])
+    media = {"title": "Heat", "year": 1995, "tmdb_id": 949}
+
+    cache = MatchCache([heat], [False, 0], path=db)
+    key = cache.media_key(media, "movies")
+    assert cache.get(key, []) is None
+    cache.put(key, heat, [], "Asset title equals media title")
+    cache.close()
+
+    cache = MatchCache([dict(heat)], [False, 0], path=db)
+    assert cache.get(key, [])["asset"]["title"] == "Heat"
+    assert cache.hits == 1
+    cache.close()
+
+    strict = MatchCache([heat], [True, 0], path=db)
+    assert strict.get(key, []) is None
+    strict.close()
+
+    changed = _asset("Heat", 1995, ["/posters/Heat (1995).png"])
+    cache = MatchCache([changed], [False, 0], path=db)
+    assert cache.get(key, []) is None
+    assert cache.evicted == 1
+    cache.close()
+
+    renamed = dict(media, title="Heat (Remastered)")
+    cache = MatchCache([heat], [False, 0], path=db)
+    assert cache.get(cache.media_key(renamed, "movies"), []) is None
+    cache.close()
+
+
+def test_match_cache_rejects_new_candidates(tmp_path):
+    db = str(tmp_path / "match_cache.db")
+    by_title = _asset("Heat", 1995, ["/a/Heat (1995).jpg"])
+    by_id = dict(_asset("Heat", 1995, ["/b/Heat (1995) {tmdb-949}.jpg"]), tmdb_id=949)
+    media = {"title": "Heat", "year": 1995, "tmdb_id": 949}
+
+    cache = MatchCache([by_title], [False, 0], path=db)
+    key = cache.media_key(media, "movies")
+    cache.put(key, by_title, [], "Asset title equals media title")
+    cache.close()
+
+    cache = MatchCache([by_title, by_id], [False, 0], path=db)
+    assert cache.get(key, [by_id]) is None
+    cache.close()
+
+
+def test_match_cache_commits_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(match_cache, "commit_every", 2)
+    db = str(tmp_path / "match_cache.db")
+    assets = [_asset(title, 2000, [f"/posters/{title}.jpg"]) for title in ["A", "B", "C"]]
+    cache = MatchCache(assets, [False, 0], path=db)
+    for asset in assets:
+        cache.put(cache.media_key({"title": asset["title"]}, "movies"), asset, [], "")
+
+    other = sqlite3.connect(db, timeout=0)
+    assert other.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 2
+    other.close()
+    cache.close()
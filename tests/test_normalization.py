@@ -5,7 +5,12 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from util.normalization import normalize_file_names, normalize_titles
+from util.normalization import (
+    normalization_cache_stats,
+    normalize_file_names,
+    normalize_many,
+    normalize_titles,
+)
 
 # def test_normalize_titles_removes_junk():
 #     assert normalize_titles("The Matrix (1999)") == "thematrix"
@@ -36,4 +41,19 @@ def test_normalize_file():
     ]
     print("")
     for i in data:
-        print(normalize_file_names(i))
\ No newline at end of file
+        print(normalize_file_names(i))
+
+def test_normalize_many_matches_single_calls():
+    data = ["The Matrix (1999)", "Pokémon Detective Pikachu", "Tom &amp; Jerry", "The Matrix (1999)"]
+    assert normalize_many(data) == [normalize_titles(s) for s in data]
+    assert normalize_titles("Pokémon Detective Pikachu") == "pokemondetectivepikachu"
+    assert normalize_titles("Tom &amp; Jerry") == "tomjerry"
+
+
+def test_normalization_cache_stats_count_hits():
+    before = normalization_cache_stats()["normalize_titles"]
+    normalize_titles("A Title Only Used Here")
+    normalize_titles("A Title Only Used Here")
+    after = normalization_cache_stats()["normalize_titles"]
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
@@ -0,0 +1,98 @@
+import logging
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import util.arrpy as arrpy
+import util.rate_limit as rate_limit
+from util.arrpy import BaseARRClient
+from util.rate_limit import TokenBucket, backoff_delay, parse_retry_after
+
+logger = logging.getLogger("test_rate_limit")
+
+URL = "http://sonarr:8989"
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}", response=self)
+
+    def json(self):
+        return {"ok": True}
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, *args, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def make_client(responses):
+    client = BaseARRClient.__new__(BaseARRClient)
+    client.logger = logger
+    client.max_retries = 5
+    client.timeout = 1
+    client.url = URL
+    client.http_cache = None
+    client.session = FakeSession(responses)
+    return client
+
+
+def test_token_bucket_spaces_requests_after_burst(monkeypatch):
+    slept = []
+    monkeypatch.setattr(rate_limit.time, "sleep", slept.append)
+    bucket = TokenBucket(rate=2, burst=2)
+    assert [bucket.acquire() for _ in range(4)][:2] == [0.0, 0.0]
+    assert len(slept) == 2
+    assert slept[1] > slept[0] > 0
+
+
+def test_backoff_grows_with_jitter_and_honors_retry_after():
+    for attempt in range(4):
+        delay = min(rate_limit.backoff_cap, rate_limit.backoff_base * 2**attempt)
+        assert delay / 2 <= backoff_delay(attempt) <= delay
+    assert 7 <= backoff_delay(0, parse_retry_after("7")) <= 8
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retries_server_errors_and_counts_them(monkeypatch):
+    slept = []
+    monkeypatch.setattr(arrpy.time, "sleep", slept.append)
+    rate_limit.pop_request_counts()
+    client = make_client(
+        [FakeResponse(503, {"Retry-After": "3"}), FakeResponse(500), FakeResponse(200)]
+    )
+    assert client.make_get_request(f"{URL}/api/v3/series") == {"ok": True}
+    assert slept[0] >= 3
+    assert rate_limit.pop_request_counts()[URL]["retries"] == 2
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    monkeypatch.setattr(arrpy.time, "sleep", lambda s: None)
+    client = make_client([FakeResponse(404), FakeResponse(200)])
+    assert client.make_get_request(f"{URL}/api/v3/series/1") is None
+    assert client.session.calls == 1
+
+
+def test_limits_shared_per_instance_url():
+    rate_limit.configure_rate_limits(
+        {"sonarr": {"main": {"url": URL + "/", "api": "x", "rate_limit": 5}}}
+    )
+    bucket = rate_limit._buckets[URL]
+    rate_limit.set_rate_limit(URL, 5)
+    assert rate_limit._buckets[URL] is bucket
+    rate_limit.set_rate_limit(URL, 0)
+    assert URL not in rate_limit._buckets
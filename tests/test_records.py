@@ -0,0 +1,44 @@
+import copy
+import json
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from util.construct import create_collection, create_movie
+from util.records import MediaRecord, record_json_default
+
+
+def test_asset_record_behaves_like_the_dict_it_replaces():
+    asset = create_movie("Heat", 1995, 949, None, "heat", ["/a/Heat (1995).jpg"], "/a")
+    expected = {
+        "type": "movies",
+        "title": "Heat",
+        "year": 1995,
+        "tmdb_id": 949,
+        "imdb_id": None,
+        "normalized_title": "heat",
+        "files": ["/a/Heat (1995).jpg"],
+        "folder": "/a",
+        "media_folder": None,
+    }
+    assert asset == expected
+    assert "tvdb_id" not in asset and asset.get("tvdb_id") is None
+    assert asset.title == "Heat"
+    asset["files"].append("/b/Heat (1995).jpg")
+    asset["matched"] = True
+    del asset["imdb_id"]
+    assert sorted(asset) == sorted(set(expected) - {"imdb_id"} | {"matched"})
+    for clone in (copy.deepcopy(asset), pickle.loads(pickle.dumps(asset))):
+        assert clone == asset
+    assert json.loads(json.dumps(asset, default=record_json_default)) == dict(asset)
+
+
+def test_record_interns_titles_and_keeps_lists_comparable():
+    collection = create_collection("Alien Collection", 8091, "alien", ["/a/Alien Collection.jpg"])
+    assert isinstance(collection["alternate_titles"], list)
+    first = MediaRecord(title="".join(["Ali", "en"]), alternate_titles=["".join(["A", "liens"])])
+    second = MediaRecord(title="".join(["Al", "ien"]), alternate_titles=["Aliens"], tags=[1, 2])
+    assert first["title"] is second["title"]
+    assert first["alternate_titles"][0] is second["alternate_titles"][0]
+    assert second == {"title": "Alien", "alternate_titles": ["Aliens"], "tags": [1, 2]}
@@ -14,4 +14,19 @@ def test_parse_file_group_basic():
 
 def test_parse_folder_group_normalized_title():
     result = parse_folder_group("/fake/path", "Max Movies", ["poster.jpg"])
-    assert result["normalized_title"] == "maxmovies"
\ No newline at end of file
+    assert result["normalized_title"] == "maxmovies"
+
+def test_nested_scan_with_workers_keeps_order(tmp_path):
+    import logging
+
+    from util.scanner import scan_files_in_nested_folders
+
+    for i in range(20):
+        folder = tmp_path / f"Movie {i} ({2000 + i})"
+        folder.mkdir()
+        (folder / "poster.jpg").write_bytes(b"")
+    logger = logging.getLogger("test_scanner")
+    serial = scan_files_in_nested_folders(str(tmp_path), logger)
+    threaded = scan_files_in_nested_folders(str(tmp_path), logger, workers=4)
+    assert len(serial) == 20
+    assert threaded == serial
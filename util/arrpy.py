@@ -1,23 +1,110 @@
+import asyncio
 import html
+import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from unidecode import unidecode
 
 from util.constants import windows_path_regex, year_regex
+from util.construct import prepare_media, season_mask
 from util.extract import extract_year
-from util.normalization import normalize_titles
+from util.http_cache import HttpCache, open_http_cache
+from util.json_stream import iter_json_array
+from util.normalization import normalize_many, normalize_titles
+from util.rate_limit import backoff_delay, parse_retry_after, record_retry, throttle
+from util.records import MediaRecord
 
 logging.getLogger("requests").setLevel(logging.WARNING)
 
+# Default number of requests a module runs at once against a single ARR instance
+default_arr_concurrency: int = 4
+
+# HTTP errors worth retrying; other client errors fail on the first attempt
+retryable_status_codes = {408, 429, 500, 502, 503, 504}
+
+# Command states after which an ARR command will not change any more
+command_final_states = {"completed", "failed", "aborted", "cancelled", "orphaned"}
+
+# Bytes read at a time when streaming large responses
+stream_chunk_size: int = 64 * 1024
+
+# Seconds a detected app type and system status are reused before re-checking
+client_status_ttl: float = 300.0
+
+# Connections kept open per instance by its shared session
+session_pool_size: int = 16
+
+# Fields of a library item that get_parsed_media reads; streamed items keep only these
+media_fields = (
+    "id",
+    "title",
+    "year",
+    "imdbId",
+    "monitored",
+    "status",
+    "rootFolderPath",
+    "qualityProfileId",
+    "path",
+    "originalTitle",
+    "secondaryYear",
+    "hasFile",
+    "tags",
+)
+radarr_media_fields = media_fields + ("tmdbId",)
+sonarr_media_fields = media_fields + ("tvdbId",)
+
+
+def slim_media_item(item: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Copy the parts of a Radarr/Sonarr library item that get_parsed_media reads.
+
+    Args:
+        item (Dict[str, Any]): Movie or series from the API.
+        fields (Tuple[str, ...]): Top-level fields to keep.
+    Returns:
+        Dict[str, Any]: Reduced item.
+    """
+    slim = {key: item[key] for key in fields if key in item}
+    if "alternateTitles" in item:
+        slim["alternateTitles"] = [{"title": t["title"]} for t in item["alternateTitles"]]
+    if item.get("movieFile"):
+        slim["movieFile"] = {"id": item["movieFile"].get("id")}
+    if "seasons" in item:
+        slim["seasons"] = []
+        for season in item["seasons"]:
+            slim_season = {
+                "seasonNumber": season["seasonNumber"],
+                "monitored": season["monitored"],
+            }
+            statistics = season.get("statistics")
+            if statistics is not None:
+                slim_season["statistics"] = {
+                    key: statistics[key]
+                    for key in ("episodeCount", "totalEpisodeCount")
+                    if key in statistics
+                }
+            slim["seasons"].append(slim_season)
+    return slim
+
 
 class BaseARRClient:
     """Base class for interacting with ARR (Radarr/Sonarr) instances."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        status: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the base ARR client.
 
@@ -25,10 +112,14 @@ class BaseARRClient:
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            status (Optional[Dict[str, Any]]): Known system status; fetched if None.
+            session (Optional[requests.Session]): Session to share; a new one if None.
         """
         self.logger = logger
         self.max_retries = 5
         self.timeout = 60
+        self.max_concurrency = default_arr_concurrency
+        self.http_cache: Optional[HttpCache] = None
         self.url = url.rstrip("/")
         self.api = api
         self.headers = {
@@ -36,14 +127,14 @@ class BaseARRClient:
             "Content-Type": "application/json",
             "X-Api-Key": api,
         }
-        self.session = requests.Session()
-        self.session.headers.update({"X-Api-Key": self.api})
+        self.session = session or create_session(api)
         self.connect_status = False
         self.instance_type = None
         self.instance_name = None
         self.app_name = None
         self.app_version = None
-        status = self.get_system_status()
+        if status is None:
+            status = self.get_system_status()
         if not status:
             return
         self.app_name = status.get("appName")
@@ -73,24 +164,32 @@ class BaseARRClient:
         Returns:
             bool: True if successful, False otherwise.
         """
-        self.logger.debug("Waiting for command to complete...")
-        cycle = 0
-        while True:
-            endpoint = f"{self.url}/api/v3/command/{command_id}"
-            response = self.make_get_request(endpoint)
-            if response and response.get("status") == "completed":
-                return True
-            if response and response.get("status") == "failed":
-                return False
-            time.sleep(5)
-            cycle += 1
-            if cycle % 5 == 0:
-                self.logger.debug(
-                    f"Still waiting for command {command_id}... (cycle {cycle})"
-                )
-            if cycle > 120:
-                self.logger.error(f"Command {command_id} timed out after 10 minutes.")
-                return False
+        tracker = CommandTracker(self)
+        future = tracker.track(command_id)
+        tracker.wait()
+        return future.result()
+
+    def get_commands(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get all queued, running and recently finished commands.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Commands.
+        """
+        endpoint = f"{self.url}/api/v3/command"
+        return self.make_get_request(endpoint)
+
+    def get_command(self, command_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a single command.
+
+        Args:
+            command_id (int): Command ID.
+        Returns:
+            Optional[Dict[str, Any]]: Command.
+        """
+        endpoint = f"{self.url}/api/v3/command/{command_id}"
+        return self.make_get_request(endpoint)
 
     def create_tag(self, tag: str) -> int:
         """
@@ -139,7 +238,82 @@ class BaseARRClient:
         Returns:
             Any: Response or JSON.
         """
-        return self._request_with_retries("GET", endpoint, headers=headers)
+        cache = self.http_cache
+        if not cache or cache.ttl_for(endpoint) is None:
+            return self._request_with_retries("GET", endpoint, headers=headers)
+        cached = cache.get(endpoint)
+        if cached and cached["fresh"]:
+            self.logger.debug(f"HTTP cache hit: {endpoint}")
+            return json.loads(cached["body"])
+        request_headers = dict(headers or {})
+        if cached and cached["etag"]:
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+        response = self._request_with_retries(
+            "GET", endpoint, headers=request_headers, raw=True
+        )
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            self.logger.debug(f"HTTP cache revalidated: {endpoint}")
+            cache.revalidate(endpoint)
+            return json.loads(cached["body"])
+        cache.put(
+            endpoint,
+            self.url,
+            response.text,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return response.json()
+
+    def stream_get_request(self, endpoint: str) -> Optional[Iterator[Any]]:
+        """
+        Make a GET request to an endpoint returning a JSON array and decode its
+        items one at a time as the body arrives.
+
+        Args:
+            endpoint (str): API endpoint.
+        Returns:
+            Optional[Iterator[Any]]: Array items, or None if the request failed.
+                Reading the iterator may raise requests or ValueError exceptions
+                if the body is cut off or malformed.
+        """
+        response = self._request_with_retries("GET", endpoint, stream=True)
+        if response is None:
+            return None
+        return iter_json_array(response.iter_content(chunk_size=stream_chunk_size))
+
+    def get_slim_media(
+        self, endpoint: str, fields: Tuple[str, ...]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a library endpoint, keeping only the given fields of each item.
+
+        The body is streamed and every item is reduced as soon as it is decoded,
+        so the full payload is never held in memory. With the HTTP cache enabled
+        the body is read whole instead, as the cache stores it.
+
+        Args:
+            endpoint (str): Library endpoint (movies or series).
+            fields (Tuple[str, ...]): Top-level fields to keep.
+        Returns:
+            Optional[List[Dict[str, Any]]]: Reduced items, or None on failure.
+        """
+        if self.http_cache:
+            media = self.make_get_request(endpoint)
+            if media is None:
+                return None
+            return [slim_media_item(item, fields) for item in media]
+        items = self.stream_get_request(endpoint)
+        if items is None:
+            return None
+        try:
+            return [slim_media_item(item, fields) for item in items]
+        except (requests.exceptions.RequestException, ValueError) as ex:
+            self.logger.error(f"Failed to read {endpoint}: {ex}")
+            return None
 
     def make_post_request(
         self, endpoint: str, headers: Optional[Dict[str, str]] = None, json: Any = None
@@ -189,6 +363,8 @@ class BaseARRClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         json: Any = None,
+        raw: bool = False,
+        stream: bool = False,
     ) -> Any:
         """
         Perform HTTP request with retry logic.
@@ -198,29 +374,56 @@ class BaseARRClient:
             endpoint (str): API endpoint.
             headers (Optional[Dict[str, str]]): Headers.
             json (Any): JSON payload.
+            raw (bool): If True, return the response instead of its JSON.
+            stream (bool): If True, leave the body unread for streaming (implies raw).
         Returns:
             Any: Response or JSON.
         """
-        response = None
+        if method != "GET" and self.http_cache:
+            # Anything cached for this instance may be outdated by the change
+            self.http_cache.invalidate(self.url)
         for i in range(self.max_retries):
+            response = None
+            throttle(self.url)
             try:
                 response = self.session.request(
-                    method, endpoint, headers=headers, json=json, timeout=self.timeout
+                    method,
+                    endpoint,
+                    headers=headers,
+                    json=json,
+                    timeout=self.timeout,
+                    stream=stream,
                 )
                 response.raise_for_status()
-                return response if method == "DELETE" else response.json()
+                if method == "DELETE" or raw or stream:
+                    return response
+                return response.json()
             except (
                 requests.exceptions.Timeout,
                 requests.exceptions.HTTPError,
                 requests.exceptions.RequestException,
             ) as ex:
-                if i < self.max_retries - 1:
+                retryable = not (
+                    isinstance(ex, requests.exceptions.HTTPError)
+                    and response.status_code not in retryable_status_codes
+                )
+                if retryable and i < self.max_retries - 1:
+                    retry_after = (
+                        parse_retry_after(response.headers.get("Retry-After"))
+                        if response is not None
+                        else None
+                    )
+                    delay = backoff_delay(i, retry_after)
+                    record_retry(self.url)
                     self.logger.warning(
-                        f"{method} request failed ({ex}), retrying ({i+1}/{self.max_retries})..."
+                        f"{method} request failed ({ex}), retrying in {delay:.1f}s ({i+1}/{self.max_retries})..."
                     )
-                    time.sleep(1)
+                    time.sleep(delay)
                 else:
-                    self._handle_request_exception(method, endpoint, ex, response, json)
+                    self._handle_request_exception(
+                        method, endpoint, ex, response, json, attempts=i + 1
+                    )
+                    break
         return None
 
     def _handle_request_exception(
@@ -230,6 +433,7 @@ class BaseARRClient:
         ex: Exception,
         response: Any,
         payload: Any = None,
+        attempts: Optional[int] = None,
     ) -> None:
         """
         Handle exceptions during HTTP request.
@@ -240,6 +444,7 @@ class BaseARRClient:
             ex (Exception): Exception.
             response (Any): Response object.
             payload (Any): Payload data.
+            attempts (Optional[int]): Attempts made, defaults to max_retries.
         """
         status_code = (
             response.status_code
@@ -253,7 +458,9 @@ class BaseARRClient:
             if isinstance(status_code, int)
             else "No HTTP response received, check URL"
         )
-        self.logger.error(f"{method} request failed after {self.max_retries} retries.")
+        self.logger.error(
+            f"{method} request failed after {attempts or self.max_retries} attempts."
+        )
         self.logger.error(f"Endpoint: {endpoint}")
         if payload:
             self.logger.error(f"Payload: {payload}")
@@ -329,7 +536,14 @@ class BaseARRClient:
 class RadarrClient(BaseARRClient):
     """Client for interacting with Radarr API."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        status: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the Radarr client.
 
@@ -337,8 +551,10 @@ class RadarrClient(BaseARRClient):
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            status (Optional[Dict[str, Any]]): Known system status; fetched if None.
+            session (Optional[requests.Session]): Session to share; a new one if None.
         """
-        super().__init__(url, api, logger)
+        super().__init__(url, api, logger, status, session)
         self.instance_type = "Radarr"
 
     def get_media(self) -> Optional[List[Dict[str, Any]]]:
@@ -557,15 +773,13 @@ class RadarrClient(BaseARRClient):
             List[Dict[str, Any]]: List of normalized media entries.
         """
         media_dict = []
-        media = self.get_media()
+        media = self.get_slim_media(f"{self.url}/api/v3/movie", radarr_media_fields)
         if not media:
             return media_dict
         for item in media:
             file_id = item.get("movieFile", {}).get("id", None)
             alternate_titles = [t["title"] for t in item["alternateTitles"]]
-            normalized_alternate_titles = [
-                normalize_titles(t["title"]) for t in item["alternateTitles"]
-            ]
+            normalized_alternate_titles = normalize_many(alternate_titles)
             if year_regex.search(item["title"]):
                 title = year_regex.sub("", item["title"])
                 year = extract_year(item["title"])
@@ -578,38 +792,49 @@ class RadarrClient(BaseARRClient):
             else:
                 folder = os.path.basename(os.path.normpath(item["path"]))
             media_dict.append(
-                {
-                    "title": unidecode(html.unescape(title)),
-                    "year": year,
-                    "media_id": item["id"],
-                    "tmdb_id": item["tmdbId"],
-                    "imdb_id": item.get("imdbId", None),
-                    "monitored": item["monitored"],
-                    "status": item["status"],
-                    "root_folder": item["rootFolderPath"],
-                    "quality_profile": item["qualityProfileId"],
-                    "normalized_title": normalize_titles(item["title"]),
-                    "path_name": os.path.basename(item["path"]),
-                    "original_title": item.get("originalTitle", None),
-                    "secondary_year": item.get("secondaryYear", None),
-                    "alternate_titles": alternate_titles,
-                    "normalized_alternate_titles": normalized_alternate_titles,
-                    "file_id": file_id,
-                    "folder": folder,
-                    "normalized_folder": normalize_titles(folder),
-                    "has_file": item["hasFile"],
-                    "tags": item["tags"],
-                    "seasons": None,
-                    "season_numbers": None,
-                }
+                MediaRecord(
+                    {
+                        "title": unidecode(html.unescape(title)),
+                        "year": year,
+                        "media_id": item["id"],
+                        "tmdb_id": item["tmdbId"],
+                        "imdb_id": item.get("imdbId", None),
+                        "monitored": item["monitored"],
+                        "status": item["status"],
+                        "root_folder": item["rootFolderPath"],
+                        "quality_profile": item["qualityProfileId"],
+                        "normalized_title": normalize_titles(item["title"]),
+                        "path_name": os.path.basename(item["path"]),
+                        "original_title": item.get("originalTitle", None),
+                        "secondary_year": item.get("secondaryYear", None),
+                        "alternate_titles": alternate_titles,
+                        "normalized_alternate_titles": normalized_alternate_titles,
+                        "file_id": file_id,
+                        "folder": folder,
+                        "normalized_folder": normalize_titles(folder),
+                        "has_file": item["hasFile"],
+                        "tags": item["tags"],
+                        "seasons": None,
+                        "season_numbers": None,
+                    }
+                )
             )
+        for media in media_dict:
+            prepare_media(media)
         return media_dict
 
 
 class SonarrClient(BaseARRClient):
     """Client for interacting with Sonarr API."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        status: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the Sonarr client.
 
@@ -617,8 +842,10 @@ class SonarrClient(BaseARRClient):
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            status (Optional[Dict[str, Any]]): Known system status; fetched if None.
+            session (Optional[requests.Session]): Session to share; a new one if None.
         """
-        super().__init__(url, api, logger)
+        super().__init__(url, api, logger, status, session)
         self.instance_type = "Sonarr"
 
     def get_media(self) -> Optional[List[Dict[str, Any]]]:
@@ -812,6 +1039,31 @@ class SonarrClient(BaseARRClient):
         endpoint = f"{self.url}/api/v3/episode?seriesId={media_id}"
         return self.make_get_request(endpoint, headers=self.headers)
 
+    def get_episodes_by_season(
+        self, media_ids: List[int]
+    ) -> Dict[int, Dict[int, List[Dict[str, Any]]]]:
+        """
+        Get the episodes of several series, grouped by season.
+        Makes one request per series, up to max_concurrency at once.
+        Args:
+            media_ids (List[int]): Series IDs.
+        Returns:
+            Dict[int, Dict[int, List[Dict[str, Any]]]]: Series ID -> season
+            number -> episodes, in API order.
+        """
+        if not media_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(media_ids))
+        ) as executor:
+            responses = list(executor.map(self.get_season_data, media_ids))
+        episodes: Dict[int, Dict[int, List[Dict[str, Any]]]] = {}
+        for media_id, data in zip(media_ids, responses):
+            by_season = episodes[media_id] = {}
+            for episode in data or []:
+                by_season.setdefault(episode["seasonNumber"], []).append(episode)
+        return episodes
+
     def delete_episode_file(self, episode_file_id: int) -> Any:
         """
         Delete an episode file by file ID.
@@ -932,17 +1184,20 @@ class SonarrClient(BaseARRClient):
             List[Dict[str, Any]]: List of normalized media entries.
         """
         media_dict = []
-        media = self.get_media()
+        media = self.get_slim_media(f"{self.url}/api/v3/series", sonarr_media_fields)
         if not media:
             return media_dict
+        episodes = (
+            self.get_episodes_by_season([item["id"] for item in media])
+            if include_episode
+            else {}
+        )
         for item in media:
             season_data = item.get("seasons", [])
             season_list = []
             for season in season_data:
                 if include_episode:
-                    episode_data = self.get_episode_data_by_season(
-                        item["id"], season["seasonNumber"]
-                    )
+                    episode_data = episodes[item["id"]].get(season["seasonNumber"], [])
                     episode_list = [
                         {
                             "episode_number": ep["episodeNumber"],
@@ -976,9 +1231,7 @@ class SonarrClient(BaseARRClient):
                     }
                 )
             alternate_titles = [t["title"] for t in item["alternateTitles"]]
-            normalized_alternate_titles = [
-                normalize_titles(t["title"]) for t in item["alternateTitles"]
-            ]
+            normalized_alternate_titles = normalize_many(alternate_titles)
             if year_regex.search(item["title"]):
                 title = year_regex.sub("", item["title"])
                 year = extract_year(item["title"])
@@ -990,32 +1243,38 @@ class SonarrClient(BaseARRClient):
                 folder = item["path"][item["path"].rfind("\\") + 1 :]
             else:
                 folder = os.path.basename(os.path.normpath(item["path"]))
+            season_numbers = [s["season_number"] for s in season_list]
             media_dict.append(
-                {
-                    "title": unidecode(html.unescape(title)),
-                    "year": year,
-                    "media_id": item["id"],
-                    "tvdb_id": item["tvdbId"],
-                    "imdb_id": item.get("imdbId", None),
-                    "monitored": item["monitored"],
-                    "status": item["status"],
-                    "root_folder": item["rootFolderPath"],
-                    "quality_profile": item["qualityProfileId"],
-                    "normalized_title": normalize_titles(item["title"]),
-                    "path_name": os.path.basename(item["path"]),
-                    "original_title": item.get("originalTitle", None),
-                    "secondary_year": item.get("secondaryYear", None),
-                    "alternate_titles": alternate_titles,
-                    "normalized_alternate_titles": normalized_alternate_titles,
-                    "file_id": None,
-                    "folder": folder,
-                    "normalized_folder": normalize_titles(folder),
-                    "has_file": None,
-                    "tags": item["tags"],
-                    "seasons": season_list,
-                    "season_numbers": [s["season_number"] for s in season_list],
-                }
+                MediaRecord(
+                    {
+                        "title": unidecode(html.unescape(title)),
+                        "year": year,
+                        "media_id": item["id"],
+                        "tvdb_id": item["tvdbId"],
+                        "imdb_id": item.get("imdbId", None),
+                        "monitored": item["monitored"],
+                        "status": item["status"],
+                        "root_folder": item["rootFolderPath"],
+                        "quality_profile": item["qualityProfileId"],
+                        "normalized_title": normalize_titles(item["title"]),
+                        "path_name": os.path.basename(item["path"]),
+                        "original_title": item.get("originalTitle", None),
+                        "secondary_year": item.get("secondaryYear", None),
+                        "alternate_titles": alternate_titles,
+                        "normalized_alternate_titles": normalized_alternate_titles,
+                        "file_id": None,
+                        "folder": folder,
+                        "normalized_folder": normalize_titles(folder),
+                        "has_file": None,
+                        "tags": item["tags"],
+                        "seasons": season_list,
+                        "season_numbers": season_numbers,
+                        "season_mask": season_mask(season_numbers),
+                    }
+                )
             )
+        for media in media_dict:
+            prepare_media(media)
         return media_dict
 
     def refresh_queue(self) -> Any:
@@ -1044,39 +1303,323 @@ class SonarrClient(BaseARRClient):
         return self.make_delete_request(endpoint, payload)
 
 
+class SilentLogger:
+    def debug(self, *args, **kwargs):
+        pass
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        pass
+
+
+def create_session(api: str) -> requests.Session:
+    """
+    Create a session authenticated with an API key, with a connection pool
+    large enough for concurrent requests against one instance.
+
+    Args:
+        api (str): API key.
+    Returns:
+        requests.Session: New session.
+    """
+    session = requests.Session()
+    session.headers.update({"X-Api-Key": api})
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=session_pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Process-wide connection state per (instance URL, API key): the shared session,
+# the last system status and when it was fetched. Every module running in the
+# process reuses it.
+_registry_lock = threading.Lock()
+_client_registry: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+
+def connect_instance(
+    url: str, api: str
+) -> Optional[Tuple[Dict[str, Any], requests.Session]]:
+    """
+    Return the system status and shared session of an instance, checking the
+    status at most once per client_status_ttl.
+
+    Args:
+        url (str): API URL.
+        api (str): API key.
+    Returns:
+        Optional[Tuple[Dict[str, Any], requests.Session]]: Status and session,
+            or None if the instance could not be reached.
+    """
+    key = (url.rstrip("/"), api)
+    with _registry_lock:
+        entry = _client_registry.setdefault(key, {"session": None, "status": None})
+        if entry["session"] is None:
+            entry["session"] = create_session(api)
+        status = entry["status"]
+        if status and time.monotonic() - entry["checked_at"] < client_status_ttl:
+            return status, entry["session"]
+        session = entry["session"]
+    probe = BaseARRClient(url, api, SilentLogger(), session=session)
+    if not probe.connect_status:
+        return None
+    status = {
+        "appName": probe.app_name,
+        "version": probe.app_version,
+        "instanceName": probe.instance_name,
+    }
+    with _registry_lock:
+        entry.update(status=status, checked_at=time.monotonic())
+    return status, session
+
+
 def create_arr_client(
-    url: str, api: str, logger: Any
+    url: str,
+    api: str,
+    logger: Any,
+    http_cache: bool = False,
+    max_concurrency: int = default_arr_concurrency,
 ) -> Optional[Union[RadarrClient, SonarrClient]]:
     """
     Factory to create a Radarr or Sonarr client.
 
+    Clients of the same instance share one session and a cached status check
+    (see connect_instance), so repeat calls cost no extra round trips.
+
     Args:
         url (str): API URL.
         api (str): API key.
         logger (Any): Logger instance.
+        http_cache (bool): If True, serve library GETs from the on-disk HTTP cache.
+        max_concurrency (int): Maximum concurrent episode requests against the
+            instance (see SonarrClient.get_episodes_by_season).
     Returns:
         Optional[Union[RadarrClient, SonarrClient]]: The client or None on failure.
     """
+    connection = connect_instance(url, api)
+    if not connection:
+        return None
+    status, session = connection
+    if status["appName"] == "Radarr":
+        client = RadarrClient(url, api, logger, status, session)
+    elif status["appName"] == "Sonarr":
+        client = SonarrClient(url, api, logger, status, session)
+    else:
+        logger.error("Unknown ARR type")
+        return None
+    if http_cache:
+        client.http_cache = open_http_cache(logger)
+    client.max_concurrency = max(1, int(max_concurrency or 1))
+    return client
+
+
+class CommandTracker:
+    """Wait for many ARR commands with one request per poll.
+
+    Commands are registered with track() and resolved by wait(), which polls
+    the instance's command list and resolves each command's future (True if
+    it completed, False otherwise) and runs its callback as soon as it
+    finishes. The poll interval starts at min_interval, grows while nothing
+    finishes and drops back whenever something does. A command whose status
+    cannot be fetched (e.g. a transient HTTP error) stays pending; commands
+    still pending timeout seconds after they were tracked are failed.
+    """
+
+    def __init__(
+        self,
+        client: BaseARRClient,
+        min_interval: float = 1.0,
+        max_interval: float = 10.0,
+        timeout: float = 600.0,
+    ) -> None:
+        """
+        Create a tracker for one instance.
+
+        Args:
+            client (BaseARRClient): Client of the instance running the commands.
+            min_interval (float): Shortest wait between polls, in seconds.
+            max_interval (float): Longest wait between polls, in seconds.
+            timeout (float): Seconds after tracking a command before giving up on it.
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self._pending: Dict[int, List[Tuple[Future, Optional[Callable[[bool], Any]]]]] = {}
+        self._deadlines: Dict[int, float] = {}
+
+    def track(
+        self, command_id: int, callback: Optional[Callable[[bool], Any]] = None
+    ) -> Future:
+        """
+        Register a command to wait for.
+
+        Args:
+            command_id (int): Command ID.
+            callback (Optional[Callable[[bool], Any]]): Called with the result
+                when the command finishes, from within wait().
+        Returns:
+            Future: Resolved with True if the command completed, False otherwise.
+        """
+        future: Future = Future()
+        self._pending.setdefault(command_id, []).append((future, callback))
+        self._deadlines.setdefault(command_id, time.monotonic() + self.timeout)
+        return future
+
+    def poll(self) -> int:
+        """
+        Check every pending command once and resolve the finished ones.
+
+        Returns:
+            int: Number of commands resolved.
+        """
+        commands = self.client.get_commands() or []
+        statuses = {command.get("id"): command.get("status") for command in commands}
+        resolved = 0
+        for command_id in list(self._pending):
+            status = statuses.get(command_id)
+            if status is None:
+                # Dropped from the list (or the list failed); ask for it directly.
+                # No answer means the request failed, so the command stays pending.
+                command = self.client.get_command(command_id)
+                status = command.get("status") if command else None
+            if status in command_final_states:
+                self._resolve(command_id, status == "completed")
+                resolved += 1
+        return resolved
+
+    def wait(self) -> None:
+        """Poll until every tracked command has finished or timed out."""
+        if self._pending:
+            self.client.logger.debug(
+                f"Waiting for {len(self._pending)} command(s) to complete..."
+            )
+        interval = self.min_interval
+        while self._pending:
+            time.sleep(interval)
+            if self.poll():
+                interval = self.min_interval
+            else:
+                interval = min(self.max_interval, interval * 1.5)
+            now = time.monotonic()
+            expired = sorted(c for c in self._pending if self._deadlines[c] <= now)
+            if expired:
+                self.client.logger.error(
+                    f"Commands {expired} timed out after {self.timeout / 60:g} minutes."
+                )
+                for command_id in expired:
+                    self._resolve(command_id, False)
+
+    def _resolve(self, command_id: int, ok: bool) -> None:
+        self._deadlines.pop(command_id, None)
+        for future, callback in self._pending.pop(command_id, []):
+            future.set_result(ok)
+            if callback:
+                callback(ok)
+
+
+class AsyncARRClient:
+    """Coroutine wrapper around a blocking Radarr/Sonarr client.
+
+    This is not an asyncio HTTP client: every method of the wrapped
+    RadarrClient/SonarrClient is exposed as a coroutine that runs the original
+    blocking requests call on a worker thread via asyncio.to_thread. It exists
+    only to fan calls out across instances; requests against one instance are
+    limited by the client's own max_concurrency.
+    """
 
-    class SilentLogger:
-        def debug(self, *args, **kwargs):
-            pass
+    def __init__(self, client: Union[RadarrClient, SonarrClient]) -> None:
+        """
+        Wrap a connected client.
 
-        def info(self, *args, **kwargs):
-            pass
+        Args:
+            client (Union[RadarrClient, SonarrClient]): Connected client.
+        """
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
 
-        def warning(self, *args, **kwargs):
-            pass
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(attr, *args, **kwargs)
 
-        def error(self, *args, **kwargs):
-            pass
+        return call
 
-    temp = BaseARRClient(url, api, SilentLogger())
-    if not temp.connect_status:
+
+async def create_async_arr_client(
+    url: str,
+    api: str,
+    logger: Any,
+    max_concurrency: int = default_arr_concurrency,
+    http_cache: bool = False,
+) -> Optional[AsyncARRClient]:
+    """
+    Factory to create a Radarr or Sonarr client wrapped in an AsyncARRClient.
+
+    Args:
+        url (str): API URL.
+        api (str): API key.
+        logger (Any): Logger instance.
+        max_concurrency (int): Maximum concurrent episode requests against the instance.
+        http_cache (bool): If True, serve library GETs from the on-disk HTTP cache.
+    Returns:
+        Optional[AsyncARRClient]: The client or None on failure.
+    """
+    client = await asyncio.to_thread(
+        create_arr_client, url, api, logger, http_cache, max_concurrency
+    )
+    if not client:
         return None
-    if temp.app_name == "Radarr":
-        return RadarrClient(url, api, logger)
-    if temp.app_name == "Sonarr":
-        return SonarrClient(url, api, logger)
-    logger.error("Unknown ARR type")
-    return None
+    return AsyncARRClient(client)
+
+
+def fetch_parsed_media(
+    connections: List[Tuple[str, str]],
+    logger: Any,
+    include_episode: bool = False,
+    max_concurrency: int = default_arr_concurrency,
+    http_cache: bool = False,
+) -> List[Tuple[Optional[Union[RadarrClient, SonarrClient]], Optional[List[Dict[str, Any]]]]]:
+    """
+    Connect to several ARR instances and fetch their parsed media concurrently,
+    one worker thread per instance.
+
+    Args:
+        connections (List[Tuple[str, str]]): (url, api) of each instance.
+        logger (Any): Logger instance.
+        include_episode (bool): If True, include episode-level metadata for Sonarr.
+        max_concurrency (int): Maximum concurrent episode requests against each
+            instance, only used with include_episode.
+        http_cache (bool): If True, serve library GETs from the on-disk HTTP cache.
+    Returns:
+        List of (client, media) per connection, in connections order. The client
+        is None if the instance could not be reached, and the media is None if
+        it did not connect.
+    """
+
+    async def fetch(url: str, api: str) -> Tuple[Any, Any]:
+        app = await create_async_arr_client(
+            url, api, logger, max_concurrency, http_cache
+        )
+        if not app:
+            return None, None
+        if not app.connect_status:
+            return app.client, None
+        logger.info(f"Fetching {app.instance_name} data...")
+        return app.client, await app.get_parsed_media(include_episode=include_episode)
+
+    async def fetch_all() -> List[Tuple[Any, Any]]:
+        return await asyncio.gather(*(fetch(url, api) for url, api in connections))
+
+    if not connections:
+        return []
+    return asyncio.run(fetch_all())
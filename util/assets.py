@@ -1,12 +1,24 @@
+import copy
 import datetime
+import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from collections.abc import Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from util.construct import generate_title_variants
-from util.index import build_search_index, create_new_empty_index, search_matches
+from util.catalog import AssetCatalog, open_catalog
+from util.construct import generate_title_variants, get_season_mask, mask_seasons
+from util.index import (
+    AssetIndex,
+    build_search_index,
+    create_new_empty_index,
+    search_matches,
+)
 from util.match import is_match
-from util.normalization import normalize_file_names
-from util.scanner import process_files
+from util.normalization import log_normalization_stats, normalize_file_names
+from util.scanner import iter_assets, process_files
 from util.utility import progress
 
 
@@ -14,29 +26,95 @@ def get_assets_files(
     source_dirs: str | List[str],
     logger: Optional[Any],
     merge: bool = True,
-) -> Tuple[Optional[List[Dict]], Optional[Dict[str, Any]]]:
+    use_catalog: bool = False,
+    scan_workers: int = 1,
+) -> Tuple[Optional[List[Dict]], Optional[AssetIndex]]:
     """Process one or more directories to extract and organize media assets.
 
+    With use_catalog, folders whose mtime and inode are unchanged since the last
+    run are loaded from the persistent asset catalog instead of being rescanned,
+    and the merge result is reused when no folder changed at all.
+
+    Assets are streamed from the scanner into the merge one at a time, so no
+    per-directory lists are kept alongside the final list. With scan_workers
+    above one, source directories and their asset subfolders are scanned on
+    thread pools. Results are merged in source_dirs order, so later directories
+    still override earlier ones.
+
     Args:
         source_dirs (str or List[str]): One or more paths to media source directories.
         merge (bool): Whether to merge/deduplicate assets by content and title.
         logger (Any, optional): Logger instance for debug/info messages.
+        use_catalog (bool): Whether to use the persistent asset catalog.
+        scan_workers (int): Number of threads used for scanning.
 
     Returns:
-        Tuple[Optional[List[Dict]], Optional[Dict[str, Any]]]: A tuple containing a flat
+        Tuple[Optional[List[Dict]], Optional[AssetIndex]]: A tuple containing a flat
             asset list and a search index.
     """
+    return get_asset_sets(source_dirs, logger, [merge], use_catalog, scan_workers)[0]
+
+
+def get_asset_sets(
+    source_dirs: str | List[str],
+    logger: Optional[Any],
+    merges: List[bool],
+    use_catalog: bool = False,
+    scan_workers: int = 1,
+) -> List[Tuple[Optional[List[Dict]], Optional[AssetIndex]]]:
+    """Scan the source directories once and build one asset set per merge flag.
+
+    Each set has its own asset dictionaries and search index, so callers may
+    mutate one (matching prunes season files) without affecting the others.
+    With a single set the scanner output is streamed as in get_assets_files;
+    with more, it is collected once and copied for every set, and a merge flag
+    requested twice copies the first result instead of merging again.
+
+    Args:
+        source_dirs (str or List[str]): One or more paths to media source directories.
+        logger (Any, optional): Logger instance for debug/info messages.
+        merges (List[bool]): Merge flag of each requested asset set.
+        use_catalog (bool): Whether to use the persistent asset catalog.
+        scan_workers (int): Number of threads used for scanning.
+
+    Returns:
+        List[Tuple[Optional[List[Dict]], Optional[AssetIndex]]]: Asset list and
+            search index of each set, in merges order; (None, None) for empty sets.
+    """
     if isinstance(source_dirs, str):
         source_dirs = [source_dirs]
 
-    final_assets: List[Dict] = []
-    prefix_index: Dict[str, Any] = create_new_empty_index()
-
     start_time = datetime.datetime.now()
 
-    for source_dir in source_dirs:
-        new_assets = process_files(source_dir, logger)
-        if new_assets:
+    catalog = open_catalog(logger) if use_catalog else None
+    scan_workers = max(1, int(scan_workers or 1))
+    scanned = scan_source_dirs(source_dirs, logger, catalog, scan_workers)
+    if catalog or len(merges) > 1:
+        # The merge result can only be reused once every folder stamp is known,
+        # so with the catalog each directory is collected before merging.
+        scanned = [list(assets) for assets in scanned]
+
+    asset_sets = []
+    reused = []
+    built: Dict[bool, List[Dict]] = {}
+    for merge in merges:
+        final_assets: List[Dict] = []
+        prefix_index: AssetIndex = create_new_empty_index()
+        if merge in built:
+            for asset in copy.deepcopy(built[merge]):
+                final_assets.append(asset)
+                build_search_index(prefix_index, asset["title"], asset, logger)
+            asset_sets.append((final_assets, prefix_index))
+            continue
+        cached = catalog.get_merged(source_dirs, merge) if catalog else None
+        if cached is not None:
+            for asset in cached:
+                final_assets.append(asset)
+                build_search_index(prefix_index, asset["title"], asset, logger)
+        else:
+            new_assets: Iterable[Dict] = chain.from_iterable(scanned)
+            if len(merges) > 1:
+                new_assets = copy.deepcopy(list(new_assets))
             if merge:
                 merge_assets(new_assets, final_assets, prefix_index, logger)
             else:
@@ -44,6 +122,23 @@ def get_assets_files(
                     asset["files"].sort()
                     final_assets.append(asset)
                     build_search_index(prefix_index, asset["title"], asset, logger)
+            if catalog:
+                catalog.put_merged(source_dirs, merge, final_assets)
+        asset_sets.append((final_assets, prefix_index))
+        reused.append(cached is not None)
+        built[merge] = final_assets
+
+    if catalog:
+        catalog.close(source_dirs)
+        if logger:
+            logger.info(
+                f"Skipped {catalog.hits} unchanged folder(s), rescanned {catalog.misses} "
+                f"({catalog.reused_groups} unchanged file group(s) reused)"
+            )
+            for was_reused in reused:
+                logger.debug(
+                    f"Asset catalog merge result {'reused' if was_reused else 'rebuilt'}"
+                )
 
     end_time = datetime.datetime.now()
     elapsed_time = (end_time - start_time).total_seconds()
@@ -53,44 +148,142 @@ def get_assets_files(
             f"Processed {len(source_dirs)} source directories in {elapsed_time:.2f} seconds "
             f"({items_per_second:.2f} items/s)"
         )
+        log_normalization_stats(logger)
 
-    if not final_assets:
+    if not all(final_assets for final_assets, _ in asset_sets):
         if logger:
             logger.warning(
                 f"No valid files were found in any of the source directories: {source_dirs}"
             )
-        return None, None
+        return [
+            (final_assets, prefix_index) if final_assets else (None, None)
+            for final_assets, prefix_index in asset_sets
+        ]
+    return asset_sets
+
+
+def scan_source_dirs(
+    source_dirs: List[str],
+    logger: Any,
+    catalog: Optional[AssetCatalog] = None,
+    workers: int = 1,
+) -> Iterator[Iterable[Dict]]:
+    """Yield the assets of each source directory, in source_dirs order.
+
+    With one worker each directory is streamed straight from the scanner. With
+    more, up to that many directories are scanned ahead on a thread pool and
+    held until their turn.
+
+    Args:
+        source_dirs (List[str]): Source directories in priority order.
+        logger (Any): Logger instance.
+        catalog (Optional[AssetCatalog]): Asset catalog to load unchanged folders from.
+        workers (int): Number of threads used for scanning.
+
+    Yields:
+        Iterable[Dict]: Assets of one source directory.
+    """
+    if workers <= 1 or len(source_dirs) <= 1:
+        for source_dir in source_dirs:
+            yield iter_assets(source_dir, logger, catalog, workers)
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(source_dirs))) as executor:
+        pending: Deque[Future] = deque()
+        for source_dir in source_dirs:
+            pending.append(
+                executor.submit(process_files, source_dir, logger, catalog, workers)
+            )
+            if len(pending) >= workers:
+                yield pending.popleft().result() or []
+        while pending:
+            yield pending.popleft().result() or []
+
 
-    return final_assets, prefix_index
+def file_match_keys(file_path: str, is_collection: bool) -> List[str]:
+    """Return the keys under which an existing file is replaced by a new file.
+
+    A new file replaces an existing one when its normalized name equals the
+    existing file's normalized name or, for collections, one of the existing
+    file's normalized title variants.
+
+    Args:
+        file_path (str): Path of the existing file.
+        is_collection (bool): Whether the owning asset is a collection.
+
+    Returns:
+        List[str]: Unique lookup keys.
+    """
+    base_name = os.path.basename(file_path)
+    keys = [normalize_file_names(base_name)]
+    if is_collection:
+        keys.extend(
+            generate_title_variants(os.path.splitext(base_name)[0])[
+                "normalized_alternate_titles"
+            ]
+        )
+    return list(dict.fromkeys(keys))
 
 
 def merge_assets(
-    new_assets: List[Dict], final_assets: List[Dict], prefix_index: Dict, logger: Any
+    new_assets: Iterable[Dict],
+    final_assets: List[Dict],
+    prefix_index: AssetIndex,
+    logger: Any,
 ) -> None:
     """Merge new asset entries into the final asset list, collapsing duplicates,
     handling upgrades, and indexing.
 
+    Each merged asset keeps a map from file match key to its files (in file list
+    order), so finding the file a new file upgrades is a dictionary lookup.
+
     Args:
-        new_assets (List[Dict]): List of new asset dictionaries.
+        new_assets (Iterable[Dict]): New asset dictionaries, consumed one at a time.
         final_assets (List[Dict]): List to append/merge assets into.
-        prefix_index (Dict): Index for fast search/lookup.
+        prefix_index (AssetIndex): Index for fast search/lookup.
         logger (Any): Logger instance.
     """
+    debug = bool(logger) and logger.isEnabledFor(logging.DEBUG)
+    # Keyed by id() of the final asset: (is_collection, match key -> files)
+    file_maps: Dict[int, Tuple[bool, Dict[str, List[str]]]] = {}
+    file_dirs: Dict[int, Set[str]] = {}
+    key_cache: Dict[Tuple[str, bool], List[str]] = {}
+
+    def keys_for(file_path: str, is_collection: bool) -> List[str]:
+        cache_key = (file_path, is_collection)
+        if cache_key not in key_cache:
+            key_cache[cache_key] = file_match_keys(file_path, is_collection)
+        return key_cache[cache_key]
+
+    def file_map_for(final: Dict) -> Tuple[bool, Dict[str, List[str]]]:
+        is_collection = final.get("type") == "collections"
+        cached = file_maps.get(id(final))
+        if cached is None or cached[0] != is_collection:
+            mapping: Dict[str, List[str]] = {}
+            for final_file in final["files"]:
+                for key in keys_for(final_file, is_collection):
+                    mapping.setdefault(key, []).append(final_file)
+            cached = file_maps[id(final)] = (is_collection, mapping)
+        return cached
+
+    def dirs_for(final: Dict) -> Set[str]:
+        if id(final) not in file_dirs:
+            file_dirs[id(final)] = {os.path.dirname(f) for f in final["files"]}
+        return file_dirs[id(final)]
+
     with progress(
         new_assets,
         desc="Processing assets",
-        total=len(new_assets),
+        total=len(new_assets) if isinstance(new_assets, Sized) else None,
         unit="asset",
         logger=logger,
         leave=False,
     ) as pbar:
         for new in pbar:
             search_matched_assets = search_matches(prefix_index, new["title"], logger)
+            new_dirs = {os.path.dirname(f) for f in new["files"]}
             merged = False
             for final in search_matched_assets:
-                new_dirs = {os.path.dirname(f) for f in new["files"]}
-                final_dirs = {os.path.dirname(f) for f in final["files"]}
-                if new_dirs & final_dirs:
+                if new_dirs & dirs_for(final):
                     continue
 
                 is_matched, reason = is_match(final, new)
@@ -101,87 +294,88 @@ def merge_assets(
                 ):
                     if new.get("season_numbers") or final.get("season_numbers"):
                         final["type"] = "series"
-                    pre_files = list(final["files"])
-                    upgrades = []
+                    pre_files = list(final["files"]) if debug else []
+                    is_collection, file_map = file_map_for(final)
                     for new_file in new["files"]:
-                        normalized_new_file = normalize_file_names(
-                            os.path.basename(new_file)
+                        matches = file_map.get(
+                            normalize_file_names(os.path.basename(new_file))
                         )
-                        for final_file in final["files"]:
-                            normalized_final_file = normalize_file_names(
-                                os.path.basename(final_file)
-                            )
-                            if final.get("type") == "collections":
-                                final_base = os.path.splitext(
-                                    os.path.basename(final_file)
-                                )[0]
-                                final_file_variants = generate_title_variants(
-                                    final_base
-                                )["normalized_alternate_titles"]
-                            if normalized_final_file == normalized_new_file or (
-                                final.get("type") == "collections"
-                                and normalized_new_file in final_file_variants
-                            ):
-                                final["files"].remove(final_file)
-                                final["files"].append(new_file)
-                                upgrades.append((final_file, new_file))
-                                break
-                        else:
-                            final["files"].append(new_file)
-
-                    new_season_numbers = new.get("season_numbers")
-                    if new_season_numbers:
-                        final_season_numbers = final.get("season_numbers")
-                        if final_season_numbers:
-                            final["season_numbers"] = list(
-                                set(final_season_numbers + new_season_numbers)
-                            )
-                        else:
-                            final["season_numbers"] = new_season_numbers
+                        if matches:
+                            final_file = matches[0]
+                            final["files"].remove(final_file)
+                            for key in keys_for(final_file, is_collection):
+                                file_map[key].remove(final_file)
+                        final["files"].append(new_file)
+                        for key in keys_for(new_file, is_collection):
+                            file_map.setdefault(key, []).append(new_file)
+
+                    new_mask = get_season_mask(new)
+                    if new_mask:
+                        final["season_mask"] = get_season_mask(final) | new_mask
+                        final["season_numbers"] = mask_seasons(final["season_mask"])
                     final["files"].sort()
+                    for files in file_map.values():
+                        if len(files) > 1:
+                            files.sort()
+                    file_dirs[id(final)] = {os.path.dirname(f) for f in final["files"]}
                     for key in ["tmdb_id", "tvdb_id", "imdb_id"]:
                         if not final.get(key) and new.get(key):
                             final[key] = new[key]
-                    post_files = list(final["files"])
-                    src_parent = os.path.basename(os.path.dirname(new["files"][0]))
-                    reason_str = f"  Reason: {reason}."
-                    files_str = f"  Files: {len(pre_files)} → {len(post_files)}"
-
-                    pre_basenames = {os.path.basename(f): f for f in pre_files}
-                    post_basenames = {os.path.basename(f): f for f in post_files}
-                    new_basenames = {os.path.basename(f): f for f in new["files"]}
-
-                    upgrade_lines = []
-                    for pre_base, pre_full in pre_basenames.items():
-                        if pre_base in new_basenames:
-                            new_full = new_basenames[pre_base]
-                            pre_dir = os.path.basename(os.path.dirname(pre_full))
-                            new_dir = os.path.basename(os.path.dirname(new_full))
-                            if pre_full != new_full:
-                                upgrade_lines.append(
-                                    f"    - Replaced: {pre_base} [{pre_dir}]\n"
-                                    f"        → {os.path.basename(new_full)} [{new_dir}]"
-                                )
-                    for post_base, post_full in post_basenames.items():
-                        if post_base not in pre_basenames:
-                            post_dir = os.path.basename(os.path.dirname(post_full))
-                            upgrade_lines.append(
-                                f"    - Added:    {post_base} [{post_dir}]"
-                            )
-
-                    logger.debug(
-                        f"[MERGE] '{final['title']}' ({final['type']}) from [{src_parent}]\n"
-                        f"{reason_str}\n"
-                        f"{files_str}\n"
-                        + ("\n".join(upgrade_lines) if upgrade_lines else "")
-                    )
+                    prefix_index.add_ids(final)
+                    if debug:
+                        log_merge(final, new, reason, pre_files, logger)
                     merged = True
                     break
             if not merged:
                 new["files"].sort()
                 final_assets.append(new)
                 build_search_index(prefix_index, new["title"], new, logger)
-                src_parent = os.path.basename(os.path.dirname(new["files"][0]))
-                logger.debug(
-                    f"[ADD] New asset '{new['title']}' ({new['type']}), {len(new['files'])} file(s), from {src_parent}"
+                if debug:
+                    src_parent = os.path.basename(os.path.dirname(new["files"][0]))
+                    logger.debug(
+                        f"[ADD] New asset '{new['title']}' ({new['type']}), {len(new['files'])} file(s), from {src_parent}"
+                    )
+
+
+def log_merge(
+    final: Dict, new: Dict, reason: str, pre_files: List[str], logger: Any
+) -> None:
+    """Log a [MERGE] debug entry describing the files replaced and added.
+
+    Args:
+        final (Dict): Merged asset, after the merge.
+        new (Dict): Asset that was merged in.
+        reason (str): Match reason reported by is_match.
+        pre_files (List[str]): Files of the merged asset before the merge.
+        logger (Any): Logger instance.
+    """
+    post_files = list(final["files"])
+    src_parent = os.path.basename(os.path.dirname(new["files"][0]))
+    reason_str = f"  Reason: {reason}."
+    files_str = f"  Files: {len(pre_files)} → {len(post_files)}"
+
+    pre_basenames = {os.path.basename(f): f for f in pre_files}
+    post_basenames = {os.path.basename(f): f for f in post_files}
+    new_basenames = {os.path.basename(f): f for f in new["files"]}
+
+    upgrade_lines = []
+    for pre_base, pre_full in pre_basenames.items():
+        if pre_base in new_basenames:
+            new_full = new_basenames[pre_base]
+            pre_dir = os.path.basename(os.path.dirname(pre_full))
+            new_dir = os.path.basename(os.path.dirname(new_full))
+            if pre_full != new_full:
+                upgrade_lines.append(
+                    f"    - Replaced: {pre_base} [{pre_dir}]\n"
+                    f"        → {os.path.basename(new_full)} [{new_dir}]"
                 )
+    for post_base, post_full in post_basenames.items():
+        if post_base not in pre_basenames:
+            post_dir = os.path.basename(os.path.dirname(post_full))
+            upgrade_lines.append(f"    - Added:    {post_base} [{post_dir}]")
+
+    logger.debug(
+        f"[MERGE] '{final['title']}' ({final['type']}) from [{src_parent}]\n"
+        f"{reason_str}\n"
+        f"{files_str}\n" + ("\n".join(upgrade_lines) if upgrade_lines else "")
+    )
@@ -0,0 +1,285 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from util.records import asset_records, record_json_default
+
+Stamp = Tuple[int, int]
+
+# Bumped whenever the table layout changes; older catalogs are rebuilt
+schema_version: int = 2
+
+
+def default_catalog_path() -> str:
+    """Return the path of the asset catalog database inside the config directory."""
+    from util.config import config_dir
+
+    cache_dir = os.path.join(str(config_dir), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "asset_catalog.db")
+
+
+class AssetCatalog:
+    """Persistent SQLite cache of parsed and merged assets.
+
+    The catalog doubles as a scan manifest. Parsed assets and the size and mtime
+    of every file are stored per scanned folder, keyed by the folder path and
+    validated against its mtime and inode; a folder whose stamp is unchanged is
+    loaded from the catalog instead of being listed and parsed again. Merge
+    results are stored per list of source directories, keyed by a fingerprint of
+    every folder stamp seen while scanning them. The catalog may be shared by
+    scanner threads; folder reads and writes are serialized on an internal lock.
+    Writes are committed as they are made, so other processes scanning at the
+    same time never wait on a transaction held open for the whole scan.
+    """
+
+    def __init__(self, path: Optional[str] = None, logger: Optional[Any] = None) -> None:
+        """Open (or create) the catalog database.
+
+        Args:
+            path (Optional[str]): Database path, defaults to default_catalog_path().
+            logger (Optional[Any]): Logger instance for debug output.
+        """
+        self.path = path or default_catalog_path()
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        self.reused_groups = 0
+        self._seen: List[Tuple[str, int, int]] = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != schema_version:
+            self._conn.executescript(
+                """
+                DROP TABLE IF EXISTS folders;
+                DROP TABLE IF EXISTS merged;
+                """
+            )
+            self._conn.execute(f"PRAGMA user_version = {schema_version}")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS folders (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                files TEXT NOT NULL,
+                assets TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS merged (
+                sources TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                assets TEXT NOT NULL
+            );
+            """
+        )
+
+    @staticmethod
+    def stamp(path: str) -> Optional[Stamp]:
+        """Return the (mtime_ns, inode) stamp of a folder, or None if it cannot be read."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino
+
+    @staticmethod
+    def file_stamps(entries: List[os.DirEntry]) -> Dict[str, List[int]]:
+        """Return the [size, mtime_ns] of each file entry, skipping unreadable ones."""
+        stamps = {}
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stamps[entry.name] = [st.st_size, st.st_mtime_ns]
+        return stamps
+
+    def get_folder(self, path: str, stamp: Optional[Stamp]) -> Optional[List[Dict]]:
+        """Return the cached assets of a folder if its stamp is unchanged.
+
+        Args:
+            path (str): Folder path.
+            stamp (Optional[Stamp]): Current stamp of the folder.
+
+        Returns:
+            Optional[List[Dict]]: Cached assets, or None if missing or stale.
+        """
+        if stamp is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT mtime, inode, assets FROM folders WHERE path = ?", (path,)
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._warn(f"Failed to read catalog entry for {path}: {exc}")
+                row = None
+            if row is None or (row[0], row[1]) != stamp:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._seen.append((path, *stamp))
+        return asset_records(json.loads(row[2]))
+
+    def get_manifest(self, path: str) -> Tuple[Dict[str, List[int]], List[Dict]]:
+        """Return the file stamps and assets recorded for a folder, even if stale.
+
+        Args:
+            path (str): Folder path.
+
+        Returns:
+            Tuple[Dict[str, List[int]], List[Dict]]: File name -> [size, mtime_ns],
+                and the assets parsed at that time; both empty if never recorded.
+        """
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT files, assets FROM folders WHERE path = ?", (path,)
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._warn(f"Failed to read catalog entry for {path}: {exc}")
+                row = None
+        if row is None:
+            return {}, []
+        return json.loads(row[0]), asset_records(json.loads(row[1]))
+
+    def put_folder(
+        self,
+        path: str,
+        stamp: Optional[Stamp],
+        assets: List[Dict],
+        files: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        """Store the parsed assets and file stamps of a folder under its current stamp.
+
+        Args:
+            path (str): Folder path.
+            stamp (Optional[Stamp]): Stamp taken before the folder was listed.
+            assets (List[Dict]): Parsed assets of the folder.
+            files (Optional[Dict[str, List[int]]]): File name -> [size, mtime_ns].
+        """
+        if stamp is None:
+            return
+        data = json.dumps(assets, default=record_json_default)
+        file_data = json.dumps(files or {})
+        with self._lock:
+            self._seen.append((path, *stamp))
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO folders (path, mtime, inode, files, assets) VALUES (?, ?, ?, ?, ?)",
+                    (path, stamp[0], stamp[1], file_data, data),
+                )
+            except sqlite3.Error as exc:
+                self._warn(f"Failed to write catalog entry for {path}: {exc}")
+
+    def count_reused(self, count: int) -> None:
+        """Record file groups reused from the manifest of a changed folder."""
+        with self._lock:
+            self.reused_groups += count
+
+    def fingerprint(self) -> str:
+        """Return a digest of every folder stamp seen so far, independent of scan order."""
+        with self._lock:
+            seen = sorted(self._seen)
+        return hashlib.sha1(json.dumps(seen).encode()).hexdigest()
+
+    def get_merged(self, source_dirs: List[str], merge: bool) -> Optional[List[Dict]]:
+        """Return the cached merge result if no scanned folder has changed.
+
+        Args:
+            source_dirs (List[str]): Source directories in priority order.
+            merge (bool): Whether the assets were merged.
+
+        Returns:
+            Optional[List[Dict]]: Cached final asset list, or None if stale.
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT fingerprint, assets FROM merged WHERE sources = ?",
+                (self._sources_key(source_dirs, merge),),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to read cached merge result: {exc}")
+            return None
+        if row is None or row[0] != self.fingerprint():
+            return None
+        return asset_records(json.loads(row[1]))
+
+    def put_merged(
+        self, source_dirs: List[str], merge: bool, assets: List[Dict]
+    ) -> None:
+        """Store the final asset list for the given source directories.
+
+        Args:
+            source_dirs (List[str]): Source directories in priority order.
+            merge (bool): Whether the assets were merged.
+            assets (List[Dict]): Final asset list.
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO merged (sources, fingerprint, assets) VALUES (?, ?, ?)",
+                (
+                    self._sources_key(source_dirs, merge),
+                    self.fingerprint(),
+                    json.dumps(assets, default=record_json_default),
+                ),
+            )
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to write cached merge result: {exc}")
+
+    def close(self, source_dirs: Optional[List[str]] = None) -> None:
+        """Drop entries for folders under source_dirs that were not seen, then close.
+
+        Args:
+            source_dirs (Optional[List[str]]): Source directories scanned this run.
+        """
+        try:
+            seen = {path for path, _, _ in self._seen}
+            self._conn.execute("BEGIN")
+            for source_dir in source_dirs or []:
+                root = source_dir.rstrip(os.sep)
+                rows = self._conn.execute(
+                    "SELECT path FROM folders WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                    (root, self._escape_like(root + os.sep) + "%"),
+                ).fetchall()
+                stale = [(path,) for (path,) in rows if path not in seen]
+                self._conn.executemany("DELETE FROM folders WHERE path = ?", stale)
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to save asset catalog: {exc}")
+        finally:
+            self._conn.close()
+
+    @staticmethod
+    def _sources_key(source_dirs: List[str], merge: bool) -> str:
+        return json.dumps([merge, source_dirs])
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def _warn(self, message: str) -> None:
+        if self.logger:
+            self.logger.warning(message)
+
+
+def open_catalog(logger: Optional[Any] = None) -> Optional[AssetCatalog]:
+    """Open the default asset catalog, returning None if it cannot be used.
+
+    Args:
+        logger (Optional[Any]): Logger instance for warnings.
+
+    Returns:
+        Optional[AssetCatalog]: Open catalog, or None on failure.
+    """
+    try:
+        return AssetCatalog(logger=logger)
+    except (OSError, sqlite3.Error) as exc:
+        if logger:
+            logger.warning(f"Asset catalog unavailable, scanning without it: {exc}")
+        return None
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Tuple
 import yaml
 
 from util.logger import Logger
+from util.rate_limit import configure_rate_limits
 
 
 class Config:
@@ -49,6 +50,7 @@ class Config:
                 f"[CONFIG] Missing 'instances' key! Config keys: {list(config.keys())}\n"
             )
         self.instances_config = config.get("instances", {})
+        configure_rate_limits(self.instances_config)
 
         if self.module_name:
             self.module_config = self._config.get(self.module_name, {})
@@ -14,6 +14,9 @@ season_number_regex: Pattern = re.compile(
 # Matches the literal "Season " followed by 1–4 digits (e.g. "Season 1", "Season 12", up to "Season 9999"), capturing those digits as group 1
 season_regex: str = r"Season (\d{1,4})"
 
+# Matches "Season " followed by any number of digits anywhere in a file path, capturing the digits as group 1
+season_file_regex: Pattern = re.compile(r"Season (\d+)")
+
 # Matches strings like "E01" or "e5", capturing 1–2 digits as the episode number
 episode_regex: str = r"(?:E|e)(\d{1,2})"
 
@@ -2,8 +2,15 @@ import os
 import re
 from typing import Any, Dict, List, Optional
 
-from util.constants import prefixes, season_number_regex, suffixes
-from util.normalization import normalize_titles
+from util.constants import (
+    folder_year_regex,
+    prefixes,
+    season_file_regex,
+    season_number_regex,
+    suffixes,
+)
+from util.normalization import normalize_many, normalize_titles
+from util.records import AssetRecord
 
 
 def generate_title_variants(title: str) -> Dict[str, List[str]]:
@@ -35,7 +42,7 @@ def generate_title_variants(title: str) -> Dict[str, List[str]]:
     alternate_titles = [stripped_prefix, stripped_suffix, stripped_both]
     if not title.lower().endswith("collection"):
         alternate_titles.append(f"{title} Collection")
-    normalized_alternate_titles = [normalize_titles(alt) for alt in alternate_titles]
+    normalized_alternate_titles = normalize_many(alternate_titles)
     alternate_titles = list(dict.fromkeys(alternate_titles))
     normalized_alternate_titles = list(dict.fromkeys(normalized_alternate_titles))
     return {
@@ -51,8 +58,8 @@ def create_collection(
     files: List[str],
     parent_folder: Optional[str] = None,
     media_folder: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Construct a standardized dictionary representing a collection entry.
+) -> AssetRecord:
+    """Construct a standardized record representing a collection entry.
 
     Args:
         title (str): Display title of the collection.
@@ -62,21 +69,104 @@ def create_collection(
         parent_folder (Optional[str]): Folder containing the files.
 
     Returns:
-        Dict[str, Any]: Dictionary with metadata fields for a collection.
+        AssetRecord: Record with metadata fields for a collection.
     """
     variants = generate_title_variants(title)
-    return {
-        "type": "collections",
-        "title": title,
-        "year": None,
-        "normalized_title": normalized_title,
-        "files": [files[-1]],
-        "alternate_titles": variants["alternate_titles"],
-        "normalized_alternate_titles": variants["normalized_alternate_titles"],
-        "tmdb_id": tmdb_id,
-        "folder": parent_folder,
-        "media_folder": media_folder,
-    }
+    return AssetRecord(
+        {
+            "type": "collections",
+            "title": title,
+            "year": None,
+            "normalized_title": normalized_title,
+            "files": [files[-1]],
+            "alternate_titles": variants["alternate_titles"],
+            "normalized_alternate_titles": variants["normalized_alternate_titles"],
+            "tmdb_id": tmdb_id,
+            "folder": parent_folder,
+            "media_folder": media_folder,
+        }
+    )
+
+
+def season_mask(season_numbers: Optional[List[int]]) -> int:
+    """Pack season numbers into an int bitmap with bit N set for season N.
+
+    Args:
+        season_numbers (Optional[List[int]]): Season numbers.
+
+    Returns:
+        int: Season bitmap, 0 when there are no seasons.
+    """
+    mask = 0
+    for season in season_numbers or []:
+        mask |= 1 << season
+    return mask
+
+
+def mask_seasons(mask: int) -> List[int]:
+    """Unpack a season bitmap into sorted season numbers.
+
+    Args:
+        mask (int): Season bitmap.
+
+    Returns:
+        List[int]: Season numbers in ascending order.
+    """
+    seasons = []
+    while mask:
+        low = mask & -mask
+        seasons.append(low.bit_length() - 1)
+        mask ^= low
+    return seasons
+
+
+def get_season_mask(item: Dict[str, Any]) -> int:
+    """Return the season bitmap of an asset or media entry.
+
+    Entries built without the bitmap (e.g. loaded from an older cache) fall
+    back to packing their season_numbers, or the season_number of each of
+    their seasons.
+
+    Args:
+        item (Dict[str, Any]): Asset or media dictionary.
+
+    Returns:
+        int: Season bitmap.
+    """
+    mask = item.get("season_mask")
+    if mask is not None:
+        return mask
+    season_numbers = item.get("season_numbers")
+    if season_numbers is None:
+        season_numbers = [s["season_number"] for s in item.get("seasons") or []]
+    return season_mask(season_numbers)
+
+
+def season_files(files: List[str]) -> Dict[int, List[str]]:
+    """Map season numbers to the season poster files among an asset's files.
+
+    Only " - Season N" and " - Specials" posters count as season files;
+    series posters and other files are left out.
+
+    Args:
+        files (List[str]): Asset file paths.
+
+    Returns:
+        Dict[int, List[str]]: Season number -> files for that season.
+    """
+    by_season: Dict[int, List[str]] = {}
+    for file in files:
+        if " - Season" not in file and " - Specials" not in file:
+            continue
+        match = season_file_regex.search(file)
+        if match:
+            season = int(match.group(1))
+        elif "Specials" in file:
+            season = 0
+        else:
+            continue
+        by_season.setdefault(season, []).append(file)
+    return by_season
 
 
 def create_series(
@@ -88,8 +178,8 @@ def create_series(
     files: List[str],
     parent_folder: Optional[str] = None,
     media_folder: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Construct a standardized dictionary representing a series entry.
+) -> AssetRecord:
+    """Construct a standardized record representing a series entry.
 
     Args:
         title (str): Series title.
@@ -101,7 +191,7 @@ def create_series(
         parent_folder (Optional[str]): Folder containing the files.
 
     Returns:
-        Dict[str, Any]: Dictionary with metadata fields for a series.
+        AssetRecord: Record with metadata fields for a series.
     """
     season_numbers_dict = {}
     series_poster = None
@@ -120,18 +210,21 @@ def create_series(
     final_files = list(season_numbers_dict.values())
     if series_poster:
         final_files.append(series_poster)
-    return {
-        "type": "series",
-        "title": title,
-        "year": year,
-        "tvdb_id": tvdb_id,
-        "imdb_id": imdb_id,
-        "normalized_title": normalized_title,
-        "files": final_files,
-        "season_numbers": season_numbers,
-        "folder": parent_folder,
-        "media_folder": media_folder,
-    }
+    return AssetRecord(
+        {
+            "type": "series",
+            "title": title,
+            "year": year,
+            "tvdb_id": tvdb_id,
+            "imdb_id": imdb_id,
+            "normalized_title": normalized_title,
+            "files": final_files,
+            "season_numbers": season_numbers,
+            "season_mask": season_mask(season_numbers),
+            "folder": parent_folder,
+            "media_folder": media_folder,
+        }
+    )
 
 
 def create_movie(
@@ -143,8 +236,8 @@ def create_movie(
     files: List[str],
     parent_folder: Optional[str] = None,
     media_folder: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Construct a standardized dictionary representing a movie entry.
+) -> AssetRecord:
+    """Construct a standardized record representing a movie entry.
 
     Args:
         title (str): Movie title.
@@ -156,16 +249,60 @@ def create_movie(
         parent_folder (Optional[str]): Folder containing the files.
 
     Returns:
-        Dict[str, Any]: Dictionary with metadata fields for a movie.
+        AssetRecord: Record with metadata fields for a movie.
     """
+    return AssetRecord(
+        {
+            "type": "movies",
+            "title": title,
+            "year": year,
+            "tmdb_id": tmdb_id,
+            "imdb_id": imdb_id,
+            "normalized_title": normalized_title,
+            "files": [files[-1]],
+            "folder": parent_folder,
+            "media_folder": media_folder,
+        }
+    )
+
+
+def folder_fields(folder: Optional[str]) -> Dict[str, Any]:
+    """Parse folder_title, folder_year and normalized_folder_title from a folder.
+
+    All three are None when the folder name is not "Title (YYYY)".
+
+    Args:
+        folder (Optional[str]): Media folder path or name.
+
+    Returns:
+        Dict[str, Any]: The three folder keys.
+    """
+    folder_title = folder_year = normalized_folder_title = None
+    if folder:
+        match = folder_year_regex.search(os.path.basename(folder))
+        if match:
+            folder_title, year = match.groups()
+            folder_year = int(year) if year else None
+            normalized_folder_title = normalize_titles(folder_title)
     return {
-        "type": "movies",
-        "title": title,
-        "year": year,
-        "tmdb_id": tmdb_id,
-        "imdb_id": imdb_id,
-        "normalized_title": normalized_title,
-        "files": [files[-1]],
-        "folder": parent_folder,
-        "media_folder": media_folder,
+        "folder_title": folder_title,
+        "folder_year": folder_year,
+        "normalized_folder_title": normalized_folder_title,
     }
+
+
+def prepare_media(media: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the derived keys matching relies on, once per media entry.
+
+    Sets the folder_fields of the media folder name. Calling it again on a
+    prepared entry is a no-op.
+
+    Args:
+        media (Dict[str, Any]): Media dictionary, updated in place.
+
+    Returns:
+        Dict[str, Any]: The same media dictionary.
+    """
+    if "normalized_folder_title" not in media:
+        media.update(folder_fields(media.get("folder")))
+    return media
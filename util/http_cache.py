@@ -0,0 +1,229 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+# Bumped whenever the table layout changes
+schema_version: int = 1
+
+# Seconds a cached GET response is served without contacting the server, by
+# endpoint path. Endpoints not listed here are never cached.
+endpoint_ttls: Dict[str, int] = {
+    "/api/v3/movie": 300,
+    "/api/v3/series": 300,
+    "/api/v3/episode": 300,
+    "/api/v3/tag": 3600,
+    "/api/v3/qualityprofile": 3600,
+}
+
+# Upper bound on the compressed size of all cached responses
+default_max_bytes: int = 256 * 1024 * 1024
+
+
+def default_http_cache_path() -> str:
+    """Return the path of the HTTP cache database inside the config directory."""
+    from util.config import config_dir
+
+    cache_dir = os.path.join(str(config_dir), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "http_cache.db")
+
+
+class HttpCache:
+    """Persistent SQLite cache of ARR GET responses.
+
+    Responses are keyed by their full URL (instance URL, endpoint and query)
+    and stored zlib-compressed with the server's ETag and Last-Modified
+    validators. A response younger than its endpoint TTL is served as is; an
+    older one is revalidated with a conditional request when validators are
+    known. The least recently used responses are evicted once the total size
+    exceeds max_bytes. The connection is shared by the client's worker
+    threads, so every access is serialized on an internal lock.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = default_max_bytes,
+        logger: Optional[Any] = None,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Args:
+            path (Optional[str]): Database path, defaults to default_http_cache_path().
+            max_bytes (int): Maximum total compressed size of cached responses.
+            logger (Optional[Any]): Logger instance for warnings.
+        """
+        self.path = path or default_http_cache_path()
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != schema_version:
+            self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(f"PRAGMA user_version = {schema_version}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                base TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                used_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    def ttl_for(url: str) -> Optional[int]:
+        """Return the TTL of an endpoint, or None if it is not cacheable."""
+        return endpoint_ttls.get(urlsplit(url).path.rstrip("/"))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response of a URL.
+
+        Args:
+            url (str): Request URL.
+
+        Returns:
+            Optional[Dict[str, Any]]: body, etag, last_modified and fresh (whether
+                it is still within its TTL), or None if not cached.
+        """
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                    (url,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to read HTTP cache: {exc}")
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        body, etag, last_modified, stored_at = row
+        fresh = time.time() - stored_at < ttl
+        if fresh:
+            self.hits += 1
+            self._touch(url, refresh=False)
+        return {
+            "body": zlib.decompress(body).decode(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": fresh,
+        }
+
+    def put(
+        self,
+        url: str,
+        base: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response, evicting old ones if the cache grows too large.
+
+        Args:
+            url (str): Request URL.
+            base (str): Instance URL the response belongs to.
+            body (str): Response body.
+            etag (Optional[str]): ETag header of the response.
+            last_modified (Optional[str]): Last-Modified header of the response.
+        """
+        data = zlib.compress(body.encode())
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, base, data, etag, last_modified, now, now, len(data)),
+                )
+                self._evict()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to update HTTP cache: {exc}")
+
+    def revalidate(self, url: str) -> None:
+        """Mark a response confirmed unchanged by the server (HTTP 304)."""
+        self.revalidated += 1
+        self._touch(url, refresh=True)
+
+    def invalidate(self, base: str) -> None:
+        """Drop every cached response of an instance, e.g. after it was modified."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE base = ?", (base,))
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to update HTTP cache: {exc}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _touch(self, url: str, refresh: bool) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                if refresh:
+                    self._conn.execute(
+                        "UPDATE responses SET stored_at = ?, used_at = ? WHERE url = ?",
+                        (now, now, url),
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE responses SET used_at = ? WHERE url = ?", (now, url)
+                    )
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to update HTTP cache: {exc}")
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY used_at"
+        ).fetchall()
+        stale = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", stale)
+
+    def _warn(self, message: str) -> None:
+        if self.logger:
+            self.logger.warning(message)
+
+
+def open_http_cache(logger: Optional[Any] = None) -> Optional[HttpCache]:
+    """Open the default HTTP cache, returning None if it cannot be used.
+
+    Args:
+        logger (Optional[Any]): Logger instance for warnings.
+
+    Returns:
+        Optional[HttpCache]: Open cache, or None on failure.
+    """
+    try:
+        return HttpCache(logger=logger)
+    except (OSError, sqlite3.Error) as exc:
+        if logger:
+            logger.warning(f"HTTP cache unavailable, requesting without it: {exc}")
+        return None
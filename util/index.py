@@ -1,59 +1,218 @@
-from typing import Any, Dict, List, Optional
+import math
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
-from util.constants import common_words
-from util.normalization import normalize_titles
+from util.constants import id_content_regex, year_regex
+from util.normalization import (
+    common_words_lower,
+    loose_string,
+    normalize_many,
+    normalize_titles,
+    remove_common_words,
+)
 
 Asset = Dict[str, Any]
-PrefixIndex = Dict[str, List[Asset]]
 
 prefix_length: int = 3
 
+# Upper bound on the number of candidates returned for a single title query
+max_candidates: int = 100
 
-def create_new_empty_index() -> PrefixIndex:
+
+class AssetIndex:
+    """Search index over assets.
+
+    Title lookups go through three inverted maps (full normalized title, word
+    tokens and token prefixes). External IDs live in their own typed maps so an
+    ID lookup is a single hash probe that never shares a table with title keys.
+    Every map stores a list per key, so assets sharing an ID are all kept.
+
+    The assets list doubles as a registry: each asset is stored once and its
+    position is a stable integer asset ID, so callers can track assets in ID
+    sets instead of building keys from their contents.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.assets: List[Asset] = []
+        self.asset_ids: Dict[int, int] = {}
+        self.titles: Dict[str, List[Asset]] = {}
+        self.tokens: Dict[str, List[Asset]] = {}
+        self.prefixes: Dict[str, List[Asset]] = {}
+        self.tmdb: Dict[int, List[Asset]] = {}
+        self.tvdb: Dict[int, List[Asset]] = {}
+        self.imdb: Dict[str, List[Asset]] = {}
+        self.asset_tokens: Dict[int, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def register(self, asset: Asset) -> int:
+        """Add an asset to the registry unless already present.
+
+        Args:
+            asset (Asset): Asset to register.
+
+        Returns:
+            int: The asset's registry ID.
+        """
+        asset_id = self.asset_ids.get(id(asset))
+        if asset_id is None:
+            asset_id = len(self.assets)
+            self.assets.append(asset)
+            self.asset_ids[id(asset)] = asset_id
+        return asset_id
+
+    def asset_id(self, asset: Asset) -> int:
+        """Return the registry ID of an indexed asset.
+
+        Args:
+            asset (Asset): Asset previously passed to register().
+
+        Returns:
+            int: The asset's position in assets.
+        """
+        return self.asset_ids[id(asset)]
+
+    def add_ids(self, asset: Asset) -> None:
+        """Index the asset's TMDB, TVDB and IMDb IDs, skipping ones already indexed.
+
+        Args:
+            asset (Asset): Asset to index.
+        """
+        for id_map, value in (
+            (self.tmdb, to_int_id(asset.get("tmdb_id"))),
+            (self.tvdb, to_int_id(asset.get("tvdb_id"))),
+            (self.imdb, to_imdb_id(asset.get("imdb_id"))),
+        ):
+            if value is None:
+                continue
+            bucket = id_map.setdefault(value, [])
+            if not any(existing is asset for existing in bucket):
+                bucket.append(asset)
+
+    def lookup_ids(
+        self,
+        tmdb_id: Optional[int] = None,
+        tvdb_id: Optional[int] = None,
+        imdb_id: Optional[str] = None,
+    ) -> List[Asset]:
+        """Return the assets indexed under the first ID given (TMDB, TVDB, then IMDb).
+
+        Args:
+            tmdb_id (Optional[int]): TMDB ID.
+            tvdb_id (Optional[int]): TVDB ID.
+            imdb_id (Optional[str]): IMDb ID.
+
+        Returns:
+            List[Asset]: Matching assets, empty if none.
+        """
+        if tmdb_id is not None:
+            return list(self.tmdb.get(to_int_id(tmdb_id), []))
+        if tvdb_id is not None:
+            return list(self.tvdb.get(to_int_id(tvdb_id), []))
+        if imdb_id is not None:
+            return list(self.imdb.get(to_imdb_id(imdb_id), []))
+        return []
+
+    def to_dict(self) -> Dict[str, Dict[str, List[str]]]:
+        """Return a JSON-serializable view of the index for debug output.
+
+        Returns:
+            Dict[str, Dict[str, List[str]]]: Map name -> key -> asset titles.
+        """
+
+        def titles_of(mapping: Dict[Any, List[Asset]]) -> Dict[str, List[str]]:
+            return {
+                str(key): [asset.get("title") for asset in bucket]
+                for key, bucket in mapping.items()
+            }
+
+        return {
+            "titles": titles_of(self.titles),
+            "tokens": titles_of(self.tokens),
+            "prefixes": titles_of(self.prefixes),
+            "tmdb": titles_of(self.tmdb),
+            "tvdb": titles_of(self.tvdb),
+            "imdb": titles_of(self.imdb),
+        }
+
+
+def to_int_id(value: Any) -> Optional[int]:
+    """Coerce a TMDB/TVDB ID to a positive int, or None if it is not one."""
+    if isinstance(value, int):
+        return value if value > 0 else None
+    if isinstance(value, str) and value.isdigit() and int(value) > 0:
+        return int(value)
+    return None
+
+
+def to_imdb_id(value: Any) -> Optional[str]:
+    """Return the IMDb ID if it looks like one ("tt" prefix), otherwise None."""
+    if isinstance(value, str) and value.startswith("tt"):
+        return value
+    return None
+
+
+def create_new_empty_index() -> AssetIndex:
     """Create and return an empty search index structure.
 
     Returns:
-        PrefixIndex: An empty dictionary.
+        AssetIndex: An empty index.
+    """
+    return AssetIndex()
+
+
+def tokenize_title(title: str) -> List[str]:
+    """Split a title into unique normalized word tokens.
+
+    Year tags and ID blocks are stripped from the whole title before splitting so
+    they never become tokens, and common filler words are dropped.
+
+    Args:
+        title (str): Title to tokenize.
+
+    Returns:
+        List[str]: Normalized tokens in title order.
     """
-    return {}
+    title = id_content_regex.sub("", year_regex.sub("", title))
+    tokens = dict.fromkeys(normalize_many(title.split()))
+    return [token for token in tokens if token and token not in common_words_lower]
 
 
-def remove_common_words(text: str) -> str:
-    """Remove any word that matches an entry in common_words (case-insensitive).
+def normalize_index_key(title: str) -> str:
+    """Normalize a title into its full-title index key.
 
-    Only removes complete words, does not touch substrings or special characters.
+    Common words are dropped unless the title consists of nothing else.
 
     Args:
-        text (str): Input text to filter.
+        title (str): Title to normalize.
 
     Returns:
-        str: Text with common words removed.
+        str: Normalized key.
     """
-    words = text.split()
-    filtered = [
-        word for word in words if word.lower() not in {w.lower() for w in common_words}
-    ]
-    return " ".join(filtered)
+    return normalize_titles(remove_common_words(title)) or normalize_titles(title)
 
 
 def build_search_index(
-    prefix_index: PrefixIndex,
+    prefix_index: AssetIndex,
     title: str,
     asset: Asset,
     logger: Optional[Any],
     debug_items: Optional[List[str]] = None,
 ) -> None:
-    """Populate the search index with normalized forms of the asset title and TMDB/TVDB IDs.
+    """Populate the search index with the asset's normalized title, word tokens,
+    token prefixes and TMDB/TVDB/IMDb IDs.
+
+    Collections are additionally indexed by their normalized alternate titles.
 
     Args:
-        prefix_index (PrefixIndex): The overall index to update.
+        prefix_index (AssetIndex): The overall index to update.
         title (str): Original title to normalize and index.
         asset (Asset): Dictionary containing asset metadata.
         logger (Optional[Any]): Logger instance for debug output.
         debug_items (Optional[List[str]]): List of normalized titles to enable debug logging on.
     """
-    title = remove_common_words(title)
-    processed = normalize_titles(title)
+    processed = normalize_index_key(title)
     debug_build_index = bool(
         debug_items and len(debug_items) > 0 and processed in debug_items
     )
@@ -63,78 +222,317 @@ def build_search_index(
         logger.info(processed)
         logger.info(asset)
 
-    if asset.get("tmdb_id"):
-        key = f"tmdb:{asset['tmdb_id']}"
-        prefix_index.setdefault(key, []).append(asset)
-        if debug_build_index and logger:
-            logger.info(f"Indexed by {key}")
-
-    if asset.get("tvdb_id"):
-        key = f"tvdb:{asset['tvdb_id']}"
-        prefix_index.setdefault(key, []).append(asset)
-        if debug_build_index and logger:
-            logger.info(f"Indexed by {key}")
+    prefix_index.register(asset)
+    prefix_index.add_ids(asset)
 
-    words = processed.split()
+    tokens = tokenize_title(title)
+    prefix_index.asset_tokens[id(asset)] = frozenset(tokens)
+    titles = [processed, normalize_titles(title)]
+    titles.extend(t for t in asset.get("normalized_alternate_titles") or [] if t)
+    prefixes = [processed[:prefix_length]] if processed else []
+    prefixes.extend(t[:prefix_length] for t in tokens if len(t) > prefix_length)
     if debug_build_index and logger:
-        logger.info(words)
+        logger.info(f"Titles: {titles} | Tokens: {tokens} | Prefixes: {prefixes}")
 
-    for word in words:
-        prefix_index.setdefault(word, []).append(asset)
-        if len(word) > prefix_length:
-            prefix = word[:prefix_length]
-            if debug_build_index and logger:
-                logger.info(prefix)
-            prefix_index.setdefault(prefix, []).append(asset)
-        break
+    for mapping, keys in (
+        (prefix_index.titles, titles),
+        (prefix_index.tokens, tokens),
+        (prefix_index.prefixes, prefixes),
+    ):
+        for key in dict.fromkeys(keys):
+            if key:
+                mapping.setdefault(key, []).append(asset)
+
+
+def title_matches(prefix_index: AssetIndex, title: str) -> Dict[int, Asset]:
+    """Return the assets whose indexed full title equals the query, in index order.
+
+    These lead every title search result, ahead of token and prefix candidates.
+
+    Args:
+        prefix_index (AssetIndex): The populated search index.
+        title (str): The title to search for.
+
+    Returns:
+        Dict[int, Asset]: id(asset) -> asset, in the order search_matches ranks them.
+    """
+    ranked: Dict[int, Asset] = {}
+    for key in dict.fromkeys((normalize_index_key(title), normalize_titles(title))):
+        for asset in prefix_index.titles.get(key, []):
+            ranked.setdefault(id(asset), asset)
+    return ranked
 
 
 def search_matches(
-    prefix_index: PrefixIndex,
+    prefix_index: AssetIndex,
     title: str,
     logger: Optional[Any],
     tmdb_id: Optional[int] = None,
     tvdb_id: Optional[int] = None,
+    imdb_id: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> List[Asset]:
     """Search for matching assets in the index.
 
-    If a TMDB or TVDB ID is provided, search strictly by that ID and return results.
-    Only perform title-based search if neither ID is provided.
+    If a TMDB, TVDB or IMDb ID is provided, search strictly by that ID and return
+    results. Only perform title-based search if no ID is provided.
+
+    Title search ranks candidates instead of returning a whole bucket: assets whose
+    full title equals the query, with or without common words, come first. They
+    are followed by the best tier of token candidates, i.e. only the assets sharing
+    as many word tokens with the query as the best one does. Prefix buckets are
+    only consulted when no full title or token matched.
 
     Args:
-        prefix_index (PrefixIndex): The populated search index.
+        prefix_index (AssetIndex): The populated search index.
         title (str): The title to search for.
         logger (Optional[Any]): Logger instance for optional logging.
         tmdb_id (Optional[int]): TMDB ID for direct lookup.
         tvdb_id (Optional[int]): TVDB ID for direct lookup.
+        imdb_id (Optional[str]): IMDb ID for direct lookup.
+        limit (Optional[int]): Maximum number of candidates to return, defaults to
+            max_candidates.
 
     Returns:
         List[Asset]: List of matching assets from the index.
     """
-    if tmdb_id is not None:
-        key = f"tmdb:{tmdb_id}"
-        filtered_assets = [
-            a for a in prefix_index.get(key, []) if a.get("tmdb_id") == tmdb_id
-        ]
-        return filtered_assets
-    if tvdb_id is not None:
-        key = f"tvdb:{tvdb_id}"
-        filtered_assets = [
-            a for a in prefix_index.get(key, []) if a.get("tvdb_id") == tvdb_id
+    if tmdb_id is not None or tvdb_id is not None or imdb_id is not None:
+        return prefix_index.lookup_ids(tmdb_id, tvdb_id, imdb_id)
+
+    limit = limit or max_candidates
+    processed_title = normalize_index_key(title)
+    tokens = tokenize_title(title)
+
+    ranked = title_matches(prefix_index, title)
+
+    postings = sorted(
+        (prefix_index.tokens[token] for token in tokens if token in prefix_index.tokens),
+        key=len,
+    )
+    if postings:
+        # Only posting lists no longer than the limit are walked (or the rarest one
+        # if every token is common); candidates are then ranked by how many query
+        # tokens they share and only the best-scoring tier is kept.
+        walked = [posting for posting in postings if len(posting) <= limit]
+        query_tokens = frozenset(tokens)
+        scores: Dict[int, int] = {}
+        pool: Dict[int, Asset] = {}
+        for posting in walked or postings[:1]:
+            for asset in posting:
+                key = id(asset)
+                if key not in pool:
+                    pool[key] = asset
+                    scores[key] = len(
+                        query_tokens & prefix_index.asset_tokens.get(key, frozenset())
+                    )
+        best = max(scores.values())
+        for key, asset in pool.items():
+            if len(ranked) >= limit:
+                break
+            if scores[key] == best:
+                ranked.setdefault(key, asset)
+
+    if not ranked:
+        prefixes = [processed_title[:prefix_length]] + [
+            token[:prefix_length] for token in tokens if len(token) > prefix_length
         ]
-        return filtered_assets
-
-    title = remove_common_words(title)
-    processed_title = normalize_titles(title)
-    words = processed_title.split()
-    matches: List[Asset] = []
-    for word in words:
-        if len(word) > prefix_length:
-            prefix = word[:prefix_length]
-            if prefix in prefix_index:
-                matches.extend(prefix_index[prefix])
-                return matches
-        if word in prefix_index:
-            matches.extend(prefix_index[word])
-        break
-    return matches
+        buckets = sorted(
+            (
+                prefix_index.prefixes[prefix]
+                for prefix in dict.fromkeys(prefixes)
+                if prefix and prefix in prefix_index.prefixes
+            ),
+            key=len,
+        )
+        for bucket in buckets:
+            for asset in bucket:
+                if len(ranked) >= limit:
+                    break
+                ranked.setdefault(id(asset), asset)
+
+    return list(ranked.values())[:limit]
+
+
+def title_trigrams(text: str) -> FrozenSet[str]:
+    """Return the set of character trigrams of a normalized title, padded at both ends.
+
+    Args:
+        text (str): Normalized title.
+
+    Returns:
+        FrozenSet[str]: Trigrams of the title, empty for an empty title.
+    """
+    if not text:
+        return frozenset()
+    padded = f"^{text}$"
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """Character-trigram index for approximate title lookups.
+
+    Similarity is the Jaccard coefficient of the two trigram sets. A query only
+    walks the posting lists of its rarest trigrams: with threshold t, any title
+    reaching t must share at least ceil(t * |q|) trigrams with the query, so it
+    has to contain one of the |q| - ceil(t * |q|) + 1 rarest ones.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty trigram index."""
+        self.postings: Dict[str, List[int]] = {}
+        self.entries: List[Tuple[FrozenSet[str], Asset]] = []
+
+    def add(self, title: str, asset: Asset) -> None:
+        """Index one normalized title of an asset.
+
+        Args:
+            title (str): Normalized title.
+            asset (Asset): Asset the title belongs to.
+        """
+        grams = title_trigrams(title)
+        if not grams:
+            return
+        entry_id = len(self.entries)
+        self.entries.append((grams, asset))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(entry_id)
+
+    def search(
+        self, title: str, threshold: float, limit: int = 10
+    ) -> List[Tuple[float, Asset]]:
+        """Return assets whose title similarity to the query reaches the threshold.
+
+        Args:
+            title (str): Normalized query title.
+            threshold (float): Minimum Jaccard similarity, between 0 and 1.
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[Tuple[float, Asset]]: (score, asset) pairs, best first; an asset
+                indexed under several titles appears once with its best score.
+        """
+        query = title_trigrams(title)
+        if not query or threshold <= 0:
+            return []
+        min_overlap = math.ceil(threshold * len(query))
+        grams = sorted(
+            (gram for gram in query if gram in self.postings),
+            key=lambda gram: len(self.postings[gram]),
+        )
+        probe = grams[: len(query) - min_overlap + 1]
+        seen = set()
+        best: Dict[int, Tuple[float, Asset]] = {}
+        for gram in probe:
+            for entry_id in self.postings[gram]:
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                entry_grams, asset = self.entries[entry_id]
+                if not (
+                    threshold * len(query) <= len(entry_grams)
+                    and threshold * len(entry_grams) <= len(query)
+                ):
+                    continue
+                overlap = len(query & entry_grams)
+                score = overlap / (len(query) + len(entry_grams) - overlap)
+                if score >= threshold and score > best.get(id(asset), (0.0,))[0]:
+                    best[id(asset)] = (score, asset)
+        return sorted(best.values(), key=lambda pair: pair[0], reverse=True)[:limit]
+
+
+def build_trigram_index(assets: List[Asset]) -> TrigramIndex:
+    """Build a trigram index over each asset's normalized title and alternate titles.
+
+    Args:
+        assets (List[Asset]): Assets to index.
+
+    Returns:
+        TrigramIndex: The populated index.
+    """
+    trigram_index = TrigramIndex()
+    for asset in assets:
+        titles = [asset.get("normalized_title")]
+        titles.extend(asset.get("normalized_alternate_titles") or [])
+        for title in dict.fromkeys(t for t in titles if t):
+            trigram_index.add(title, asset)
+    return trigram_index
+
+
+# Join table name -> the keys an asset is filed under in that table
+join_key_functions: Dict[str, Callable[[Asset], List[Any]]] = {
+    "title": lambda asset: [asset.get("title")],
+    "normalized_title": lambda asset: [asset.get("normalized_title")],
+    "loose_title": lambda asset: [loose_string(asset.get("title", ""))],
+    "loose_normalized_title": lambda asset: [
+        loose_string(asset.get("normalized_title", ""))
+    ],
+    "alternate_titles": lambda asset: asset.get("alternate_titles") or [],
+    "normalized_alternate_titles": lambda asset: asset.get(
+        "normalized_alternate_titles"
+    )
+    or [],
+    "folder": lambda asset: [asset.get("folder")],
+    "media_folder": lambda asset: [asset.get("media_folder")],
+    "tvdb_id": lambda asset: [asset.get("tvdb_id")] if asset.get("tvdb_id") else [],
+    "tmdb_id": lambda asset: [asset.get("tmdb_id")] if asset.get("tmdb_id") else [],
+    "imdb_id": lambda asset: [asset.get("imdb_id")] if asset.get("imdb_id") else [],
+}
+
+
+class JoinIndex:
+    """Exact-key hash tables over assets for bulk matching.
+
+    Each table files an asset under the raw value of one field it is compared on
+    by the match criteria, so that probing a table with the media side of a
+    criterion returns exactly the assets for which that criterion holds. Missing
+    scalar fields are filed under None, as equality against a missing media
+    field holds for them too.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty join index."""
+        self.tables: Dict[str, Dict[Any, List[Asset]]] = {
+            name: {} for name in join_key_functions
+        }
+
+    def add(self, asset: Asset) -> None:
+        """File an asset under each of its join keys.
+
+        Args:
+            asset (Asset): Asset to index.
+        """
+        for name, keys_of in join_key_functions.items():
+            table = self.tables[name]
+            for key in dict.fromkeys(keys_of(asset)):
+                table.setdefault(key, []).append(asset)
+
+    def probe(self, name: str, keys: Iterable[Any]) -> List[Asset]:
+        """Return the assets filed under any of the keys in one table.
+
+        Args:
+            name (str): Table name, one of join_key_functions.
+            keys (Iterable[Any]): Keys to look up.
+
+        Returns:
+            List[Asset]: Matching assets, possibly with repeats across keys.
+        """
+        table = self.tables[name]
+        found: List[Asset] = []
+        for key in keys:
+            found.extend(table.get(key, ()))
+        return found
+
+
+def build_join_index(assets: List[Asset]) -> JoinIndex:
+    """Build join tables over the given assets.
+
+    Args:
+        assets (List[Asset]): Assets to index.
+
+    Returns:
+        JoinIndex: The populated index.
+    """
+    join_index = JoinIndex()
+    for asset in assets:
+        join_index.add(asset)
+    return join_index
@@ -0,0 +1,91 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Union
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """
+    Decode the items of a top-level JSON array as its chunks arrive.
+
+    Only the undecoded tail of the stream is buffered, so memory stays at
+    about twice the size of one item regardless of the array's length.
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): UTF-8 bytes or text of the document,
+            e.g. requests' response.iter_content().
+
+    Yields:
+        Any: Each array item, in order.
+
+    Raises:
+        ValueError: If the document is not a well-formed JSON array.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    source = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(min_size: int = 1) -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        parts = []
+        size = 0
+        while size < min_size and not eof:
+            chunk = next(source, None)
+            if chunk is None:
+                eof = True
+                text = utf8.decode(b"", final=True)
+            else:
+                text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+            parts.append(text)
+            size += len(text)
+        buffer = buffer[pos:] + "".join(parts)
+        pos = 0
+        return True
+
+    def skip_whitespace() -> bool:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _whitespace:
+                pos += 1
+            if pos < len(buffer):
+                return True
+            if not fill():
+                return False
+
+    if not skip_whitespace() or buffer[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if not skip_whitespace():
+        raise ValueError("Unterminated JSON array")
+    if buffer[pos] == "]":
+        return
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unterminated JSON array")
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                item, end = None, -1
+            # A value ending exactly at the buffer's end may be cut short (e.g. a number)
+            if end != -1 and (end < len(buffer) or eof):
+                break
+            # Double the buffered tail before retrying, so an item spanning many
+            # chunks is decoded a logarithmic rather than linear number of times
+            if not fill(max(1, len(buffer) - pos)):
+                raise ValueError("Unterminated JSON array")
+        pos = end
+        yield item
+        if not skip_whitespace():
+            raise ValueError("Unterminated JSON array")
+        if buffer[pos] == "]":
+            return
+        if buffer[pos] != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {buffer[pos]!r}")
+        pos += 1
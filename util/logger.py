@@ -7,7 +7,8 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
-from util.utility import create_bar
+from util.rate_limit import pop_request_counts
+from util.utility import create_bar, create_table
 from util.version import get_version
 
 
@@ -75,10 +76,23 @@ class Logger:
         )
 
     def log_outro(self) -> None:
-        """Log runtime duration since start_time."""
+        """Log retried/throttled ARR requests and runtime duration since start_time."""
         start = getattr(self, "start_time", None)
         if start is None:
             return
+        request_counts = pop_request_counts()
+        if request_counts:
+            table = [["Instance", "Retries", "Throttled", "Throttle Wait"]]
+            for url, counts in request_counts.items():
+                table.append(
+                    [
+                        url,
+                        int(counts["retries"]),
+                        int(counts["throttled"]),
+                        f"{counts['throttle_wait']:.1f}s",
+                    ]
+                )
+            self._logger.info(create_table(table))
         duration = datetime.now() - start
         hours, remainder = divmod(duration.total_seconds(), 3600)
         minutes, seconds = divmod(remainder, 60)
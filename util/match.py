@@ -1,20 +1,91 @@
+import logging
+import math
+import multiprocessing
 import os
-import re
 import time
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from util.constants import folder_year_regex, season_pattern
-from util.index import search_matches
-from util.normalization import normalize_titles
+from util.constants import season_pattern
+from util.construct import folder_fields, get_season_mask, prepare_media, season_files
+from util.index import (
+    AssetIndex,
+    JoinIndex,
+    TrigramIndex,
+    build_join_index,
+    build_trigram_index,
+    max_candidates,
+    search_matches,
+    title_matches,
+)
+from util.match_cache import MatchCache, open_match_cache
+from util.match_stats import MatchStats
+from util.normalization import log_normalization_stats, loose_string
 from util.utility import progress
 
 
 def compare_strings(string1: str, string2: str) -> bool:
     """Loosely compare two strings by removing non-alphanumeric characters and comparing lowercase."""
-    string1 = re.sub(r"\W+", "", string1)
-    string2 = re.sub(r"\W+", "", string2)
-    return string1.lower() == string2.lower()
+    return loose_string(string1) == loose_string(string2)
+
+
+def years_match(asset: Dict[str, Any], media: Dict[str, Any]) -> bool:
+    """Check the asset year against the media's year, secondary year and folder year.
+
+    Args:
+      asset: Asset dictionary.
+      media: Media dictionary.
+
+    Returns:
+      True if the years agree, or neither side has a year.
+    """
+    asset_year = asset.get("year")
+    media_years = [media.get(key) for key in ["year", "secondary_year", "folder_year"]]
+    if asset_year is None and all(year is None for year in media_years):
+        return True
+    return any(asset_year == year for year in media_years if year is not None)
+
+
+def fuzzy_match(
+    trigram_index: TrigramIndex,
+    media: Dict[str, Any],
+    asset_type: str,
+    threshold: float,
+) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Find the closest asset by trigram similarity of normalized titles.
+
+    Only assets of the same type whose year agrees are accepted. Assets carrying
+    their own IDs are skipped when the media has IDs too, since those pairs are
+    decided by ID alone.
+
+    Args:
+      trigram_index: Trigram index over the assets.
+      media: Media dictionary.
+      asset_type: Asset type being matched.
+      threshold: Minimum similarity, between 0 and 1.
+
+    Returns:
+      Tuple of (asset, score) for the best candidate, or (None, 0.0).
+    """
+    media_has_ids = any(media.get(key) for key in ["tmdb_id", "tvdb_id", "imdb_id"])
+    titles = [
+        media.get("normalized_title"),
+        *(media.get("normalized_alternate_titles") or ()),
+    ]
+    best: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+    for title in dict.fromkeys(t for t in titles if t):
+        for score, asset in trigram_index.search(title, threshold):
+            if score <= best[1]:
+                break
+            if asset.get("type") != asset_type or not years_match(asset, media):
+                continue
+            if media_has_ids and any(
+                asset.get(key) for key in ["tmdb_id", "tvdb_id", "imdb_id"]
+            ):
+                continue
+            best = (asset, score)
+            break
+    return best
 
 
 def is_match(
@@ -24,6 +95,12 @@ def is_match(
 ) -> Tuple[bool, str]:
     """Determine if a media entry and an asset match based on ID, title, and year heuristics.
 
+    Criteria are evaluated lazily in priority order and stop at the first one that
+    holds; the year check decides the result at that point. Media is expected to
+    have gone through prepare_media. Other entries, such as the assets
+    merge_assets compares with each other, get their folder fields computed on
+    a copy so that nothing is written back to them.
+
     Args:
       asset: Asset dictionary.
       media: Media dictionary.
@@ -32,155 +109,685 @@ def is_match(
     Returns:
       Tuple of (True, reason) if matched, else (False, "").
     """
-    if media.get("folder"):
-        folder_base_name = os.path.basename(media["folder"])
-        match = re.search(folder_year_regex, folder_base_name)
-        if match:
-            media["folder_title"], media["folder_year"] = match.groups()
-            media["folder_year"] = (
-                int(media["folder_year"]) if media["folder_year"] else None
-            )
-            media["normalized_folder_title"] = normalize_titles(media["folder_title"])
-
-    def year_matches() -> bool:
-        asset_year = asset.get("year")
-        media_years = [
-            media.get(key) for key in ["year", "secondary_year", "folder_year"]
-        ]
-        if asset_year is None and all(year is None for year in media_years):
-            return True
-        return any(asset_year == year for year in media_years if year is not None)
-
-    def has_any_valid_id(d: Dict[str, Any]) -> bool:
-        for k in ["tmdb_id", "tvdb_id", "imdb_id"]:
-            v = d.get(k)
-            if k == "imdb_id":
-                if v and isinstance(v, str) and v.startswith("tt"):
-                    return True
-            else:
-                if v and str(v).isdigit() and int(v) > 0:
-                    return True
-        return False
-
-    has_asset_ids = has_any_valid_id(asset)
-    has_media_ids = has_any_valid_id(media)
+    if "normalized_folder_title" not in media:
+        media = {**media, **folder_fields(media.get("folder"))}
 
     if strict_folder_match:
-        match_criteria = [
-            (
-                asset.get("media_folder") == media.get("folder"),
-                "Asset folder equals media folder (media_folder)",
-            ),
-            (
-                asset.get("folder") == media.get("folder"),
-                "Asset folder equals media folder (folder)",
-            ),
-        ]
-        for condition, reason in match_criteria:
-            if condition and year_matches():
+        criteria = strict_folder_criteria
+    elif has_any_valid_id(asset) and has_any_valid_id(media):
+        criteria = id_match_criteria
+    else:
+        criteria = title_match_criteria
+    for condition, reason in criteria:
+        if condition(asset, media):
+            if criteria is id_match_criteria or years_match(asset, media):
                 return True, reason
-        return False, ""
-
-    if has_asset_ids and has_media_ids:
-        id_match_criteria = [
-            (
-                media.get("tvdb_id")
-                and asset.get("tvdb_id")
-                and media["tvdb_id"] == asset["tvdb_id"],
-                "ID match: tvdb_id",
-            ),
-            (
-                media.get("tmdb_id")
-                and asset.get("tmdb_id")
-                and media["tmdb_id"] == asset["tmdb_id"],
-                "ID match: tmdb_id",
-            ),
-            (
-                media.get("imdb_id")
-                and asset.get("imdb_id")
-                and media["imdb_id"] == asset["imdb_id"],
-                "ID match: imdb_id",
-            ),
-        ]
-        for matched, reason in id_match_criteria:
-            if matched:
-                return True, reason
-        return False, ""
+            return False, ""
+    return False, ""
 
-    match_criteria = [
-        (asset.get("title") == media.get("title"), "Asset title equals media title"),
-        (
-            asset.get("title") in media.get("alternate_titles", []),
-            "Asset title found in media's alternate titles",
-        ),
-        (asset.get("title") == media.get("folder"), "Asset title equals media folder"),
-        (
-            asset.get("title") == media.get("original_title"),
-            "Asset title equals media original title",
-        ),
-        (
-            asset.get("normalized_title") == media.get("normalized_title"),
-            "Asset normalized title equals media normalized title",
-        ),
-        (
-            asset.get("normalized_title") == media.get("normalized_folder"),
-            "Asset normalized title equals media folder normalized",
-        ),
-        (
-            asset.get("normalized_title")
-            in media.get("normalized_alternate_titles", []),
-            "Asset normalized title found in media's normalized alternate titles",
-        ),
-        (
-            any(
-                assets == media.get("title")
-                for assets in asset.get("alternate_titles", [])
-            ),
-            "One of asset's alternate_titles matches media title",
-        ),
-        (
-            any(
-                assets == media.get("normalized_title")
-                for assets in asset.get("normalized_alternate_titles", [])
-            ),
-            "One of asset's normalized_alternate_titles matches media normalized title",
-        ),
-        (
-            any(
-                media_alt == asset.get("title")
-                for media_alt in media.get("alternate_titles", [])
-            ),
-            "One of media's alternate_titles matches asset title",
-        ),
-        (
-            any(
-                media_alt == asset.get("normalized_title")
-                for media_alt in media.get("normalized_alternate_titles", [])
-            ),
-            "One of media's normalized_alternate_titles matches asset normalized title",
-        ),
-        (
-            compare_strings(media.get("title", ""), asset.get("title", "")),
-            "Titles match under loose string comparison",
+
+def has_any_valid_id(d: Dict[str, Any]) -> bool:
+    """Return True if the dictionary has a positive TMDB/TVDB ID or an IMDb ID."""
+    for k in ["tmdb_id", "tvdb_id", "imdb_id"]:
+        v = d.get(k)
+        if k == "imdb_id":
+            if v and isinstance(v, str) and v.startswith("tt"):
+                return True
+        else:
+            if v and str(v).isdigit() and int(v) > 0:
+                return True
+    return False
+
+
+Criterion = Tuple[Callable[[Dict[str, Any], Dict[str, Any]], Any], str]
+
+strict_folder_criteria: List[Criterion] = [
+    (
+        lambda asset, media: asset.get("media_folder") == media.get("folder"),
+        "Asset folder equals media folder (media_folder)",
+    ),
+    (
+        lambda asset, media: asset.get("folder") == media.get("folder"),
+        "Asset folder equals media folder (folder)",
+    ),
+]
+
+id_match_criteria: List[Criterion] = [
+    (
+        lambda asset, media: media.get("tvdb_id")
+        and asset.get("tvdb_id")
+        and media["tvdb_id"] == asset["tvdb_id"],
+        "ID match: tvdb_id",
+    ),
+    (
+        lambda asset, media: media.get("tmdb_id")
+        and asset.get("tmdb_id")
+        and media["tmdb_id"] == asset["tmdb_id"],
+        "ID match: tmdb_id",
+    ),
+    (
+        lambda asset, media: media.get("imdb_id")
+        and asset.get("imdb_id")
+        and media["imdb_id"] == asset["imdb_id"],
+        "ID match: imdb_id",
+    ),
+]
+
+title_match_criteria: List[Criterion] = [
+    (
+        lambda asset, media: asset.get("title") == media.get("title"),
+        "Asset title equals media title",
+    ),
+    (
+        lambda asset, media: asset.get("title") in media.get("alternate_titles", []),
+        "Asset title found in media's alternate titles",
+    ),
+    (
+        lambda asset, media: asset.get("title") == media.get("folder"),
+        "Asset title equals media folder",
+    ),
+    (
+        lambda asset, media: asset.get("title") == media.get("original_title"),
+        "Asset title equals media original title",
+    ),
+    (
+        lambda asset, media: asset.get("normalized_title")
+        == media.get("normalized_title"),
+        "Asset normalized title equals media normalized title",
+    ),
+    (
+        lambda asset, media: asset.get("normalized_title")
+        == media.get("normalized_folder"),
+        "Asset normalized title equals media folder normalized",
+    ),
+    (
+        lambda asset, media: asset.get("normalized_title")
+        in media.get("normalized_alternate_titles", []),
+        "Asset normalized title found in media's normalized alternate titles",
+    ),
+    (
+        lambda asset, media: media.get("title") in asset.get("alternate_titles", []),
+        "One of asset's alternate_titles matches media title",
+    ),
+    (
+        lambda asset, media: media.get("normalized_title")
+        in asset.get("normalized_alternate_titles", []),
+        "One of asset's normalized_alternate_titles matches media normalized title",
+    ),
+    (
+        lambda asset, media: asset.get("title") in media.get("alternate_titles", []),
+        "One of media's alternate_titles matches asset title",
+    ),
+    (
+        lambda asset, media: asset.get("normalized_title")
+        in media.get("normalized_alternate_titles", []),
+        "One of media's normalized_alternate_titles matches asset normalized title",
+    ),
+    (
+        lambda asset, media: compare_strings(
+            media.get("title", ""), asset.get("title", "")
         ),
-        (
-            compare_strings(
-                media.get("normalized_title", ""), asset.get("normalized_title", "")
-            ),
-            "Normalized titles match under loose string comparison",
+        "Titles match under loose string comparison",
+    ),
+    (
+        lambda asset, media: compare_strings(
+            media.get("normalized_title", ""), asset.get("normalized_title", "")
         ),
+        "Normalized titles match under loose string comparison",
+    ),
+]
+
+
+def join_matches(
+    join_index: JoinIndex,
+    media: Dict[str, Any],
+    strict_folder_match: bool = False,
+) -> Dict[int, Dict[str, Any]]:
+    """Return every indexed asset that is_match would accept for the media.
+
+    Each criterion of is_match is an equality or membership test between one
+    asset field and one media field, so its matches are found by probing the
+    join table of that asset field with the media value instead of comparing
+    pairwise. The year check is then applied to the union, as is_match does.
+
+    Args:
+      join_index: Join tables over the assets.
+      media: Media dictionary.
+      strict_folder_match: Use the strict folder criteria only.
+
+    Returns:
+      Dictionary of id(asset) -> asset for the accepted assets.
+    """
+    prepare_media(media)
+    if strict_folder_match:
+        found = join_index.probe("media_folder", [media.get("folder")])
+        found += join_index.probe("folder", [media.get("folder")])
+        return {id(asset): asset for asset in found if years_match(asset, media)}
+
+    media_has_ids = has_any_valid_id(media)
+    accepted: Dict[int, Dict[str, Any]] = {}
+    if media_has_ids:
+        for key in ["tvdb_id", "tmdb_id", "imdb_id"]:
+            if media.get(key):
+                for asset in join_index.probe(key, [media[key]]):
+                    if has_any_valid_id(asset):
+                        accepted[id(asset)] = asset
+
+    alternate_titles = media.get("alternate_titles") or []
+    normalized_alternate_titles = media.get("normalized_alternate_titles") or []
+    found = join_index.probe(
+        "title",
+        [media.get("title"), media.get("folder"), media.get("original_title")]
+        + list(alternate_titles),
+    )
+    found += join_index.probe(
+        "normalized_title",
+        [media.get("normalized_title"), media.get("normalized_folder")]
+        + list(normalized_alternate_titles),
+    )
+    found += join_index.probe("alternate_titles", [media.get("title")])
+    found += join_index.probe(
+        "normalized_alternate_titles", [media.get("normalized_title")]
+    )
+    found += join_index.probe("loose_title", [loose_string(media.get("title", ""))])
+    found += join_index.probe(
+        "loose_normalized_title", [loose_string(media.get("normalized_title", ""))]
+    )
+    for asset in found:
+        if media_has_ids and has_any_valid_id(asset):
+            continue
+        if id(asset) not in accepted and years_match(asset, media):
+            accepted[id(asset)] = asset
+    return accepted
+
+
+def joined_candidates(
+    prefix_index: AssetIndex,
+    joined: Dict[int, Dict[str, Any]],
+    media: Dict[str, Any],
+    asset_type: str,
+    logger: Optional[Any],
+) -> List[Dict[str, Any]]:
+    """Return the title search candidates for the media that join_matches accepted.
+
+    The order is the one pairwise matching walks candidates in, so the first entry
+    is the asset it would pick. When an accepted asset of the media type leads the
+    full-title results of the media's own title, it is returned alone without
+    running the token search for every title.
+
+    Args:
+      prefix_index: Search index for assets.
+      joined: Assets accepted by join_matches, keyed by id.
+      media: Media dictionary.
+      asset_type: Media type being matched.
+      logger: Logger instance.
+
+    Returns:
+      Accepted candidates in search order.
+    """
+    if not joined:
+        return []
+    leading = list(title_matches(prefix_index, media["title"]).values())
+    for asset in leading[:max_candidates]:
+        if asset.get("type") == asset_type and id(asset) in joined:
+            return [asset]
+    candidates = []
+    for title in [media["title"], *(media.get("alternate_titles") or ())]:
+        candidates.extend(search_matches(prefix_index, title, logger))
+    type_candidates = [a for a in candidates if a.get("type") == asset_type]
+    if type_candidates:
+        candidates = type_candidates
+    return [asset for asset in candidates if id(asset) in joined]
+
+
+# Reason recorded for matches made by fuzzy_match
+fuzzy_reason = "Fuzzy title similarity"
+
+MediaMatch = Tuple[Optional[Dict[str, Any]], str, int, int]
+
+
+def find_id_candidates(
+    prefix_index: AssetIndex, media: Dict[str, Any], logger: Any
+) -> List[Dict[str, Any]]:
+    """Return the assets indexed under the media's TMDB/TVDB ID, else its IMDb ID.
+
+    Args:
+      prefix_index: Search index for assets.
+      media: Media dictionary.
+      logger: Logger instance.
+
+    Returns:
+      Assets sharing the media's IDs, empty if none.
+    """
+    id_candidates: List[Dict[str, Any]] = []
+    tmdb_id = media.get("tmdb_id")
+    tvdb_id = media.get("tvdb_id")
+    imdb_id = media.get("imdb_id")
+    if tmdb_id or tvdb_id:
+        id_candidates = search_matches(
+            prefix_index,
+            media.get("title", ""),
+            logger,
+            tmdb_id=tmdb_id,
+            tvdb_id=tvdb_id,
+        )
+    if not id_candidates and imdb_id:
+        id_candidates = search_matches(
+            prefix_index,
+            media.get("title", ""),
+            logger,
+            imdb_id=imdb_id,
+        )
+    return id_candidates
+
+
+def find_title_candidates(
+    prefix_index: AssetIndex, media: Dict[str, Any], asset_type: str, logger: Any
+) -> List[Dict[str, Any]]:
+    """Return the title search candidates of the media, in the order they are tried.
+
+    Candidates of the media type are kept when there are any, otherwise all.
+
+    Args:
+      prefix_index: Search index for assets.
+      media: Media dictionary.
+      asset_type: Media type being matched.
+      logger: Logger instance.
+
+    Returns:
+      Assets found for the media's title and alternate titles.
+    """
+    candidates: List[Dict[str, Any]] = []
+    for title in [media["title"], *(media.get("alternate_titles") or ())]:
+        candidates.extend(search_matches(prefix_index, title, logger))
+    type_candidates = [a for a in candidates if a.get("type") == asset_type]
+    return type_candidates or candidates
+
+
+def find_match_candidates(
+    prefix_index: AssetIndex, media: Dict[str, Any], asset_type: str, logger: Any
+) -> List[Dict[str, Any]]:
+    """Return the assets that decide a media's exact match.
+
+    These are the ID candidates, or the title candidates when no asset carries
+    the media's IDs. The candidates hash-join matching accepts are always among
+    the title candidates, so the same set covers both matching modes.
+
+    Args:
+      prefix_index: Search index for assets.
+      media: Media dictionary.
+      asset_type: Media type being matched.
+      logger: Logger instance.
+
+    Returns:
+      Candidate assets.
+    """
+    return find_id_candidates(prefix_index, media, logger) or find_title_candidates(
+        prefix_index, media, asset_type, logger
+    )
+
+
+def find_media_match(
+    media: Dict[str, Any],
+    asset_type: str,
+    logger: Any,
+    prefix_index: AssetIndex,
+    strict_folder_match: bool = False,
+    join_index: Optional[JoinIndex] = None,
+    fuzzy_threshold: float = 0.0,
+    trigram_index: Optional[TrigramIndex] = None,
+) -> MediaMatch:
+    """Find the asset a media entry matches, without modifying either.
+
+    Assets sharing the media's IDs are tried first. Title candidates are only
+    searched when no asset carries those IDs, followed by fuzzy matching when a
+    threshold and trigram index are given.
+
+    Args:
+      media: Prepared media dictionary.
+      asset_type: Media type being matched.
+      logger: Logger instance.
+      prefix_index: Search index for assets.
+      strict_folder_match: Only consider match if asset's folder matches media's folder.
+      join_index: Join tables for hash-join matching, or None for pairwise matching.
+      fuzzy_threshold: Minimum trigram similarity for fuzzy matching, 0 disables it.
+      trigram_index: Trigram index used for fuzzy matching.
+
+    Returns:
+      Tuple of (matched asset or None, match reason or "", number of is_match
+      comparisons, number of candidates considered).
+    """
+    comparisons = 0
+    candidates: List[Dict[str, Any]] = []
+    id_candidates = find_id_candidates(prefix_index, media, logger)
+    for candidate in id_candidates:
+        comparisons += 1
+        is_matched, reason = is_match(candidate, media, strict_folder_match)
+        if is_matched:
+            logger.debug(
+                f"✓ Matched: {reason}: {media['title']} ({media['year']}) <-> {candidate['title']} ({candidate.get('year')})"
+            )
+            return candidate, reason, comparisons, len(id_candidates)
+    if not id_candidates:
+        if join_index is not None:
+            candidates = joined_candidates(
+                prefix_index,
+                join_matches(join_index, media, strict_folder_match),
+                media,
+                asset_type,
+                logger,
+            )
+        else:
+            candidates = find_title_candidates(prefix_index, media, asset_type, logger)
+        for search_asset in candidates:
+            comparisons += 1
+            is_matched, reason = is_match(search_asset, media, strict_folder_match)
+            if is_matched:
+                logger.debug(
+                    f"✓ Matched: {reason}: {media['title']} ({media['year']}) <-> {search_asset['title']} ({search_asset.get('year')})"
+                )
+                return search_asset, reason, comparisons, len(candidates)
+        if fuzzy_threshold > 0 and trigram_index is not None and not strict_folder_match:
+            fuzzy_asset, score = fuzzy_match(
+                trigram_index, media, asset_type, fuzzy_threshold
+            )
+            if fuzzy_asset:
+                logger.debug(
+                    f"≈ Fuzzy matched ({score:.2f}): {media['title']} ({media['year']}) <-> {fuzzy_asset['title']} ({fuzzy_asset.get('year')})"
+                )
+                return fuzzy_asset, fuzzy_reason, comparisons, len(candidates)
+    log_no_match(media, id_candidates + candidates, logger)
+    return None, "", comparisons, len(id_candidates) + len(candidates)
+
+
+def timed_media_match(*args: Any, **kwargs: Any) -> Tuple[MediaMatch, float]:
+    """Call find_media_match and return its result with the time it took."""
+    start = time.perf_counter()
+    result = find_media_match(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def log_no_match(
+    media: Dict[str, Any], candidates: List[Dict[str, Any]], logger: Any
+) -> None:
+    """Log an unmatched media entry with the candidates it was compared against.
+
+    Args:
+      media: Media dictionary.
+      candidates: Assets checked for the media.
+      logger: Logger instance.
+    """
+    candidate_titles = []
+    for c in candidates:
+        ct = c.get("title")
+        cy = c.get("year")
+        if ct:
+            candidate_titles.append(f"{ct} ({cy})" if cy else str(ct))
+    if not candidate_titles:
+        logger.debug(
+            f"✗ No match: {media['title']} ({media['year']}) | No candidates found"
+        )
+        return
+    col_width = max(len(s) for s in candidate_titles) + 2
+    rows = []
+    for i in range(0, len(candidate_titles), 3):
+        chunk = candidate_titles[i : i + 3]
+        rows.append(" | ".join(c.ljust(col_width) for c in chunk))
+    candidates_str = "\n      ".join(rows)
+    logger.debug(
+        f"✗ No match: {media['title']} ({media['year']})\n"
+        f"  Candidates checked:\n"
+        f"      {candidates_str}"
+    )
+
+
+class _LogBuffer:
+    """Collects log calls in a worker process so the parent can replay them in order."""
+
+    def __init__(self, level: int) -> None:
+        self.level = level
+        self.records: List[Tuple[int, str]] = []
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self.level
+
+    def log(self, level: int, message: str) -> None:
+        if level >= self.level:
+            self.records.append((level, message))
+
+    def debug(self, message: str) -> None:
+        self.log(logging.DEBUG, message)
+
+    def info(self, message: str) -> None:
+        self.log(logging.INFO, message)
+
+    def warning(self, message: str) -> None:
+        self.log(logging.WARNING, message)
+
+    def error(self, message: str) -> None:
+        self.log(logging.ERROR, message)
+
+
+# Inputs of the running parallel match, inherited by forked pool workers
+_match_job: Optional[Dict[str, Any]] = None
+
+MatchOutcome = Tuple[Optional[int], str, int, int, float, List[Tuple[int, str]]]
+
+
+def _match_chunk(chunk: Tuple[str, List[int]]) -> List[MatchOutcome]:
+    """Match a chunk of a media list, given by positions, inside a pool worker.
+
+    Matched assets are returned by their registry ID in prefix_index, since the
+    worker's copies of them are not the parent's objects.
+    """
+    asset_type, positions = chunk
+    job = _match_job
+    media_data = job["media_dict"][asset_type]
+    outcomes: List[MatchOutcome] = []
+    for media in (media_data[position] for position in positions):
+        log_buffer = _LogBuffer(job["log_level"])
+        (asset, reason, comparisons, candidates), seconds = timed_media_match(
+            media, asset_type, log_buffer, **job["settings"]
+        )
+        asset_id = (
+            job["settings"]["prefix_index"].asset_id(asset) if asset is not None else None
+        )
+        outcomes.append(
+            (asset_id, reason, comparisons, candidates, seconds, log_buffer.records)
+        )
+    return outcomes
+
+
+def start_match_pool(
+    workers: int,
+    media_dict: Dict[str, List[Dict[str, Any]]],
+    settings: Dict[str, Any],
+    logger: Any,
+) -> Optional[Any]:
+    """Fork a process pool that shares the built indexes copy-on-write.
+
+    Args:
+      workers: Number of worker processes.
+      media_dict: Prepared media grouped by type.
+      settings: Keyword arguments for find_media_match.
+      logger: Logger instance.
+
+    Returns:
+      The pool, or None if processes cannot be forked on this platform.
+    """
+    global _match_job
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        logger.warning("Parallel matching needs fork(); matching in a single process.")
+        return None
+    _match_job = {
+        "media_dict": media_dict,
+        "settings": settings,
+        "log_level": logger.getEffectiveLevel(),
+    }
+    logger.debug(f"Matching with {workers} worker processes")
+    return context.Pool(workers)
+
+
+def stop_match_pool(pool: Any) -> None:
+    """Shut down a pool created by start_match_pool and release its inputs."""
+    global _match_job
+    pool.terminate()
+    pool.join()
+    _match_job = None
+
+
+def iter_pool_matches(
+    pool: Any,
+    asset_type: str,
+    positions: List[int],
+    workers: int,
+    prefix_index: AssetIndex,
+    logger: Any,
+) -> Iterator[Tuple[MediaMatch, float]]:
+    """Yield find_media_match results for media of one type, computed by the pool.
+
+    The positions are split into contiguous chunks and results come back in
+    input order, so matches are applied and logs replayed exactly as a single
+    process would.
+
+    Args:
+      pool: Pool created by start_match_pool.
+      asset_type: Media type to match.
+      positions: Positions in media_dict[asset_type] to match.
+      workers: Number of worker processes.
+      prefix_index: Search index the pool was started with.
+      logger: Logger instance.
+
+    Yields:
+      Tuple of (find_media_match result, seconds taken).
+    """
+    chunk_size = max(1, math.ceil(len(positions) / (workers * 4)))
+    chunks = [
+        (asset_type, positions[start : start + chunk_size])
+        for start in range(0, len(positions), chunk_size)
     ]
-    for condition, reason in match_criteria:
-        if condition and year_matches():
-            return True, reason
-    return False, ""
+    for outcomes in pool.imap(_match_chunk, chunks):
+        for asset_id, reason, comparisons, candidates, seconds, records in outcomes:
+            for level, message in records:
+                logger.log(level, message)
+            asset = prefix_index.assets[asset_id] if asset_id is not None else None
+            yield (asset, reason, comparisons, candidates), seconds
+
+
+def iter_media_matches(
+    media_data: List[Dict[str, Any]],
+    asset_type: str,
+    logger: Any,
+    settings: Dict[str, Any],
+    pool: Optional[Any] = None,
+    workers: int = 1,
+    match_cache: Optional[MatchCache] = None,
+) -> Iterator[Tuple[MediaMatch, float, bool]]:
+    """Yield the find_media_match result of each media entry, in order.
+
+    Media with a valid match cache entry is answered from the cache; the rest is
+    matched in this process or by the pool, and its exact matches are cached.
+    Fuzzy matches are not cached: a new asset may be more similar, and checking
+    for one costs as much as matching again.
+
+    Args:
+      media_data: Prepared media of one type.
+      asset_type: Media type being matched.
+      logger: Logger instance.
+      settings: Keyword arguments for find_media_match.
+      pool: Pool created by start_match_pool, or None.
+      workers: Number of worker processes in the pool.
+      match_cache: Open match cache, or None.
+
+    Yields:
+      Tuple of (find_media_match result, seconds taken, whether it came from the
+      match cache).
+    """
+    prefix_index = settings["prefix_index"]
+    cached: Dict[int, Dict[str, Any]] = {}
+    media_keys: List[str] = []
+    if match_cache is not None:
+        for position, media in enumerate(media_data):
+            media_key = match_cache.media_key(media, asset_type)
+            media_keys.append(media_key)
+            entry = match_cache.get(
+                media_key,
+                find_match_candidates(prefix_index, media, asset_type, logger),
+            )
+            if entry is not None:
+                cached[position] = entry
+    misses = [position for position in range(len(media_data)) if position not in cached]
+    if pool is not None:
+        computed = iter_pool_matches(
+            pool, asset_type, misses, workers, prefix_index, logger
+        )
+    else:
+        computed = (
+            timed_media_match(media_data[position], asset_type, logger, **settings)
+            for position in misses
+        )
+    for position, media in enumerate(media_data):
+        entry = cached.get(position)
+        if entry is not None:
+            asset = entry["asset"]
+            logger.debug(
+                f"✓ Matched (cached): {media['title']} ({media['year']}) <-> {asset['title']} ({asset.get('year')})"
+            )
+            yield (asset, entry["reason"], 0, 0), 0.0, True
+            continue
+        result, seconds = next(computed)
+        asset, reason = result[0], result[1]
+        if match_cache is not None and asset is not None and reason != fuzzy_reason:
+            match_cache.put(
+                media_keys[position],
+                asset,
+                find_match_candidates(prefix_index, media, asset_type, logger),
+                reason,
+            )
+        yield result, seconds, False
+
+
+def series_poster_gaps(
+    media: Dict[str, Any],
+    media_seasons: List[int],
+    asset: Dict[str, Any],
+    require_missing_season: bool,
+) -> Optional[Dict[str, Any]]:
+    """Return the unmatched-report entry of a matched series missing posters.
+
+    Args:
+      media: Series media dictionary.
+      media_seasons: Seasons of the series that have episodes.
+      asset: Asset the series matched.
+      require_missing_season: Only report when a season poster is missing.
+
+    Returns:
+      Entry with missing_seasons and missing_main_poster, or None if complete.
+    """
+    asset_mask = get_season_mask(asset)
+    missing = [s for s in media_seasons if not asset_mask >> s & 1]
+    missing_main_poster = not any(
+        not season_pattern.search(os.path.basename(f)) for f in asset.get("files", [])
+    )
+    if missing or (missing_main_poster and not require_missing_season):
+        return {
+            "title": media.get("title"),
+            "year": media.get("year"),
+            "missing_seasons": missing,
+            "missing_main_poster": missing_main_poster,
+        }
+    return None
 
 
 def match_media_to_assets(
     media_dict: Dict[str, List[Dict[str, Any]]],
-    prefix_index: Dict[str, Any],
+    prefix_index: AssetIndex,
     ignore_root_folders: List[str],
     logger: Any,
+    stats: Optional[MatchStats] = None,
+    media_matches: Optional[Dict[int, Tuple[Dict[str, Any], str]]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Match media entries against known asset entries and return unmatched assets by type.
 
@@ -189,6 +796,9 @@ def match_media_to_assets(
       prefix_index: Search index for assets.
       ignore_root_folders: List of folder names or paths to ignore.
       logger: Logger instance.
+      stats: Optional MatchStats filled with per-reason counts and histograms.
+      media_matches: Matches filled in by an earlier match_assets_to_media pass.
+        When given, media is looked up there instead of being searched for.
 
     Returns:
       Dictionary of unmatched entries by type as flat lists.
@@ -227,6 +837,9 @@ def match_media_to_assets(
                     root in ignore_root_folders or location in ignore_root_folders
                 ):
                     continue
+                start_time = time.perf_counter()
+                reason = ""
+                comparisons = 0
                 media_seasons: List[int] = []
                 if media_type == "series":
                     media_seasons = [
@@ -234,76 +847,58 @@ def match_media_to_assets(
                         for s in media_data.get("seasons", [])
                         if s.get("season_has_episodes")
                     ]
-                found = False
-                tmdb_id = media_data.get("tmdb_id")
-                tvdb_id = media_data.get("tvdb_id")
+                asset_data: Optional[Dict[str, Any]] = None
+                by_id = False
                 candidates = []
                 id_assets_found = []
-                if tmdb_id or tvdb_id:
-                    id_assets_found = search_matches(
-                        prefix_index,
-                        media_data.get("title", ""),
-                        logger,
-                        tmdb_id=tmdb_id,
-                        tvdb_id=tvdb_id,
-                    )
-                if id_assets_found:
-                    asset_data = id_assets_found[0]
-                    found = True
-                    if media_type == "series":
-                        missing = [
-                            s
-                            for s in media_seasons
-                            if s not in asset_data.get("season_numbers", [])
-                        ]
-                        has_main_poster = any(
-                            not season_pattern.search(os.path.basename(f))
-                            for f in asset_data.get("files", [])
-                        )
-                        missing_main_poster = not has_main_poster
-                        if missing or missing_main_poster:
-                            entry = {
-                                "title": media_data.get("title"),
-                                "year": media_data.get("year"),
-                                "missing_seasons": missing,
-                                "missing_main_poster": missing_main_poster,
-                            }
-                            unmatched[media_type].append(entry)
+                if media_matches is not None:
+                    asset_data, reason = media_matches.get(id(media_data), (None, ""))
+                    by_id = reason.startswith("ID match")
                 else:
-                    titles_to_try = [media_data.get("title")] + media_data.get(
-                        "alternate_titles", []
+                    tmdb_id = media_data.get("tmdb_id")
+                    tvdb_id = media_data.get("tvdb_id")
+                    if tmdb_id or tvdb_id:
+                        id_assets_found = search_matches(
+                            prefix_index,
+                            media_data.get("title", ""),
+                            logger,
+                            tmdb_id=tmdb_id,
+                            tvdb_id=tvdb_id,
+                        )
+                    if id_assets_found:
+                        asset_data = id_assets_found[0]
+                        by_id = True
+                        reason = (
+                            "ID lookup: tmdb_id"
+                            if tmdb_id is not None
+                            else "ID lookup: tvdb_id"
+                        )
+                    else:
+                        titles_to_try = [
+                            media_data.get("title"),
+                            *(media_data.get("alternate_titles") or ()),
+                        ]
+                        for title in titles_to_try:
+                            assets_found = search_matches(prefix_index, title, logger)
+                            candidates.extend(assets_found)
+                        for candidate in candidates:
+                            comparisons += 1
+                            is_matched, reason = is_match(candidate, media_data)
+                            if is_matched:
+                                logger.debug(
+                                    f"✓ Fallback match: {reason}: {media_data.get('title')} ({media_data.get('year')}) <-> {candidate.get('title')} ({candidate.get('year')})"
+                                )
+                                asset_data = candidate
+                                break
+                found = asset_data is not None
+                if found and media_type == "series":
+                    # ID matches report a missing main poster on its own; title
+                    # matches only alongside missing seasons
+                    entry = series_poster_gaps(
+                        media_data, media_seasons, asset_data, require_missing_season=not by_id
                     )
-                    for title in titles_to_try:
-                        assets_found = search_matches(prefix_index, title, logger)
-                        candidates.extend(assets_found)
-                    for asset_data in candidates:
-                        is_matched, reason = is_match(asset_data, media_data)
-                        if is_matched:
-                            logger.debug(
-                                f"✓ Fallback match: {reason}: {media_data.get('title')} ({media_data.get('year')}) <-> {asset_data.get('title')} ({asset_data.get('year')})"
-                            )
-                            found = True
-                            if media_type == "series" and media_seasons:
-                                missing = [
-                                    s
-                                    for s in media_seasons
-                                    if s not in asset_data.get("season_numbers", [])
-                                ]
-                                if missing:
-                                    has_main_poster = any(
-                                        not season_pattern.search(os.path.basename(f))
-                                        for f in asset_data.get("files", [])
-                                    )
-                                    missing_main_poster = not has_main_poster
-                                    unmatched[media_type].append(
-                                        {
-                                            "title": media_data.get("title"),
-                                            "year": media_data.get("year"),
-                                            "missing_seasons": missing,
-                                            "missing_main_poster": missing_main_poster,
-                                        }
-                                    )
-                            break
+                    if entry:
+                        unmatched[media_type].append(entry)
                 if not found:
                     entry = {
                         "title": media_data.get("title"),
@@ -313,16 +908,26 @@ def match_media_to_assets(
                     if media_type == "series":
                         entry["missing_seasons"] = media_seasons
                     unmatched[media_type].append(entry)
+                if stats is not None:
+                    stats.record(
+                        media_type,
+                        reason,
+                        len(id_assets_found) or len(candidates),
+                        comparisons,
+                        time.perf_counter() - start_time,
+                    )
     return unmatched
 
 
 def match_assets_to_media(
     media_dict: Dict[str, List[Dict[str, Any]]],
-    prefix_index: Dict[str, Any],
+    prefix_index: AssetIndex,
     logger: Optional[Any] = None,
     return_unmatched_assets: bool = False,
     config: Optional[SimpleNamespace] = None,
     strict_folder_match: bool = False,
+    stats: Optional[MatchStats] = None,
+    media_matches: Optional[Dict[int, Tuple[Dict[str, Any], str]]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Match assets to media. Optionally, return unmatched assets instead of matched.
 
@@ -333,204 +938,120 @@ def match_assets_to_media(
       return_unmatched_assets: Whether to return unmatched assets.
       config: Optional config namespace.
       strict_folder_match: If True, only match if folder matches.
+      stats: Optional MatchStats filled with per-reason counts and histograms.
+      media_matches: Optional dictionary filled with id(media) -> (asset, reason)
+        for every matched media, so other stages can reuse the pass.
 
     Returns:
       Dictionary of matched or unmatched assets by type.
+
+    If config enables hash_join_matching, the title criteria are resolved for
+    each media by probing join tables built once over all assets (see
+    join_matches); is_match then only confirms the first accepted candidate, and
+    media nothing is accepted for skips the title search. Results are the same
+    as with pairwise matching.
+
+    If config sets match_workers above 1, media is matched in a forked process
+    pool that inherits the built indexes copy-on-write; matches are applied and
+    worker logs replayed in media order, so the output does not depend on it.
+
+    If config enables match_cache, matches are remembered across runs by media
+    and asset fingerprint (see util.match_cache) and reused while neither side
+    nor the media's candidates (ID candidates, else title candidates) have
+    changed.
+
+    If config sets fuzzy_match_threshold (a percentage, 0 disables), media left
+    unmatched by the exact criteria is matched to the most similar asset title
+    at or above that similarity.
+    Fuzzy matching is never used with strict_folder_match.
     """
     asset_types = ["movies", "series", "collections"]
-    all_assets = {atype: [] for atype in asset_types}
-    asset_key_to_asset: Dict[Any, Any] = {}
-    for asset_list in prefix_index.values():
-        for asset in asset_list:
-            atype = asset.get("type")
-            if atype in asset_types:
-                key = (
-                    asset.get("title"),
-                    asset.get("year"),
-                    tuple(asset.get("files") or []),
-                    asset.get("path"),
-                )
-                if key not in asset_key_to_asset:
-                    all_assets[atype].append(asset)
-                    asset_key_to_asset[key] = asset
-    matched_asset_keys = set()
+    fuzzy_threshold = int(getattr(config, "fuzzy_match_threshold", 0) or 0) / 100
+    join_index: Optional[JoinIndex] = None
+    if getattr(config, "hash_join_matching", False):
+        join_index = build_join_index(prefix_index.assets)
+    trigram_index: Optional[TrigramIndex] = None
+    if fuzzy_threshold > 0 and not strict_folder_match:
+        trigram_index = build_trigram_index(prefix_index.assets)
+    match_workers = max(1, int(getattr(config, "match_workers", 1) or 1))
+    matched_asset_ids: Set[int] = set()
     matched: Dict[str, List[Dict[str, Any]]] = {atype: [] for atype in asset_types}
     use_asset_types = [t for t in media_dict if media_dict[t] is not None]
-    total_comparisons = 0
-    total_items = 0
-    matches = 0
-    non_matches = 0
-    with progress(
-        use_asset_types,
-        desc="Matching assets...",
-        total=len(use_asset_types),
-        unit="asset types",
-        logger=logger,
-    ) as pbar_outer:
-        for asset_type in pbar_outer:
-            if asset_type in media_dict:
+    for asset_type in use_asset_types:
+        for media in media_dict[asset_type]:
+            prepare_media(media)
+    settings = {
+        "prefix_index": prefix_index,
+        "strict_folder_match": strict_folder_match,
+        "join_index": join_index,
+        "fuzzy_threshold": fuzzy_threshold,
+        "trigram_index": trigram_index,
+    }
+    match_cache: Optional[MatchCache] = None
+    if getattr(config, "match_cache", False):
+        match_cache = open_match_cache(
+            prefix_index.assets, [strict_folder_match, fuzzy_threshold], logger
+        )
+    pool = None
+    if match_workers > 1:
+        pool = start_match_pool(match_workers, media_dict, settings, logger)
+    stats = stats if stats is not None else MatchStats()
+    match_start_time = time.time()
+    try:
+        with progress(
+            use_asset_types,
+            desc="Matching assets...",
+            total=len(use_asset_types),
+            unit="asset types",
+            logger=logger,
+        ) as pbar_outer:
+            for asset_type in pbar_outer:
+                if asset_type not in media_dict:
+                    continue
                 matched_dict: List[Dict[str, Any]] = []
                 media_data = media_dict[asset_type]
                 start_time = time.time()
-                with progress(
+                outcomes = iter_media_matches(
                     media_data,
+                    asset_type,
+                    logger,
+                    settings,
+                    pool=pool,
+                    workers=match_workers,
+                    match_cache=match_cache,
+                )
+                with progress(
+                    zip(media_data, outcomes),
                     desc=f"Matching {asset_type}",
                     total=len(media_data),
                     unit="media",
                     logger=logger,
                 ) as pbar_inner:
-                    for media in pbar_inner:
-                        total_items += 1
-                        found_match = False
-                        search_asset = None
-                        seasons = media.get("seasons") or []
-                        media_seasons_numbers = [
-                            season["season_number"] for season in seasons
-                        ]
-                        tmdb_id = media.get("tmdb_id")
-                        tvdb_id = media.get("tvdb_id")
-                        candidates = []
-                        id_candidates = []
-                        if tmdb_id or tvdb_id:
-                            id_candidates = search_matches(
-                                prefix_index,
-                                media.get("title", ""),
-                                logger,
-                                tmdb_id=tmdb_id,
-                                tvdb_id=tvdb_id,
-                            )
-                            for candidate in id_candidates:
-                                total_comparisons += 1
-                                is_matched, reason = is_match(
-                                    candidate, media, strict_folder_match
-                                )
-                                if is_matched:
-                                    logger.debug(
-                                        f"✓ Matched: {reason}: {media['title']} ({media['year']}) <-> {candidate['title']} ({candidate.get('year')})"
-                                    )
-                                    search_asset = candidate
-                                    found_match = True
-                                    asset_season_numbers = search_asset.get(
-                                        "season_numbers", None
-                                    )
-                                    if asset_season_numbers and media_seasons_numbers:
-                                        handle_series_match(
-                                            search_asset,
-                                            media_seasons_numbers,
-                                            asset_season_numbers,
-                                        )
-                                    key = (
-                                        search_asset.get("title"),
-                                        search_asset.get("year"),
-                                        tuple(search_asset.get("files") or []),
-                                        search_asset.get("path"),
-                                    )
-                                    matched_asset_keys.add(key)
-                                    break
-                        if not found_match and not id_candidates:
-                            titles_to_check = [media["title"]] + media.get(
-                                "alternate_titles", []
-                            )
-                            for title in titles_to_check:
-                                candidate_list = search_matches(
-                                    prefix_index, title, logger
-                                )
-                                candidates.extend(candidate_list)
-                            type_candidates = [
-                                a for a in candidates if a.get("type") == asset_type
-                            ]
-                            if type_candidates:
-                                candidates = type_candidates
-                            for search_asset in candidates:
-                                total_comparisons += 1
-                                is_matched, reason = is_match(
-                                    search_asset, media, strict_folder_match
-                                )
-                                if is_matched:
-                                    logger.debug(
-                                        f"✓ Matched: {reason}: {media['title']} ({media['year']}) <-> {search_asset['title']} ({search_asset.get('year')})"
-                                    )
-                                    asset_season_numbers = search_asset.get(
-                                        "season_numbers", None
-                                    )
-                                    if (
-                                        not asset_season_numbers
-                                        or not media_seasons_numbers
-                                        or (
-                                            asset_season_numbers
-                                            and media_seasons_numbers
-                                        )
-                                    ):
-                                        found_match = True
-                                        if (
-                                            asset_season_numbers
-                                            and media_seasons_numbers
-                                        ):
-                                            handle_series_match(
-                                                search_asset,
-                                                media_seasons_numbers,
-                                                asset_season_numbers,
-                                            )
-                                        key = (
-                                            search_asset.get("title"),
-                                            search_asset.get("year"),
-                                            tuple(search_asset.get("files") or []),
-                                            search_asset.get("path"),
-                                        )
-                                        matched_asset_keys.add(key)
-                                        break
-                        if found_match:
-                            matches += 1
-                            matched_dict.append(
-                                {
-                                    "title": media["title"],
-                                    "year": media["year"],
-                                    "folder": media.get("folder"),
-                                    "files": search_asset["files"],
-                                    "seasons_numbers": (
-                                        search_asset.get("season_numbers", None)
-                                        if search_asset
-                                        else None
-                                    ),
-                                    "asset_ref": search_asset,
-                                }
-                            )
-                        else:
-                            non_matches += 1
-                            candidate_titles = []
-                            if id_candidates or candidates:
-                                for c in (id_candidates or []) + (candidates or []):
-                                    ct = c.get("title")
-                                    cy = c.get("year")
-                                    if ct:
-                                        candidate_titles.append(
-                                            f"{ct} ({cy})" if cy else str(ct)
-                                        )
-                                if candidate_titles:
-                                    col_width = (
-                                        max(len(s) for s in candidate_titles) + 2
-                                    )
-                                    rows = []
-                                    for i in range(0, len(candidate_titles), 3):
-                                        chunk = candidate_titles[i : i + 3]
-                                        row = " | ".join(
-                                            c.ljust(col_width) for c in chunk
-                                        )
-                                        rows.append(row)
-                                    candidates_str = "\n      ".join(rows)
-                                    logger.debug(
-                                        f"✗ No match: {media['title']} ({media['year']})\n"
-                                        f"  Candidates checked:\n"
-                                        f"      {candidates_str}"
-                                    )
-                                else:
-                                    logger.debug(
-                                        f"✗ No match: {media['title']} ({media['year']}) | No candidates found"
-                                    )
-                            else:
-                                logger.debug(
-                                    f"✗ No match: {media['title']} ({media['year']}) | No candidates found"
-                                )
+                    for media, (result, seconds, cached) in pbar_inner:
+                        search_asset, reason, comparisons, candidates = result
+                        stats.record(
+                            asset_type, reason, candidates, comparisons, seconds, cached
+                        )
+                        if search_asset is None:
+                            continue
+                        media_mask = get_season_mask(media)
+                        if search_asset.get("season_numbers") and media_mask:
+                            handle_series_match(search_asset, media_mask)
+                        matched_asset_ids.add(prefix_index.asset_id(search_asset))
+                        if media_matches is not None:
+                            media_matches[id(media)] = (search_asset, reason)
+                        matched_dict.append(
+                            {
+                                "title": media["title"],
+                                "year": media["year"],
+                                "folder": media.get("folder"),
+                                "files": search_asset["files"],
+                                "seasons_numbers": search_asset.get(
+                                    "season_numbers", None
+                                ),
+                                "asset_ref": search_asset,
+                            }
+                        )
                 matched[asset_type] = matched_dict
                 elapsed_time = time.time() - start_time
                 items_per_second = (
@@ -539,76 +1060,101 @@ def match_assets_to_media(
                 logger.debug(
                     f"Completed matching for {asset_type}: {len(media_data)} items in {elapsed_time:.2f} seconds ({items_per_second:.2f} items/s)"
                 )
-    logger.debug(f"{total_items} total_items")
-    logger.debug(f"{total_comparisons} total_comparisons")
-    logger.debug(f"{matches} total_matches")
-    logger.debug(f"{non_matches} non_matches")
+    finally:
+        if pool is not None:
+            stop_match_pool(pool)
+        if match_cache is not None:
+            match_cache.close()
+    if match_cache is not None:
+        logger.info(
+            f"Match cache: {match_cache.hits} hit(s), {match_cache.misses} miss(es), {match_cache.evicted} evicted"
+        )
+    logger.debug(f"{stats.total('items')} total_items")
+    match_elapsed = time.time() - match_start_time
+    total_comparisons = stats.total("comparisons")
+    comparisons_per_second = (
+        total_comparisons / match_elapsed if match_elapsed > 0 else 0
+    )
+    logger.debug(
+        f"{total_comparisons} total_comparisons ({comparisons_per_second:.2f} comparisons/s)"
+    )
+    logger.debug(f"{stats.total('matches')} total_matches")
+    if fuzzy_threshold > 0:
+        logger.debug(f"{stats.reasons[fuzzy_reason]} fuzzy_matches")
+    log_normalization_stats(logger)
+    logger.debug(f"{stats.total('non_matches')} non_matches")
     if return_unmatched_assets:
-        unmatched_assets = {atype: [] for atype in asset_types}
-        for atype in asset_types:
-            for asset in all_assets[atype]:
-                if asset.get("title", "").lower() == "tmp":
-                    continue
-                key = (
-                    asset.get("title"),
-                    asset.get("year"),
-                    tuple(asset.get("files") or []),
-                    asset.get("path"),
-                )
-                if key in matched_asset_keys:
-                    continue
-                if config and getattr(config, "ignore_media", None):
-                    ignore_title = asset["title"]
-                    ignore_title_year = f"{asset['title']} ({asset['year']})"
-                    if (
-                        ignore_title in config.ignore_media
-                        or ignore_title_year in config.ignore_media
-                    ):
+        return collect_unmatched_assets(prefix_index, matched_asset_ids, logger, config)
+    return matched
+
+
+def collect_unmatched_assets(
+    prefix_index: AssetIndex,
+    matched_asset_ids: Set[int],
+    logger: Optional[Any] = None,
+    config: Optional[SimpleNamespace] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the indexed assets no media matched, grouped by type.
+
+    Assets titled "tmp" and assets listed in config.ignore_media are left out.
+
+    Args:
+      prefix_index: Search index for assets.
+      matched_asset_ids: Registry IDs (prefix_index.asset_id) of matched assets.
+      logger: Logger instance.
+      config: Optional module config with ignore_media.
+
+    Returns:
+      Dictionary of unmatched asset summaries by type.
+    """
+    asset_types = ["movies", "series", "collections"]
+    unmatched_assets: Dict[str, List[Dict[str, Any]]] = {atype: [] for atype in asset_types}
+    for atype in asset_types:
+        for asset_id, asset in enumerate(prefix_index.assets):
+            if asset.get("type") != atype or asset_id in matched_asset_ids:
+                continue
+            if asset.get("title", "").lower() == "tmp":
+                continue
+            if config and getattr(config, "ignore_media", None):
+                ignore_title = asset["title"]
+                ignore_title_year = f"{asset['title']} ({asset['year']})"
+                if (
+                    ignore_title in config.ignore_media
+                    or ignore_title_year in config.ignore_media
+                ):
+                    if logger:
                         logger.debug(
                             f"{asset['title']} ({asset['year']}) is in ignore_media, skipping..."
                         )
-                        continue
-                unmatched_assets[atype].append(
-                    {
-                        "title": asset["title"],
-                        "year": asset["year"],
-                        "files": asset["files"],
-                        "path": asset.get("path", None),
-                    }
-                )
-        return unmatched_assets
-    return matched
+                    continue
+            unmatched_assets[atype].append(
+                {
+                    "title": asset["title"],
+                    "year": asset["year"],
+                    "files": asset["files"],
+                    "path": asset.get("path", None),
+                }
+            )
+    return unmatched_assets
 
 
-def handle_series_match(
-    asset: Dict[str, Any],
-    media_seasons_numbers: List[int],
-    asset_season_numbers: List[int],
-) -> None:
+def handle_series_match(asset: Dict[str, Any], media_mask: int) -> None:
     """Prune asset data to remove files/seasons not present in the media entry.
 
     Args:
       asset: Asset dictionary with file and season data.
-      media_seasons_numbers: List of seasons found in the media source.
-      asset_season_numbers: List of seasons declared in the asset.
+      media_mask: Season bitmap of the media entry.
     """
-    files_to_remove = []
-    seasons_to_remove = []
-    for file in asset.get("files", []):
-        if re.search(r" - Season| - Specials", file):
-            match = re.search(r"Season (\d+)", file)
-            if match:
-                season_number = int(match.group(1))
-            elif "Specials" in file:
-                season_number = 0
-            else:
-                continue
-            if season_number not in media_seasons_numbers:
-                files_to_remove.append(file)
-    for file in files_to_remove:
-        asset["files"].remove(file)
-    for season in asset_season_numbers:
-        if season not in media_seasons_numbers:
-            seasons_to_remove.append(season)
-    for season in seasons_to_remove:
-        asset_season_numbers.remove(season)
+    asset_mask = get_season_mask(asset)
+    extra = asset_mask & ~media_mask
+    if not extra:
+        return
+    for season, files in season_files(asset.get("files", [])).items():
+        if media_mask >> season & 1:
+            continue
+        for file in files:
+            asset["files"].remove(file)
+    asset["season_mask"] = asset_mask & media_mask
+    asset["season_numbers"][:] = [
+        season for season in asset["season_numbers"] if media_mask >> season & 1
+    ]
@@ -0,0 +1,266 @@
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+Asset = Dict[str, Any]
+
+# Bumped whenever the table layout or the fingerprinted fields change
+schema_version: int = 3
+
+# Writes committed together, so concurrent runs never wait on a transaction
+# held open for a whole matching pass
+commit_every: int = 500
+
+# Asset fields read while matching, plus the files the match hands on
+asset_fingerprint_fields = [
+    "type",
+    "title",
+    "year",
+    "normalized_title",
+    "alternate_titles",
+    "normalized_alternate_titles",
+    "folder",
+    "media_folder",
+    "path",
+    "tmdb_id",
+    "tvdb_id",
+    "imdb_id",
+    "files",
+    "season_numbers",
+]
+
+# Media fields read while matching
+media_fingerprint_fields = [
+    "title",
+    "year",
+    "secondary_year",
+    "original_title",
+    "normalized_title",
+    "alternate_titles",
+    "normalized_alternate_titles",
+    "folder",
+    "normalized_folder",
+    "tmdb_id",
+    "tvdb_id",
+    "imdb_id",
+]
+
+
+def default_match_cache_path() -> str:
+    """Return the path of the match cache database inside the config directory."""
+    from util.config import config_dir
+
+    cache_dir = os.path.join(str(config_dir), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "match_cache.db")
+
+
+def fingerprint(record: Dict[str, Any], fields: List[str], *extra: Any) -> str:
+    """Return a stable digest of the given fields of a record.
+
+    Args:
+        record (Dict[str, Any]): Asset or media dictionary.
+        fields (List[str]): Fields to include.
+        *extra (Any): Additional values to fold into the digest.
+
+    Returns:
+        str: Hex digest.
+    """
+    data = [record.get(field) for field in fields]
+    data.extend(extra)
+    return hashlib.sha1(json.dumps(data, default=str).encode()).hexdigest()
+
+
+class MatchCache:
+    """Persistent SQLite cache of media to asset matches across runs.
+
+    Each row maps the fingerprint of a media record to the fingerprint of the
+    asset it matched and of its candidates at the time: the assets its IDs
+    resolved to, or its title search results when no asset carried the IDs.
+    Rows are scoped by the matching options, since strict folder matching and
+    fuzzy matching change the outcome for the same inputs. A row is only used
+    while the matched asset and the candidates are unchanged; rows for media that
+    changed, or was not matched again this run, are evicted on close. Writes
+    are committed every commit_every rows.
+    """
+
+    def __init__(
+        self,
+        assets: List[Asset],
+        scope: Any,
+        path: Optional[str] = None,
+        logger: Optional[Any] = None,
+    ) -> None:
+        """Open (or create) the cache and fingerprint the current assets.
+
+        Args:
+            assets (List[Asset]): Assets available for matching this run.
+            scope (Any): JSON-serializable matching options the rows belong to.
+            path (Optional[str]): Database path, defaults to default_match_cache_path().
+            logger (Optional[Any]): Logger instance for warnings.
+        """
+        self.path = path or default_match_cache_path()
+        self.logger = logger
+        self.scope = json.dumps(scope)
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._seen: List[str] = []
+        self._pending = 0
+        self.fingerprints: Dict[int, str] = {}
+        self.assets: Dict[str, Asset] = {}
+        for asset in assets:
+            if id(asset) in self.fingerprints:
+                continue
+            key = fingerprint(asset, asset_fingerprint_fields)
+            self.fingerprints[id(asset)] = key
+            self.assets.setdefault(key, asset)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != schema_version:
+            self._conn.execute("DROP TABLE IF EXISTS matches")
+            self._conn.execute(f"PRAGMA user_version = {schema_version}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS matches (
+                scope TEXT NOT NULL,
+                media TEXT NOT NULL,
+                asset TEXT NOT NULL,
+                candidates TEXT NOT NULL,
+                reason TEXT NOT NULL,
+                PRIMARY KEY (scope, media)
+            )
+            """
+        )
+
+    @staticmethod
+    def media_key(media: Dict[str, Any], asset_type: str) -> str:
+        """Return the fingerprint of a media record of the given type."""
+        return fingerprint(media, media_fingerprint_fields, asset_type)
+
+    def get(
+        self, media_key: str, candidates: List[Asset]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached match of a media record if it is still valid.
+
+        Args:
+            media_key (str): Fingerprint from media_key().
+            candidates (List[Asset]): Candidates the media resolves to now.
+
+        Returns:
+            Optional[Dict[str, Any]]: {"asset": Asset, "reason": str}, or None on a
+                miss. A stale row is evicted.
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT asset, candidates, reason FROM matches WHERE scope = ? AND media = ?",
+                (self.scope, media_key),
+            ).fetchone()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to read match cache: {exc}")
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        asset = self.assets.get(row[0])
+        if asset is None or json.loads(row[1]) != self._keys_of(candidates):
+            self.misses += 1
+            self.evicted += 1
+            self._delete(media_key)
+            return None
+        self.hits += 1
+        self._seen.append(media_key)
+        return {"asset": asset, "reason": row[2]}
+
+    def put(
+        self, media_key: str, asset: Asset, candidates: List[Asset], reason: str
+    ) -> None:
+        """Record the asset a media record matched.
+
+        Args:
+            media_key (str): Fingerprint from media_key().
+            asset (Asset): Matched asset.
+            candidates (List[Asset]): Candidates the media resolved to.
+            reason (str): Reason the asset matched.
+        """
+        asset_key = self.fingerprints.get(id(asset))
+        if asset_key is None:
+            return
+        self._seen.append(media_key)
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches (scope, media, asset, candidates, reason) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.scope,
+                    media_key,
+                    asset_key,
+                    json.dumps(self._keys_of(candidates)),
+                    reason,
+                ),
+            )
+            self._written()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to write match cache: {exc}")
+
+    def close(self) -> None:
+        """Evict rows of this scope for media not matched this run, then commit."""
+        try:
+            seen = set(self._seen)
+            rows = self._conn.execute(
+                "SELECT media FROM matches WHERE scope = ?", (self.scope,)
+            ).fetchall()
+            stale = [(self.scope, media) for (media,) in rows if media not in seen]
+            self.evicted += len(stale)
+            self._conn.executemany(
+                "DELETE FROM matches WHERE scope = ? AND media = ?", stale
+            )
+            self._conn.commit()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to save match cache: {exc}")
+        finally:
+            self._conn.close()
+
+    def _keys_of(self, assets: List[Asset]) -> List[Optional[str]]:
+        return [self.fingerprints.get(id(asset)) for asset in assets]
+
+    def _delete(self, media_key: str) -> None:
+        try:
+            self._conn.execute(
+                "DELETE FROM matches WHERE scope = ? AND media = ?",
+                (self.scope, media_key),
+            )
+            self._written()
+        except sqlite3.Error as exc:
+            self._warn(f"Failed to update match cache: {exc}")
+
+    def _written(self) -> None:
+        self._pending += 1
+        if self._pending >= commit_every:
+            self._conn.commit()
+            self._pending = 0
+
+    def _warn(self, message: str) -> None:
+        if self.logger:
+            self.logger.warning(message)
+
+
+def open_match_cache(
+    assets: List[Asset], scope: Any, logger: Optional[Any] = None
+) -> Optional[MatchCache]:
+    """Open the default match cache, returning None if it cannot be used.
+
+    Args:
+        assets (List[Asset]): Assets available for matching this run.
+        scope (Any): JSON-serializable matching options the rows belong to.
+        logger (Optional[Any]): Logger instance for warnings.
+
+    Returns:
+        Optional[MatchCache]: Open cache, or None on failure.
+    """
+    try:
+        return MatchCache(assets, scope, logger=logger)
+    except (OSError, sqlite3.Error) as exc:
+        if logger:
+            logger.warning(f"Match cache unavailable, matching without it: {exc}")
+        return None
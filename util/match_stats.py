@@ -0,0 +1,182 @@
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from util.utility import get_log_dir
+
+# Upper bounds, in seconds, of the per-media matching time histogram buckets
+time_buckets = [0.0001, 0.001, 0.01, 0.1, 1.0]
+
+
+def size_bucket(size: int) -> str:
+    """Return the power-of-two histogram bucket label for a candidate count.
+
+    Args:
+        size (int): Number of candidates.
+
+    Returns:
+        str: "0", "1", "2-3", "4-7", ...
+    """
+    if size < 2:
+        return str(size)
+    low = 1 << (size.bit_length() - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+def time_bucket(seconds: float) -> str:
+    """Return the histogram bucket label for the time spent matching one media item.
+
+    Args:
+        seconds (float): Elapsed time.
+
+    Returns:
+        str: Bucket label such as "<1ms" or ">=1000ms".
+    """
+    for bound in time_buckets:
+        if seconds < bound:
+            return f"<{bound * 1000:g}ms"
+    return f">={time_buckets[-1] * 1000:g}ms"
+
+
+class MatchStats:
+    """Counters and histograms collected while matching media to assets.
+
+    Every media item is recorded once with the reason it matched (the is_match
+    criterion, ID lookup or fuzzy match; empty when unmatched), the number of
+    candidate assets it was compared against and the time it took. Counts are
+    kept per media type and reasons are also totalled across types.
+    """
+
+    def __init__(self, name: str = "match") -> None:
+        """Create empty stats.
+
+        Args:
+            name (str): Report name, used for the JSON file name.
+        """
+        self.name = name
+        self.reasons: Counter = Counter()
+        self.media_types: Dict[str, Dict[str, Any]] = {}
+
+    def media_type(self, media_type: str) -> Dict[str, Any]:
+        """Return the counters of one media type, creating them if needed."""
+        stats = self.media_types.get(media_type)
+        if stats is None:
+            stats = self.media_types[media_type] = {
+                "items": 0,
+                "matches": 0,
+                "non_matches": 0,
+                "cache_hits": 0,
+                "comparisons": 0,
+                "seconds": 0.0,
+                "reasons": Counter(),
+                "candidate_sizes": Counter(),
+                "times": Counter(),
+            }
+        return stats
+
+    def record(
+        self,
+        media_type: str,
+        reason: str,
+        candidates: int,
+        comparisons: int,
+        seconds: float,
+        cached: bool = False,
+    ) -> None:
+        """Record the outcome of matching one media item.
+
+        Args:
+            media_type (str): Media type ("movies", "series" or "collections").
+            reason (str): Match reason, empty if no asset matched.
+            candidates (int): Number of candidate assets considered.
+            comparisons (int): Number of is_match comparisons made.
+            seconds (float): Time spent on the item.
+            cached (bool): Whether the match came from the match cache.
+        """
+        stats = self.media_type(media_type)
+        stats["items"] += 1
+        if reason:
+            stats["matches"] += 1
+            stats["reasons"][reason] += 1
+            self.reasons[reason] += 1
+        else:
+            stats["non_matches"] += 1
+        stats["cache_hits"] += cached
+        stats["comparisons"] += comparisons
+        stats["seconds"] += seconds
+        stats["candidate_sizes"][size_bucket(candidates)] += 1
+        stats["times"][time_bucket(seconds)] += 1
+
+    def total(self, key: str) -> Any:
+        """Return a counter summed over all media types."""
+        return sum(stats[key] for stats in self.media_types.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the stats.
+
+        Returns:
+            Dict[str, Any]: Totals, reasons (most frequent first) and per-type stats.
+        """
+
+        def ordered(counter: Counter) -> Dict[str, int]:
+            return dict(counter.most_common())
+
+        def by_bucket(counter: Counter, key: Any) -> Dict[str, int]:
+            return {label: counter[label] for label in sorted(counter, key=key)}
+
+        def size_order(label: str) -> int:
+            return int(label.split("-")[0])
+
+        def time_order(label: str) -> float:
+            return float(label.lstrip("<>=").rstrip("ms")) + (label[0] == ">")
+
+        return {
+            "totals": {
+                key: self.total(key)
+                for key in [
+                    "items",
+                    "matches",
+                    "non_matches",
+                    "cache_hits",
+                    "comparisons",
+                    "seconds",
+                ]
+            },
+            "reasons": ordered(self.reasons),
+            "media_types": {
+                media_type: {
+                    **{
+                        key: value
+                        for key, value in stats.items()
+                        if not isinstance(value, Counter)
+                    },
+                    "reasons": ordered(stats["reasons"]),
+                    "candidate_sizes": by_bucket(stats["candidate_sizes"], size_order),
+                    "times": by_bucket(stats["times"], time_order),
+                }
+                for media_type, stats in self.media_types.items()
+            },
+        }
+
+    def write(self, module_name: str, logger: Optional[Any] = None) -> Optional[str]:
+        """Write the stats as JSON next to the module log.
+
+        Args:
+            module_name (str): Module whose log directory receives the report.
+            logger (Optional[Any]): Logger instance.
+
+        Returns:
+            Optional[str]: Path of the report, or None if it could not be written.
+        """
+        path = os.path.join(get_log_dir(module_name), f"{self.name}_stats.json")
+        try:
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+        except OSError as exc:
+            if logger:
+                logger.warning(f"Failed to write match stats to {path}: {exc}")
+            return None
+        if logger:
+            logger.debug(f"Wrote match stats to {path}")
+        return path
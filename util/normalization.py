@@ -1,6 +1,8 @@
 import html
 import os
 import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
 from unidecode import unidecode
 
@@ -13,6 +15,27 @@ from util.constants import (
     year_regex,
 )
 
+# Upper bound on cached results per normalization function
+normalize_cache_size: int = 65536
+
+common_words_lower = frozenset(word.lower() for word in common_words)
+
+non_word_regex = re.compile(r"\W+")
+
+
+def to_ascii(text: str) -> str:
+    """Unescape HTML entities and transliterate to ASCII, skipping work for plain ASCII.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        str: ASCII text.
+    """
+    if "&" in text:
+        text = html.unescape(text)
+    return text if text.isascii() else unidecode(text)
+
 
 def remove_common_words(text: str) -> str:
     """Remove complete words found in common_words (case-insensitive).
@@ -23,11 +46,9 @@ def remove_common_words(text: str) -> str:
     Returns:
         str: Text with common words removed.
     """
-    words = text.split()
-    filtered = [
-        word for word in words if word.lower() not in {w.lower() for w in common_words}
-    ]
-    return " ".join(filtered)
+    return " ".join(
+        word for word in text.split() if word.lower() not in common_words_lower
+    )
 
 
 def remove_tokens(text: str) -> str:
@@ -44,6 +65,7 @@ def remove_tokens(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=normalize_cache_size)
 def normalize_file_names(file_name: str) -> str:
     """Normalize filename for indexing.
 
@@ -64,16 +86,17 @@ def normalize_file_names(file_name: str) -> str:
         str: Normalized filename.
     """
     base, _ = os.path.splitext(file_name)
-    cleaned = unidecode(html.unescape(base))
+    cleaned = to_ascii(base)
     cleaned = id_content_regex.sub("", cleaned)
     cleaned = remove_tokens(cleaned)
     cleaned = illegal_chars_regex.sub("", cleaned)
-    cleaned = re.sub(remove_special_chars, "", cleaned)
+    cleaned = remove_special_chars.sub("", cleaned)
     cleaned = remove_common_words(cleaned)
     cleaned = cleaned.replace(" ", "").lower()
     return cleaned.strip()
 
 
+@lru_cache(maxsize=normalize_cache_size)
 def normalize_titles(title: str) -> str:
     """Normalize media title for matching and indexing.
 
@@ -93,10 +116,62 @@ def normalize_titles(title: str) -> str:
         str: Normalized title.
     """
     normalized_title = year_regex.sub("", title)
-    normalized_title = unidecode(html.unescape(normalized_title)).strip()
+    normalized_title = to_ascii(normalized_title).strip()
     normalized_title = id_content_regex.sub("", normalized_title)
     normalized_title = remove_tokens(normalized_title)
     normalized_title = illegal_chars_regex.sub("", normalized_title)
-    normalized_title = re.sub(remove_special_chars, "", normalized_title)
+    normalized_title = remove_special_chars.sub("", normalized_title)
     normalized_title = normalized_title.replace(" ", "").lower()
     return normalized_title.strip()
+
+
+@lru_cache(maxsize=normalize_cache_size)
+def loose_string(string: str) -> str:
+    """Return the string without non-alphanumeric characters, lowercased."""
+    return non_word_regex.sub("", string).lower()
+
+
+def normalize_many(titles: Iterable[str]) -> List[str]:
+    """Normalize a batch of titles, in order, through the shared cache.
+
+    Args:
+        titles (Iterable[str]): Titles to normalize.
+
+    Returns:
+        List[str]: Normalized titles.
+    """
+    return [normalize_titles(title) for title in titles]
+
+
+def normalization_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit/miss counters of the normalization caches.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Function name -> hits, misses and current size.
+    """
+    return {
+        func.__name__: {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+        }
+        for func, info in (
+            (normalize_titles, normalize_titles.cache_info()),
+            (normalize_file_names, normalize_file_names.cache_info()),
+            (loose_string, loose_string.cache_info()),
+        )
+    }
+
+
+def log_normalization_stats(logger: Optional[Any]) -> None:
+    """Log the normalization cache counters at debug level.
+
+    Args:
+        logger (Optional[Any]): Logger instance.
+    """
+    if not logger:
+        return
+    for name, stats in normalization_cache_stats().items():
+        logger.debug(
+            f"{name} cache: {stats['hits']} hits, {stats['misses']} misses, {stats['size']} cached"
+        )
@@ -0,0 +1,185 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+# Retry n waits between half and all of min(backoff_cap, backoff_base * 2**n) seconds
+backoff_base: float = 1.0
+backoff_cap: float = 30.0
+
+# Longest server-requested Retry-After that is honored, in seconds
+max_retry_after: float = 300.0
+
+
+class TokenBucket:
+    """Token bucket allowing rate requests per second with bursts of up to burst.
+
+    A caller that finds the bucket empty reserves the next token and sleeps
+    until it is due, so concurrent callers are queued in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        Create a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (Optional[int]): Bucket capacity, defaults to one second of tokens.
+        """
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, self.rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+# Process-wide state, keyed by instance URL, shared by every client of an instance
+_lock = threading.Lock()
+_buckets: Dict[str, TokenBucket] = {}
+_counts: Dict[str, Dict[str, float]] = {}
+
+
+def set_rate_limit(url: str, rate: Optional[float], burst: Optional[int] = None) -> None:
+    """
+    Limit requests to an instance. A missing or non-positive rate removes the limit.
+
+    Args:
+        url (str): Instance URL.
+        rate (Optional[float]): Requests per second.
+        burst (Optional[int]): Requests allowed back to back.
+    """
+    url = url.rstrip("/")
+    with _lock:
+        if not rate or rate <= 0:
+            _buckets.pop(url, None)
+            return
+        bucket = _buckets.get(url)
+        # Configs are loaded more than once per process; keep a matching bucket's state
+        if bucket and bucket.rate == float(rate) and bucket.burst == float(
+            burst or max(1.0, float(rate))
+        ):
+            return
+        _buckets[url] = TokenBucket(rate, burst)
+
+
+def configure_rate_limits(instances_config: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Set the limits of every instance with a rate_limit (requests per second)
+    and optional rate_burst in its settings.
+
+    Args:
+        instances_config (Dict[str, Dict[str, Any]]): The instances section of the config.
+    """
+    for instances in (instances_config or {}).values():
+        for settings in (instances or {}).values():
+            if isinstance(settings, dict) and settings.get("url"):
+                set_rate_limit(
+                    settings["url"], settings.get("rate_limit"), settings.get("rate_burst")
+                )
+
+
+def throttle(url: str) -> float:
+    """
+    Wait for the instance's rate limit, if it has one.
+
+    Args:
+        url (str): Instance URL.
+
+    Returns:
+        float: Seconds spent waiting.
+    """
+    bucket = _buckets.get(url.rstrip("/"))
+    if not bucket:
+        return 0.0
+    waited = bucket.acquire()
+    if waited:
+        _record(url, "throttled", 1)
+        _record(url, "throttle_wait", waited)
+    return waited
+
+
+def record_retry(url: str) -> None:
+    """Count a retried request against an instance."""
+    _record(url, "retries", 1)
+
+
+def pop_request_counts() -> Dict[str, Dict[str, float]]:
+    """
+    Return and reset the retry and throttle counts of every instance.
+
+    Returns:
+        Dict[str, Dict[str, float]]: retries, throttled and throttle_wait per instance URL.
+    """
+    global _counts
+    with _lock:
+        counts, _counts = _counts, {}
+    return counts
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): Header value.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt.
+
+    Args:
+        attempt (int): Zero-based number of the failed attempt.
+        retry_after (Optional[float]): Delay requested by the server.
+
+    Returns:
+        float: Delay with jitter, so clients that failed together retry apart.
+    """
+    if retry_after is not None:
+        return min(retry_after, max_retry_after) + random.uniform(0, backoff_base)
+    delay = min(backoff_cap, backoff_base * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _record(url: str, key: str, amount: float) -> None:
+    with _lock:
+        counts = _counts.setdefault(
+            url.rstrip("/"), {"retries": 0, "throttled": 0, "throttle_wait": 0.0}
+        )
+        counts[key] += amount
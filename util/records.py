@@ -0,0 +1,197 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+
+class Record(MutableMapping):
+    """Dict-compatible record that stores its known keys in __slots__.
+
+    Subclasses list their keys in __slots__. A key is present once it has been
+    assigned, so `"key" in record` behaves as it does for the dict the record
+    replaces; keys outside __slots__ are kept in a small overflow dict. Strings
+    in `interned` fields are interned, as are the strings inside lists assigned
+    to `interned_lists` fields, so titles repeated across records share one
+    object. Lists stay lists, so a record compares equal to the dict it
+    replaces. Known keys can also be read as attributes (record.title).
+    """
+
+    __slots__ = ("_extra",)
+    interned: FrozenSet[str] = frozenset()
+    interned_lists: FrozenSet[str] = frozenset()
+    _field_set: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+
+    def __init__(self, data: Optional[Iterable] = None, **kwargs: Any) -> None:
+        """
+        Build a record like dict(data, **kwargs).
+
+        Args:
+            data (Optional[Iterable]): Mapping or (key, value) pairs.
+            **kwargs (Any): Additional keys.
+        """
+        self._extra: Optional[Dict[str, Any]] = None
+        if data is not None:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._field_set:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._field_set:
+            if key in self.interned and type(value) is str:
+                value = sys.intern(value)
+            elif key in self.interned_lists and type(value) is list:
+                value = [sys.intern(v) if type(v) is str else v for v in value]
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = sum(1 for key in self.__slots__ if hasattr(self, key))
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def copy(self) -> "Record":
+        """Return a shallow copy, like dict.copy()."""
+        return type(self)(self)
+
+
+class AssetRecord(Record):
+    """Poster asset built by the scanner (movie, series or collection)."""
+
+    __slots__ = (
+        "type",
+        "title",
+        "year",
+        "tmdb_id",
+        "tvdb_id",
+        "imdb_id",
+        "normalized_title",
+        "files",
+        "season_numbers",
+        "season_mask",
+        "alternate_titles",
+        "normalized_alternate_titles",
+        "folder",
+        "media_folder",
+    )
+    interned = frozenset(
+        ["type", "title", "normalized_title", "imdb_id", "folder", "media_folder"]
+    )
+    interned_lists = frozenset(["alternate_titles", "normalized_alternate_titles"])
+
+
+class MediaRecord(Record):
+    """Movie or series parsed from Radarr/Sonarr by get_parsed_media."""
+
+    __slots__ = (
+        "title",
+        "year",
+        "media_id",
+        "tmdb_id",
+        "tvdb_id",
+        "imdb_id",
+        "monitored",
+        "status",
+        "root_folder",
+        "quality_profile",
+        "normalized_title",
+        "path_name",
+        "original_title",
+        "secondary_year",
+        "alternate_titles",
+        "normalized_alternate_titles",
+        "file_id",
+        "folder",
+        "normalized_folder",
+        "has_file",
+        "tags",
+        "seasons",
+        "season_numbers",
+        "season_mask",
+        "folder_title",
+        "folder_year",
+        "normalized_folder_title",
+    )
+    interned = frozenset(
+        [
+            "title",
+            "imdb_id",
+            "status",
+            "root_folder",
+            "normalized_title",
+            "path_name",
+            "original_title",
+            "folder",
+            "normalized_folder",
+            "folder_title",
+            "normalized_folder_title",
+        ]
+    )
+    interned_lists = frozenset(["alternate_titles", "normalized_alternate_titles"])
+
+
+def asset_records(assets: List[Dict[str, Any]]) -> List[AssetRecord]:
+    """Convert plain asset dicts (e.g. loaded from JSON) to AssetRecords.
+
+    Args:
+        assets (List[Dict[str, Any]]): Asset dictionaries.
+
+    Returns:
+        List[AssetRecord]: Equivalent records.
+    """
+    return [AssetRecord(asset) for asset in assets]
+
+
+def record_json_default(obj: Any) -> Any:
+    """json.dumps default= hook that serializes records as dicts."""
+    if isinstance(obj, Record):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
@@ -3,7 +3,8 @@ import html
 import os
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from unidecode import unidecode
 
@@ -13,32 +14,78 @@ from util.constants import (
     season_pattern,
     year_regex,
 )
+from util.catalog import AssetCatalog
 from util.construct import create_collection, create_movie, create_series
 from util.extract import extract_ids, extract_year
 from util.normalization import normalize_titles
 from util.utility import progress
 
 
-def scan_files_in_flat_folder(folder_path: str, logger: Any) -> List[Dict]:
+def scan_files_in_flat_folder(
+    folder_path: str, logger: Any, catalog: Optional[AssetCatalog] = None
+) -> List[Dict]:
     """Scan a flat directory structure (no subfolders) for media assets.
 
     Args:
       folder_path (str): Path to the folder containing files.
       logger (Any): Logger instance for progress and debugging.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged folders from.
 
     Returns:
       List[Dict]: List of parsed media asset dictionaries.
     """
+    return list(iter_files_in_flat_folder(folder_path, logger, catalog))
+
+
+def iter_files_in_flat_folder(
+    folder_path: str, logger: Any, catalog: Optional[AssetCatalog] = None
+) -> Iterator[Dict]:
+    """Yield parsed media assets of a flat directory one file group at a time.
+
+    The directory is listed and grouped up front; each group is parsed only when
+    the consumer asks for it.
+
+    Args:
+      folder_path (str): Path to the folder containing files.
+      logger (Any): Logger instance for progress and debugging.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged folders from.
+
+    Yields:
+      Dict: Parsed media asset dictionary.
+    """
+    stamp = catalog.stamp(folder_path) if catalog else None
+    if catalog:
+        cached = catalog.get_folder(folder_path, stamp)
+        if cached is not None:
+            logger.debug(f"Loaded {len(cached)} assets for {folder_path} from catalog")
+            yield from cached
+            return
     try:
-        files = os.listdir(folder_path)
+        with os.scandir(folder_path) as it:
+            entries = list(it)
     except FileNotFoundError:
-        return []
+        return
     except Exception as exc:
         logger.error(f"Unexpected error listing files in folder {folder_path}: {exc}")
-        return []
+        return
+    files = [entry.name for entry in entries]
+
+    # Groups whose files are unchanged since the last scan reuse their parsed asset
+    file_stamps: Dict[str, List[int]] = {}
+    previous_groups: Dict[Tuple[str, ...], Dict] = {}
+    previous_stamps: Dict[str, List[int]] = {}
+    if catalog:
+        file_stamps = catalog.file_stamps(entries)
+        previous_stamps, previous_assets = catalog.get_manifest(folder_path)
+        previous_groups = {
+            tuple(sorted(os.path.basename(f) for f in asset.get("files", []))): asset
+            for asset in previous_assets
+        }
+    reused = 0
 
     groups = defaultdict(list)
     normalized_map = {}
+    # Only kept when the catalog needs the folder's assets
     assets_dict = []
 
     for file in files:
@@ -72,68 +119,144 @@ def scan_files_in_flat_folder(folder_path: str, logger: Any) -> List[Dict]:
         logger=logger,
     ) as pbar:
         for base_name, files in groups.items():
-            try:
-                assets_dict.append(parse_file_group(folder_path, base_name, files))
-            except Exception as exc:
-                logger.error(
-                    f"Error parsing file group '{base_name}' in folder {folder_path}: {exc}"
-                )
-                continue
+            previous = previous_groups.get(tuple(sorted(files)))
+            if previous and all(
+                file in previous_stamps and previous_stamps[file] == file_stamps.get(file)
+                for file in files
+            ):
+                asset = previous
+                reused += 1
+            else:
+                try:
+                    asset = parse_file_group(folder_path, base_name, files)
+                except Exception as exc:
+                    logger.error(
+                        f"Error parsing file group '{base_name}' in folder {folder_path}: {exc}"
+                    )
+                    continue
+            if catalog:
+                assets_dict.append(asset)
+            yield asset
             pbar.update(1)
 
-    return assets_dict
+    if catalog:
+        catalog.put_folder(folder_path, stamp, assets_dict, file_stamps)
+        catalog.count_reused(reused)
 
 
-def scan_files_in_nested_folders(folder_path: str, logger: Any) -> Optional[List[Dict]]:
+def scan_files_in_nested_folders(
+    folder_path: str,
+    logger: Any,
+    catalog: Optional[AssetCatalog] = None,
+    workers: int = 1,
+) -> Optional[List[Dict]]:
     """Scan a directory with subfolders representing grouped assets (e.g., per movie/series).
 
     Args:
       folder_path (str): Path to the base folder.
       logger (Any): Logger instance.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged subfolders from.
+      workers (int): Number of threads used to scan subfolders.
 
     Returns:
       Optional[List[Dict]]: List of parsed asset dictionaries from subfolders, or None on error.
     """
-    assets_dict = []
     try:
-        entries = list(os.scandir(folder_path))
-        progress_bar = progress(
-            entries,
+        entries = _list_asset_folders(folder_path)
+    except Exception as exc:
+        logger.error(f"Error scanning folder {folder_path}: {exc}")
+        return None
+    return list(iter_nested_folders(entries, logger, catalog, workers))
+
+
+def iter_nested_folders(
+    entries: List[os.DirEntry],
+    logger: Any,
+    catalog: Optional[AssetCatalog] = None,
+    workers: int = 1,
+) -> Iterator[Dict]:
+    """Yield parsed assets of the given asset subfolders in listing order.
+
+    With more than one worker, subfolders are listed and parsed on a thread pool;
+    results are still yielded in listing order.
+
+    Args:
+      entries (List[os.DirEntry]): Asset subfolders, as returned by _list_asset_folders.
+      logger (Any): Logger instance.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged subfolders from.
+      workers (int): Number of threads used to scan subfolders.
+
+    Yields:
+      Dict: Parsed asset dictionary.
+    """
+
+    def scan(dir_entry: os.DirEntry) -> List[Dict]:
+        return _scan_asset_folder(dir_entry.path, logger, catalog)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = executor.map(scan, entries) if workers > 1 else map(scan, entries)
+        with progress(
+            results,
             desc="Processing posters",
             total=len(entries),
             unit="folder",
             logger=logger,
-        )
+        ) as progress_bar:
+            for folder_assets in progress_bar:
+                yield from folder_assets
 
-        for dir_entry in progress_bar:
-            if (
-                not dir_entry.is_dir()
-                or dir_entry.name.startswith(".")
-                or dir_entry.name == "tmp"
-            ):
-                continue
-            base_name = os.path.basename(dir_entry.path)
-            try:
-                files = [f.name for f in os.scandir(dir_entry.path) if f.is_file()]
-            except Exception as exc:
-                logger.error(
-                    f"Failed to scan nested folder: {dir_entry.path} | Exception: {exc}"
-                )
-                continue
-            if not files:
-                logger.debug(f"Skipping empty folder: {dir_entry.path}")
-                continue
-            try:
-                assets_dict.append(parse_folder_group(dir_entry.path, base_name, files))
-            except Exception as exc:
-                logger.error(
-                    f"Failed to parse folder group: {dir_entry.path} | Exception: {exc}"
-                )
-                continue
+
+def _list_asset_folders(folder_path: str) -> List[os.DirEntry]:
+    """Return the visible asset subfolders of a nested source directory."""
+    with os.scandir(folder_path) as it:
+        return [
+            dir_entry
+            for dir_entry in it
+            if dir_entry.is_dir()
+            and not dir_entry.name.startswith(".")
+            and dir_entry.name != "tmp"
+        ]
+
+
+def _scan_asset_folder(
+    path: str, logger: Any, catalog: Optional[AssetCatalog] = None
+) -> List[Dict]:
+    """List and parse a single asset folder, or load it from the catalog if unchanged.
+
+    Args:
+      path (str): Path to the asset folder.
+      logger (Any): Logger instance.
+      catalog (Optional[AssetCatalog]): Asset catalog to load the folder from.
+
+    Returns:
+      List[Dict]: The folder's asset, or an empty list if it is empty or unreadable.
+    """
+    stamp = catalog.stamp(path) if catalog else None
+    if catalog:
+        cached = catalog.get_folder(path, stamp)
+        if cached is not None:
+            return cached
+    try:
+        with os.scandir(path) as it:
+            file_entries = [f for f in it if f.is_file()]
     except Exception as exc:
-        logger.error(f"Error scanning folder {folder_path}: {exc}")
-        return None
-    return assets_dict
+        logger.error(f"Failed to scan nested folder: {path} | Exception: {exc}")
+        return []
+    files = [f.name for f in file_entries]
+    file_stamps = catalog.file_stamps(file_entries) if catalog else {}
+    if not files:
+        logger.debug(f"Skipping empty folder: {path}")
+        if catalog:
+            catalog.put_folder(path, stamp, [])
+        return []
+    try:
+        asset = parse_folder_group(path, os.path.basename(path), files)
+    except Exception as exc:
+        logger.error(f"Failed to parse folder group: {path} | Exception: {exc}")
+        return []
+    if catalog:
+        catalog.put_folder(path, stamp, [asset], file_stamps)
+    return [asset]
 
 
 def parse_folder_group(folder_path: str, base_name: str, files: List[str]) -> Dict:
@@ -264,41 +387,74 @@ def parse_file_group(folder_path: str, base_name: str, files: List[str]) -> Dict
         )
 
 
-def process_files(folder_path: str, logger: Any) -> Optional[List[Dict]]:
+def process_files(
+    folder_path: str,
+    logger: Any,
+    catalog: Optional[AssetCatalog] = None,
+    workers: int = 1,
+) -> Optional[List[Dict]]:
     """Determine folder structure and route to the appropriate scanning logic.
 
     Args:
       folder_path (str): Path to the folder to scan.
       logger (Any): Logger instance.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged folders from.
+      workers (int): Number of threads used to scan asset subfolders.
 
     Returns:
       Optional[List[Dict]]: List of structured asset dictionaries, or None on failure.
     """
+    return list(iter_assets(folder_path, logger, catalog, workers)) or None
+
+
+def iter_assets(
+    folder_path: str,
+    logger: Any,
+    catalog: Optional[AssetCatalog] = None,
+    workers: int = 1,
+) -> Iterator[Dict]:
+    """Yield the structured assets of a source folder as they are parsed.
+
+    Streaming counterpart of process_files: nothing is accumulated, so callers
+    can consume a folder without holding all of its assets at once.
+
+    Args:
+      folder_path (str): Path to the folder to scan.
+      logger (Any): Logger instance.
+      catalog (Optional[AssetCatalog]): Asset catalog to load unchanged folders from.
+      workers (int): Number of threads used to scan asset subfolders.
+
+    Yields:
+      Dict: Structured asset dictionary.
+    """
     asset_folders = _is_asset_folders(folder_path, logger)
     logger.debug(f"Folder Path: {folder_path} | Asset Folder: {asset_folders}")
     start_time = datetime.datetime.now()
 
     if not asset_folders:
-        assets_dict = scan_files_in_flat_folder(folder_path, logger)
+        assets = iter_files_in_flat_folder(folder_path, logger, catalog)
     else:
-        assets_dict = scan_files_in_nested_folders(folder_path, logger)
+        try:
+            entries = _list_asset_folders(folder_path)
+        except Exception as exc:
+            logger.error(f"Error scanning folder {folder_path}: {exc}")
+            return
+        assets = iter_nested_folders(entries, logger, catalog, workers)
+
+    item_count = 0
+    for asset in assets:
+        item_count += len(asset.get("files", []))
+        yield asset
 
     end_time = datetime.datetime.now()
-    if assets_dict:
+    if item_count:
         elapsed_time = (end_time - start_time).total_seconds()
-        item_count = (
-            sum(len(asset.get("files", [])) for asset in assets_dict)
-            if assets_dict
-            else 0
-        )
         items_per_second = item_count / elapsed_time if elapsed_time > 0 else 0
         if logger:
             logger.info(
                 f"Processed {item_count} files in {elapsed_time:.2f} seconds ({items_per_second:.2f} items/s) "
                 f"in folder '{os.path.basename(folder_path.rstrip('/'))}'"
             )
-        return assets_dict
-    return None
 
 
 def _is_asset_folders(folder_path: str, logger: Any) -> bool:
@@ -11,12 +11,15 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 from plexapi.exceptions import NotFound
+from plexapi.server import PlexServer
 from tqdm import tqdm
 from unidecode import unidecode
 
+from util.arrpy import fetch_parsed_media
 from util.constants import illegal_chars_regex
-from util.construct import generate_title_variants
+from util.construct import generate_title_variants, prepare_media
 from util.normalization import normalize_titles
+from util.records import record_json_default
 
 
 def print_json(data: Any, logger: Any, module_name: str, type_: str) -> None:
@@ -38,7 +41,7 @@ def print_json(data: Any, logger: Any, module_name: str, type_: str) -> None:
 
     assets_file = debug_dir / f"{type_}.json"
     with open(assets_file, "w") as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, default=record_json_default)
     logger.debug(f"Wrote {type_} to {assets_file}")
 
 
@@ -232,19 +235,21 @@ def get_plex_data(
                         alternate_titles = generate_title_variants(title_unescaped)
                         folder = illegal_chars_regex.sub("", title_unescaped)
                         plex_list.append(
-                            {
-                                "title": title_unescaped,
-                                "normalized_title": normalized_title,
-                                "location": library_name,
-                                "year": None,
-                                "folder": folder,
-                                "alternate_titles": alternate_titles[
-                                    "alternate_titles"
-                                ],
-                                "normalized_alternate_titles": alternate_titles[
-                                    "normalized_alternate_titles"
-                                ],
-                            }
+                            prepare_media(
+                                {
+                                    "title": title_unescaped,
+                                    "normalized_title": normalized_title,
+                                    "location": library_name,
+                                    "year": None,
+                                    "folder": folder,
+                                    "alternate_titles": alternate_titles[
+                                        "alternate_titles"
+                                    ],
+                                    "normalized_alternate_titles": alternate_titles[
+                                        "normalized_alternate_titles"
+                                    ],
+                                }
+                            )
                         )
                 end_time = datetime.datetime.now()
                 elapsed = (end_time - start_time).total_seconds()
@@ -256,6 +261,90 @@ def get_plex_data(
     return plex_list
 
 
+def get_media_dict(
+    config: SimpleNamespace, logger: Any
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch Radarr movies, Sonarr series and Plex collections for a module.
+
+    Radarr and Sonarr instances are fetched concurrently, one request per instance.
+
+    Args:
+        config (SimpleNamespace): Module configuration with instances and instances_config.
+        logger (Any): Logger instance.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Parsed media keyed by "movies", "series"
+            and "collections".
+    """
+    media_dict: Dict[str, List[Dict[str, Any]]] = {
+        "movies": [],
+        "series": [],
+        "collections": [],
+    }
+    arr_instances = []
+    for instance in config.instances:
+        if isinstance(instance, dict):
+            instance_name, instance_settings = next(iter(instance.items()))
+        else:
+            instance_name = instance
+            instance_settings = {}
+        found = False
+        for instance_type, instance_data in config.instances_config.items():
+            if instance_name in instance_data:
+                found = True
+                break
+        if not found:
+            logger.warning(
+                f"Instance '{instance_name}' not found in config.instances_config. Skipping."
+            )
+            continue
+        url = instance_data[instance_name]["url"]
+        api = instance_data[instance_name]["api"]
+        if instance_type != "plex":
+            arr_instances.append((instance_name, instance_type, url, api))
+            continue
+        try:
+            app = PlexServer(url, api)
+        except Exception as e:
+            logger.error(f"Error connecting to Plex: {e}")
+            continue
+        library_names = instance_settings.get("library_names", [])
+        if library_names:
+            logger.info("Fetching Plex collections...")
+            results = get_plex_data(
+                app,
+                library_names,
+                logger,
+                include_smart=True,
+                collections_only=True,
+            )
+            media_dict["collections"].extend(results)
+        else:
+            logger.warning(
+                f"No library names specified for Plex instance '{instance_name}'. Skipping."
+            )
+
+    fetched = fetch_parsed_media(
+        [(url, api) for _, _, url, api in arr_instances],
+        logger,
+        http_cache=getattr(config, "http_cache", False),
+    )
+    for (instance_name, instance_type, _, _), (app, results) in zip(
+        arr_instances, fetched
+    ):
+        if not app:
+            logger.error(f"Failed to connect to {instance_name}, skipping.")
+            continue
+        if results:
+            if instance_type == "radarr":
+                media_dict["movies"].extend(results)
+            elif instance_type == "sonarr":
+                media_dict["series"].extend(results)
+        elif results is not None:
+            logger.error(f"No {instance_type.capitalize()} data found.")
+    return media_dict
+
+
 def create_bar(middle_text: str) -> str:
     """Create a separation bar with text centered.
 
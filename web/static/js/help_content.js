@@ -55,14 +55,43 @@ export const HELP_CONTENT = {
                 'Incremental Border Replacerr: Border replacerr will only run on posters that have been renamed.',
                 'Instances: List the Radarr/Sonarr instances you wish to use as source for renaming of posters,',
                 'Plex is used for collections only and not as a source for Movies/TV Shows.',
+                'Fuzzy Match Threshold: Similarity (0-100) for matching near-miss titles when no exact match is found. 0 disables fuzzy matching; around 80 is a reasonable starting point. The year must still match.',
+                'Asset Catalog: Cache scanned posters on disk and only rescan folders that changed since the last run.',
+                'Scan Workers: Number of threads used to scan source directories. Values above 1 speed up scans on network storage.',
+                'ARR Concurrency: Radarr/Sonarr instances are fetched at the same time; this is the most requests sent to any one instance at once.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
+                'Hash Join Matching: Match titles through lookup tables built once over all posters instead of comparing every candidate. Results are the same; large libraries match much faster.',
+                'Match Workers: Number of processes used to match posters to media. Values above 1 use more CPU cores on large libraries; results are the same.',
+                'Match Cache: Remember which poster each media item matched and reuse it on the next run while neither has changed.',
             ],
             poster_cleanarr: [
                 'Ignore Media: List of media to ignore during cleaning of posters from your assets directory.',
                 'Source Dirs: Folders to scan for posters to clean, typically your Kometa assets directory.',
+                'Asset Catalog: Cache scanned posters on disk and only rescan folders that changed since the last run.',
+                'Scan Workers: Number of threads used to scan source directories. Values above 1 speed up scans on network storage.',
+                'ARR Concurrency: Radarr/Sonarr instances are fetched at the same time; this is the most requests sent to any one instance at once.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
+                'Hash Join Matching: Match titles through lookup tables built once over all posters instead of comparing every candidate. Results are the same; large libraries match much faster.',
+                'Match Workers: Number of processes used to match posters to media. Values above 1 use more CPU cores on large libraries; results are the same.',
+                'Match Cache: Remember which poster each media item matched and reuse it on the next run while neither has changed.',
             ],
             unmatched_assets: [
                 'Finds assets/posters not matched to any item in your media library.',
                 'source_dirs: Folders to search for unmatched assets. Typically your assets directory.',
+                'Asset Catalog: Cache scanned posters on disk and only rescan folders that changed since the last run.',
+                'Scan Workers: Number of threads used to scan source directories. Values above 1 speed up scans on network storage.',
+                'ARR Concurrency: Radarr/Sonarr instances are fetched at the same time; this is the most requests sent to any one instance at once.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
+            ],
+            poster_pipeline: [
+                'Runs unmatched_assets, poster_renamerr and poster_cleanarr as one job, fetching media and scanning posters only once.',
+                'Run Unmatched Assets / Run Poster Renamerr / Run Poster Cleanarr: Stages to run, in that order.',
+                'source_dirs and Instances: Shared by every stage and used instead of the ones set on each module.',
+                'All other settings (destination dir, dry run, ignore lists, matching options) are taken from each module\'s own settings.',
+                'Asset Catalog: Cache scanned posters on disk and only rescan folders that changed since the last run.',
+                'Scan Workers: Number of threads used to scan source directories. Values above 1 speed up scans on network storage.',
+                'ARR Concurrency: Radarr/Sonarr instances are fetched at the same time; this is the most requests sent to any one instance at once.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
             ],
             border_replacerr: [
                 'Adds or replaces borders on posters. Supports holiday presets and custom colors.',
@@ -73,6 +102,8 @@ export const HELP_CONTENT = {
                 'holiday_name: Label for this border/holiday.',
                 "schedule: When this border should be active (see 'schedule' help).",
                 'destination_dir: Output directory for processed posters.',
+                'Asset Catalog: Cache scanned posters on disk and only rescan folders that changed since the last run.',
+                'Scan Workers: Number of threads used to scan source directories. Values above 1 speed up scans on network storage.',
             ],
             health_checkarr: [
                 'Scans for media deleted from TMDB/TVDB and removes them from Sonarr/Radarr.',
@@ -85,6 +116,7 @@ export const HELP_CONTENT = {
                 'app_instance: Name of the Radarr/Sonarr config instance.',
                 'labels: Comma-separated list of tags to sync.',
                 'plex_instances: List of Plex servers/libraries to sync with.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
             ],
             upgradinatorr: [
                 'Automatically triggers upgrades/searches to maximize quality in Radarr/Sonarr.',
@@ -94,6 +126,7 @@ export const HELP_CONTENT = {
                 'ignore_tag: Do not upgrade media with this tag.',
                 'unattended: If true, skip confirmation.',
                 'season_monitored_threshold: Minimum monitored percentage per season (Sonarr only).',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
             ],
             renameinatorr: [
                 'Triggers Radarr/Sonarr rename jobs.',
@@ -102,6 +135,7 @@ export const HELP_CONTENT = {
                 'Radarr Count: The maximum number of renames to perform in Radarr.',
                 'Sonarr Count: The maximum number of renames to perform in Sonarr.',
                 'instance: Server to run renames on.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
             ],
             nohl: [
                 'Scans for non-hardlinked files and can auto-resolve them.',
@@ -109,6 +143,8 @@ export const HELP_CONTENT = {
                 'mode (per folder):',
                 '  • Resolve: Delete+search to restore missing hardlinks automatically.',
                 '  • Scan: Only log/report non-hardlinked files, do not resolve.',
+                'ARR Concurrency: Radarr/Sonarr instances are fetched at the same time; this is the most requests sent to any one instance at once.',
+                'HTTP Cache: Keep Radarr/Sonarr library responses on disk for a few minutes and revalidate them with the server instead of downloading them again on every run.',
             ],
             jduparr: [
                 'Runs jdupes to find/remove duplicate files.',
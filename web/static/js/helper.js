@@ -6,6 +6,7 @@ export const moduleOrder = [
     'poster_renamerr',
     'poster_cleanarr',
     'unmatched_assets',
+    'poster_pipeline',
     'border_replacerr',
     'renameinatorr',
     'upgradinatorr',
@@ -63,6 +63,8 @@ export async function loadInstances() {
 function createEntry(service, name, settings, isNew = false) {
     const card = document.createElement('div');
     card.className = 'card';
+    // Keep settings edited only in the config file (e.g. rate_limit) across saves
+    card.dataset.settings = JSON.stringify(settings || {});
 
     const field = document.createElement('div');
     field.className = 'field';
@@ -92,6 +92,7 @@ export async function buildInstancesPayload() {
             const api = field.querySelector('input[name$="__api"]')?.value.trim();
             if (name)
                 out[svc][name] = {
+                    ...JSON.parse(card.dataset.settings || '{}'),
                     url,
                     api,
                 };
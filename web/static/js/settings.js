@@ -10,6 +10,7 @@ import { renderHealthCheckarrSettings } from './settings/modules/health_checkarr
 import { renderPosterCleanarrSettings } from './settings/modules/poster_cleanarr.js';
 import { renderRenameinatorrSettings } from './settings/modules/renameinatorr.js';
 import { renderUnmatchedAssetsSettings } from './settings/modules/unmatched_assets.js';
+import { renderPosterPipelineSettings } from './settings/modules/poster_pipeline.js';
 import { buildSettingsPayload } from './payload.js';
 import { renderMain } from './settings/modules/main.js';
 import { DAPS } from './common.js';
@@ -28,6 +29,7 @@ const MODULE_RENDERERS = {
     poster_cleanarr: renderPosterCleanarrSettings,
     renameinatorr: renderRenameinatorrSettings,
     unmatched_assets: renderUnmatchedAssetsSettings,
+    poster_pipeline: renderPosterPipelineSettings,
     main: renderMain,
 };
 
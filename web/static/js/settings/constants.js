@@ -10,10 +10,17 @@ export const BOOL_FIELDS = [
     'asset_folders',
     'print_only_renames',
     'incremental_border_replacerr',
+    'asset_catalog',
+    'hash_join_matching',
+    'match_cache',
+    'http_cache',
     'silent',
     'disable_batching',
     'replace_border',
     'update_notifications',
+    'run_unmatched_assets',
+    'run_poster_renamerr',
+    'run_poster_cleanarr',
 ];
 
 export const TEXT_FIELDS = [
@@ -43,6 +50,10 @@ export const INT_FIELDS = [
     'sonarr_count',
     'season_monitored_threshold',
     'border_width',
+    'fuzzy_match_threshold',
+    'scan_workers',
+    'match_workers',
+    'arr_concurrency',
     'searches',
 ];
 
@@ -83,13 +94,15 @@ export const ARR_AND_PLEX_INSTANCES = [
     'nohl',
     'unmatched_assets',
     'poster_cleanarr',
+    'poster_pipeline',
     'health_checkarr',
     'renameinatorr',
 ];
 export const SHOW_PLEX_IN_INSTANCE_FIELD = [
     'poster_renamerr',
     'unmatched_assets',
-    'poster_cleanarr'
+    'poster_cleanarr',
+    'poster_pipeline',
 ];
 
 export const DRAG_AND_DROP = {
@@ -99,6 +112,7 @@ export const DRAG_AND_DROP = {
 export const LIST_FIELD = {
     unmatched_assets: ['source_dirs'],
     poster_cleanarr: ['source_dirs'],
+    poster_pipeline: ['source_dirs'],
     nohl: ['source_dirs'],
 };
 